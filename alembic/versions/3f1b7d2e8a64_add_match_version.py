@@ -0,0 +1,32 @@
+"""add match version
+
+Revision ID: 3f1b7d2e8a64
+Revises: 7a3e5b9d2c10
+Create Date: 2026-10-16 18:12:09.338172
+
+matches.version is the optimistic concurrency token served as the ETag of
+the match routes. Existing rows start at version 1.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1b7d2e8a64'
+down_revision: Union[str, Sequence[str], None] = '7a3e5b9d2c10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant server default makes ADD COLUMN a metadata-only change on Postgres 11+.
+    op.add_column('matches', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('matches', 'version')
@@ -0,0 +1,51 @@
+"""add match keyset pagination indexes
+
+Revision ID: 5e2a9c81f3d6
+Revises: b41d7e0c9a2f
+Create Date: 2026-10-16 15:21:08.334172
+
+Cursor pages of a user's matches with no status filter are ordered by id
+within one participant column; (creator_id, id) and (opponent_id, id) let
+each side be read in index order instead of sorting the user's whole
+history. Built concurrently, like b41d7e0c9a2f.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a9c81f3d6'
+down_revision: Union[str, Sequence[str], None] = 'b41d7e0c9a2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_matches_creator_id_id', 'matches', ['creator_id', 'id']),
+    ('ix_matches_opponent_id_id', 'matches', ['opponent_id', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,61 @@
+"""store refresh token digests with a unique index
+
+Revision ID: 63ee8e75b975
+Revises: ea4c46d692f0
+Create Date: 2026-10-16 09:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '63ee8e75b975'
+down_revision: Union[str, Sequence[str], None] = 'ea4c46d692f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('refresh_tokens'):
+        # The table was introduced with the model but never given a revision.
+        op.create_table('refresh_tokens',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('revoked_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    else:
+        # Existing rows hold the raw refresh JWT; replace it with its SHA-256 hex digest,
+        # matching core.security.hash_token. Digests are exactly 64 characters long.
+        op.execute(
+            "UPDATE refresh_tokens "
+            "SET token_hash = encode(sha256(convert_to(token_hash, 'UTF8')), 'hex') "
+            "WHERE length(token_hash) <> 64"
+        )
+        op.alter_column('refresh_tokens', 'token_hash',
+               existing_type=sa.String(),
+               type_=sa.String(length=64),
+               existing_nullable=False)
+    op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Digests are one-way, so stored tokens stay hashed; clients must log in again.
+    """
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.alter_column('refresh_tokens', 'token_hash',
+               existing_type=sa.String(length=64),
+               type_=sa.String(),
+               existing_nullable=False)
@@ -0,0 +1,37 @@
+"""add SUBMITTED match status
+
+Revision ID: 7a3e5b9d2c10
+Revises: d8c4f6a1e295
+Create Date: 2026-10-16 18:05:14.772019
+
+Matches now move PENDING -> SUBMITTED -> APPROVED/DECLINED (or CANCELLED)
+through conditional updates in MatchesDbService. ALTER TYPE ... ADD VALUE
+cannot be used in the transaction that adds it, so it runs in an autocommit
+block.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3e5b9d2c10'
+down_revision: Union[str, Sequence[str], None] = 'd8c4f6a1e295'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE matchstatus ADD VALUE IF NOT EXISTS 'SUBMITTED' AFTER 'PENDING'")
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Postgres cannot drop an enum value; submitted matches go back to PENDING
+    and the unused label stays on the type.
+    """
+    op.execute("UPDATE matches SET status = 'PENDING' WHERE status = 'SUBMITTED'")
@@ -0,0 +1,57 @@
+"""add foreign key and query path indexes
+
+Revision ID: b41d7e0c9a2f
+Revises: 63ee8e75b975
+Create Date: 2026-10-16 14:03:27.918440
+
+Indexes are built with CREATE INDEX CONCURRENTLY so the migration can run
+against a live database without blocking writes. CONCURRENTLY cannot run
+inside a transaction, so the statements are issued from an autocommit block.
+If a concurrent build fails it leaves an INVALID index behind; drop it and
+re-run the upgrade.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41d7e0c9a2f'
+down_revision: Union[str, Sequence[str], None] = '63ee8e75b975'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_matches_creator_id_status_id', 'matches', ['creator_id', 'status', 'id']),
+    ('ix_matches_opponent_id_status_id', 'matches', ['opponent_id', 'status', 'id']),
+    ('ix_games_match_id_id', 'games', ['match_id', 'id']),
+    ('ix_games_winner_user_id', 'games', ['winner_user_id']),
+    ('ix_games_loser_user_id', 'games', ['loser_user_id']),
+    ('ix_approvals_approver_user_id', 'approvals', ['approver_user_id']),
+    ('ix_refresh_tokens_user_id', 'refresh_tokens', ['user_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,47 @@
+"""add ratings leaderboard index
+
+Revision ID: c7e9a1b3d5f2
+Revises: 8d0f2a4b6c31
+Create Date: 2026-10-17 11:26:05.734190
+
+Serves the leaderboard loads (top ratings per game type) and the rank of
+players below the in-memory board. Built CONCURRENTLY from an autocommit
+block so it can run against a live database.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e9a1b3d5f2"
+down_revision: Union[str, Sequence[str], None] = "8d0f2a4b6c31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_ratings_game_type_rating_user_id",
+            "ratings",
+            ["game_type", sa.text("rating DESC"), "user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_ratings_game_type_rating_user_id",
+            table_name="ratings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
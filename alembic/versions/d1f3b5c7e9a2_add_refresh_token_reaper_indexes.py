@@ -0,0 +1,54 @@
+"""add refresh token reaper indexes
+
+Revision ID: d1f3b5c7e9a2
+Revises: a3c5e7f9b1d2
+Create Date: 2026-10-17 18:12:44.503917
+
+Each batch of `purge_expired_refresh_tokens` picks rows by
+`expires_at <= now OR revoked_at <= cutoff`; without these indexes every
+batch was a full scan of refresh_tokens. `revoked_at` is indexed only where
+it is set, so live tokens do not grow it. Built CONCURRENTLY from an
+autocommit block, as in b41d7e0c9a2f.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f3b5c7e9a2'
+down_revision: Union[str, Sequence[str], None] = 'a3c5e7f9b1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_refresh_tokens_expires_at', 'refresh_tokens', ['expires_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_refresh_tokens_revoked_at', 'refresh_tokens', ['revoked_at'],
+            unique=False,
+            postgresql_where=sa.text('revoked_at IS NOT NULL'),
+            sqlite_where=sa.text('revoked_at IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in ('ix_refresh_tokens_revoked_at', 'ix_refresh_tokens_expires_at'):
+            op.drop_index(
+                name, table_name='refresh_tokens',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
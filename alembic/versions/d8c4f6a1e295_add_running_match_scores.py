@@ -0,0 +1,44 @@
+"""add running match scores
+
+Revision ID: d8c4f6a1e295
+Revises: 5e2a9c81f3d6
+Create Date: 2026-10-16 16:47:52.601937
+
+matches.creator_score / opponent_score hold the racks won by each side and
+are maintained incrementally by MatchesDbService. Existing matches are
+backfilled from their games.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8c4f6a1e295'
+down_revision: Union[str, Sequence[str], None] = '5e2a9c81f3d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant server default makes ADD COLUMN a metadata-only change on Postgres 11+.
+    op.add_column('matches', sa.Column('creator_score', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('matches', sa.Column('opponent_score', sa.Integer(), server_default='0', nullable=False))
+    # Backfill only matches that have games; served by ix_games_match_id_id.
+    op.execute(
+        "UPDATE matches SET "
+        "creator_score = (SELECT count(*) FROM games "
+        "WHERE games.match_id = matches.id AND games.winner_user_id = matches.creator_id), "
+        "opponent_score = (SELECT count(*) FROM games "
+        "WHERE games.match_id = matches.id AND games.winner_user_id = matches.opponent_id) "
+        "WHERE EXISTS (SELECT 1 FROM games WHERE games.match_id = matches.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('matches', 'opponent_score')
+    op.drop_column('matches', 'creator_score')
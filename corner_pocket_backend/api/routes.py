@@ -1,7 +1,8 @@
 from fastapi import APIRouter
-from .v1 import auth, matches, stats
+from .v1 import auth, matches, stats, sync
 
 router = APIRouter()
 router.include_router(auth.router, tags=["auth"])  # Authentication & user session endpoints
 router.include_router(matches.router, tags=["matches"])  # Match lifecycle APIs
 router.include_router(stats.router, tags=["stats"])  # Stats and summaries
+router.include_router(sync.router, tags=["sync"])  # Change feed for offline-first clients
@@ -1,15 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
 from corner_pocket_backend.core.security import (
-    get_current_user,
+    current_user,
     create_access_token,
     create_refresh_token,
+    hash_token,
+    verify_token,
 )
-from corner_pocket_backend.core.password import get_password_hash
+from corner_pocket_backend.core.password import password_pool
 from corner_pocket_backend.models.users import User
 from corner_pocket_backend.services.users import UsersDbService
-from corner_pocket_backend.services.security import SecurityDbService
+from corner_pocket_backend.services.security import (
+    RefreshTokenError,
+    RefreshTokenReuseError,
+    SecurityDbService,
+)
 from corner_pocket_backend.core.db import get_db
 from datetime import datetime
 from typing import Any
@@ -44,63 +51,74 @@ class RefreshIn(BaseModel):
     refresh_token: str
 
 
+def _issue_tokens(db: Session, user_id: int) -> dict[str, Any]:
+    """Create an access/refresh token pair, persist the refresh token and commit."""
+    token = create_access_token({"sub": str(user_id)})
+    refresh_token = create_refresh_token({"sub": str(user_id)})
+    SecurityDbService(db).store_refresh_token(user_id=user_id, token_hash=hash_token(refresh_token))
+    db.commit()
+    return {
+        "user_id": user_id,
+        "access_token": token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+    }
+
+
 @router.post("/auth/register")
-def register(data: RegisterIn, db: Session = Depends(get_db)) -> dict[str, Any]:
+async def register(data: RegisterIn, db: Session = Depends(get_db)) -> dict[str, Any]:
     """Create a new user account.
 
     Accepts basic registration fields and delegates to UsersService to
     create the user record. Returns a simple success payload on completion.
+    The password is hashed on the bounded hashing pool; database work runs
+    in the threadpool.
     """
-    try:
-        password_hash = get_password_hash(data.password)
+    password_hash = await password_pool.hash(data.password)
+
+    def create_user() -> dict[str, Any]:
         user = UsersDbService(db).create(
             email=data.email,
             handle=data.handle,
             display_name=data.display_name,
             password_hash=password_hash,
         )
-        token = create_access_token({"sub": str(user.id)})
-        refresh_token = create_refresh_token({"sub": str(user.id)})
-        security_db_service = SecurityDbService(db)
-        security_db_service.store_refresh_token(user_id=user.id, token_hash=refresh_token)
+        return _issue_tokens(db, user.id)
 
+    try:
+        issued = await run_in_threadpool(create_user)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    return {
-        "ok": True,
-        "user_id": user.id,
-        "access_token": token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer",
-    }
+    return {"ok": True, **issued}
 
 
 @router.post("/auth/refresh")
 def refresh(data: RefreshIn, db: Session = Depends(get_db)) -> dict[str, Any]:
     """Refresh a JWT access token.
 
-    Verifies a refresh token and issues a new access token.
+    Verifies a refresh token and issues a new access token. The refresh token
+    is rotated atomically: it is revoked and replaced in one transaction, and
+    presenting an already-rotated token revokes all of the user's sessions.
     """
-
     try:
-        security_db_service = SecurityDbService(db)
-        refresh_token = security_db_service.get_refresh_token(data.refresh_token)
-        if not refresh_token:
-            raise HTTPException(status_code=401, detail="Invalid refresh token")
-        if not security_db_service.verify_refresh_token(refresh_token.token_hash):
-            raise HTTPException(status_code=401, detail="Invalid refresh token")
-    except HTTPException as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        claims = verify_token(data.refresh_token, token_type="refresh", use_cache=False)
+        user_id = int(claims["sub"])
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
 
-    token = create_access_token({"sub": str(refresh_token.user_id)})
-    # remove refresh_token
-    security_db_service.delete_refresh_token(refresh_token.token_hash)
-    # create new refresh_token
-    new_refresh_token = create_refresh_token({"sub": str(refresh_token.user_id)})
-    security_db_service.store_refresh_token(
-        user_id=refresh_token.user_id, token_hash=new_refresh_token
-    )
+    token = create_access_token({"sub": str(user_id)})
+    new_refresh_token = create_refresh_token({"sub": str(user_id)})
+    try:
+        SecurityDbService(db).rotate_refresh_token(
+            token_hash=hash_token(data.refresh_token),
+            new_token_hash=hash_token(new_refresh_token),
+            user_id=user_id,
+        )
+    except RefreshTokenReuseError:
+        raise HTTPException(status_code=401, detail="Refresh token reuse detected")
+    except RefreshTokenError:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
 
     return {
         "ok": True,
@@ -111,39 +129,29 @@ def refresh(data: RefreshIn, db: Session = Depends(get_db)) -> dict[str, Any]:
 
 
 @router.post("/auth/login")
-def login(data: LoginIn, db: Session = Depends(get_db)) -> dict[str, Any]:
+async def login(data: LoginIn, db: Session = Depends(get_db)) -> dict[str, Any]:
     """Authenticate a user and issue a JWT access token.
 
     Verifies email/password, then returns a bearer token encoded with the
     user's id as the subject ("sub"). The token is used for protected APIs.
+    Verification runs on the bounded hashing pool rather than a request thread.
     """
-    try:
-        user = UsersDbService(db).authenticate(email=data.email, password=data.password)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    if not user:
+    user = await run_in_threadpool(UsersDbService(db).get_by_email, data.email)
+    if not user or not user.password_hash:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    if not await password_pool.verify(data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    token = create_access_token({"sub": str(user.id)})
-    refresh_token = create_refresh_token({"sub": str(user.id)})
-
-    security_db_service = SecurityDbService(db)
-    security_db_service.store_refresh_token(user_id=user.id, token_hash=refresh_token)
-
-    return {
-        "user_id": user.id,
-        "access_token": token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer",
-    }
+    return await run_in_threadpool(_issue_tokens, db, user.id)
 
 
 @router.get("/auth/me", response_model=UserOut)
-def me(user: User = Depends(get_current_user)) -> UserOut:
+async def me(user: User = Depends(current_user)) -> UserOut:
     """Return the authenticated user's profile.
 
-    Uses the get_current_user dependency to validate the bearer token and
-    return the current user's data.
+    Uses the current_user dependency to validate the bearer token and
+    return the current user's data. The body does no I/O, so it runs on the
+    event loop; with DB_ASYNC enabled the whole request does.
     """
 
     return UserOut.model_validate(user)
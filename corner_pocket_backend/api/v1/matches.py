@@ -1,12 +1,151 @@
-from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
-from typing import Optional
-from corner_pocket_backend.schemas.common import GameType
-from corner_pocket_backend.core.security import get_current_user
+from contextlib import contextmanager
+from datetime import timedelta
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from pydantic import BaseModel, Field
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterator, List, Optional, Union
+from corner_pocket_backend.schemas.common import GameType, MatchStatus
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import get_db
+from corner_pocket_backend.core.security import current_user
+from corner_pocket_backend.models import GameType as GameTypeModel, Match, RaceTo
+from corner_pocket_backend.models import MatchStatus as MatchStatusModel
 from corner_pocket_backend.models.users import User
+from corner_pocket_backend.schemas.matches import (
+    BatchItemResult,
+    GameAdded,
+    GameOut,
+    MatchBatchResult,
+    MatchDetail,
+    MatchSummary,
+)
+from corner_pocket_backend.services.idempotency import (
+    IdempotencyDbService,
+    IdempotencyKeyMismatch,
+    hash_request,
+)
+from corner_pocket_backend.services.matches import (
+    MAX_PAGE_SIZE,
+    MatchNotFound,
+    MatchStateConflict,
+    MatchVersionConflict,
+    MatchesDbService,
+)
 
 router = APIRouter()
 
+MAX_BATCH_SIZE = 50
+
+
+@contextmanager
+def match_errors() -> Iterator[None]:
+    """Map service errors to HTTP.
+
+    404 missing, 403 not allowed, 409 wrong state, 412 stale If-Match, 400 invalid.
+    """
+    try:
+        yield
+    except MatchNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except MatchStateConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except MatchVersionConflict as e:
+        raise HTTPException(status_code=412, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def etag(version: int) -> str:
+    """ETag for a match at `version`."""
+    return f'"{version}"'
+
+
+def expected_version(if_match: Optional[str] = Header(None)) -> Optional[int]:
+    """The match version a write is conditional on, from the If-Match header.
+
+    Absent or ``*`` means unconditional. Otherwise the value must be an ETag
+    previously returned by a match route; a write against any other version
+    fails with 412 Precondition Failed. If-Match uses strong comparison (RFC
+    7232, section 3.1), so a weak ``W/`` tag never matches and fails with 412.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip()
+    if tag.startswith("W/"):
+        raise HTTPException(status_code=412, detail="If-Match requires a strong ETag")
+    if len(tag) < 3 or tag[0] != '"' or tag[-1] != '"' or not tag[1:-1].isdigit():
+        raise HTTPException(status_code=400, detail="invalid If-Match header")
+    return int(tag[1:-1])
+
+
+def idempotency_key(
+    key: Optional[str] = Header(None, alias="Idempotency-Key"),
+) -> Optional[str]:
+    """The client's Idempotency-Key header, if any (1-255 characters)."""
+    if key is not None and not 0 < len(key) <= 255:
+        raise HTTPException(status_code=400, detail="invalid Idempotency-Key header")
+    return key
+
+
+class Idempotent:
+    """Answer retries of a write from the response stored under its key.
+
+    `replay()` runs before the write and returns the stored response for a
+    key already used by this user (422 if it was used for a different
+    request). `commit()` stores the new response in the write's own
+    transaction and commits both together. Without a key both are plain
+    pass-throughs.
+    """
+
+    def __init__(self, db: Session, user: User, key: Optional[str], request: Request, body: str):
+        self.db = db
+        self.user_id = user.id
+        self.key = key
+        self.request_hash = hash_request(request.method, request.url.path, body)
+
+    def replay(self) -> Optional[Response]:
+        """The stored response for this key, or None to go ahead with the write."""
+        if self.key is None:
+            return None
+        try:
+            stored = IdempotencyDbService(self.db).lookup(self.user_id, self.key, self.request_hash)
+        except IdempotencyKeyMismatch as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if stored is None:
+            return None
+        return Response(
+            content=stored.response_body,
+            status_code=stored.status_code,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+    def commit(self, result: BaseModel) -> Optional[Response]:
+        """Commit the write; returns the winner's response if the key raced."""
+        if self.key is not None:
+            try:
+                IdempotencyDbService(self.db).remember(
+                    self.user_id,
+                    self.key,
+                    self.request_hash,
+                    status_code=200,
+                    response_body=result.model_dump_json(),
+                    ttl=timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS),
+                )
+            except IntegrityError:
+                # A concurrent attempt with the same key committed first;
+                # drop this duplicate write and answer with its response.
+                self.db.rollback()
+                replayed = self.replay()
+                if replayed is None:
+                    raise HTTPException(status_code=409, detail="Idempotency-Key conflict")
+                return replayed
+        self.db.commit()
+        return None
+
 
 class MatchCreate(BaseModel):
     """Create a new match with an opponent."""
@@ -22,52 +161,284 @@ class GameAdd(BaseModel):
     winner_user_id: int
 
 
-@router.post("/matches")
-def create_match(payload: MatchCreate, user: User = Depends(get_current_user)) -> None:
+class MatchRecord(MatchCreate):
+    """A match scored offline: its games in the order they were played."""
+
+    games: List[GameAdd] = []
+    submit: bool = False
+
+
+class MatchBatch(BaseModel):
+    """Matches to record in one request."""
+
+    matches: List[MatchRecord] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class Decision(BaseModel):
+    """Optional note left by the opponent when approving or declining."""
+
+    note: Optional[str] = None
+
+
+@router.post("/matches", response_model=MatchSummary)
+def create_match(
+    payload: MatchCreate,
+    request: Request,
+    response: Response,
+    key: Optional[str] = Depends(idempotency_key),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> Union[MatchSummary, Response]:
     """Create a new match with an opponent.
 
     The authenticated user becomes the creator. Supports optional race-to
-    target and game type selection.
+    target and game type selection. A retry with the same Idempotency-Key
+    returns the original response instead of creating another match.
+    """
+    idempotent = Idempotent(db, user, key, request, payload.model_dump_json())
+    replayed = idempotent.replay()
+    if replayed is not None:
+        return replayed
+    with match_errors():
+        m = MatchesDbService(db).add_match(
+            user_id=user.id,
+            opponent_id=payload.opponent_id,
+            game_type=GameTypeModel(payload.game_type.value),
+            race_to=payload.race_to if payload.race_to is not None else RaceTo.FIVE.value,
+        )
+    summary = MatchSummary.model_validate(m)
+    replayed = idempotent.commit(summary)
+    if replayed is not None:
+        return replayed
+    response.headers["ETag"] = etag(summary.version)
+    return summary
+
+
+@router.post("/matches/batch", response_model=MatchBatchResult)
+def create_matches(
+    payload: MatchBatch,
+    request: Request,
+    key: Optional[str] = Depends(idempotency_key),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> Union[MatchBatchResult, Response]:
+    """Record matches scored offline, each with its games, in one transaction.
+
+    Replaces a create, one call per game and a submit for every match. Each
+    match is applied under its own savepoint, so an invalid one is reported
+    in its result (with the status code the single-match routes would use)
+    without discarding the others; everything valid is committed once.
     """
-    pass
+    idempotent = Idempotent(db, user, key, request, payload.model_dump_json())
+    replayed = idempotent.replay()
+    if replayed is not None:
+        return replayed
+    svc = MatchesDbService(db)
+    results: List[BatchItemResult] = []
+    for index, item in enumerate(payload.matches):
+        savepoint = db.begin_nested()
+        try:
+            with match_errors():
+                m, games = svc.record_match(
+                    user_id=user.id,
+                    opponent_id=item.opponent_id,
+                    game_type=GameTypeModel(item.game_type.value),
+                    race_to=item.race_to if item.race_to is not None else RaceTo.FIVE.value,
+                    winner_user_ids=[game.winner_user_id for game in item.games],
+                    submit=item.submit,
+                )
+                # Change-feed rows are only added to the session; write them
+                # under this item's savepoint so they stand or fall with it.
+                db.flush()
+        except HTTPException as e:
+            savepoint.rollback()
+            # Nothing the failed item added may reach the final commit.
+            for obj in list(db.new):
+                db.expunge(obj)
+            results.append(BatchItemResult(index=index, status_code=e.status_code, error=e.detail))
+            continue
+        savepoint.commit()
+        results.append(
+            BatchItemResult(
+                index=index,
+                status_code=200,
+                match=MatchSummary.model_validate(m),
+                games=[GameOut.model_validate(game) for game in games],
+            )
+        )
+    batch = MatchBatchResult(results=results)
+    replayed = idempotent.commit(batch)
+    return replayed if replayed is not None else batch
 
 
 @router.get("/matches")
 def list_matches(
-    mine: bool = Query(True), status: Optional[str] = None, user: User = Depends(get_current_user)
-) -> None:
-    """List matches, defaulting to those involving the current user.
+    mine: bool = Query(True),
+    status: Optional[MatchStatus] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """List matches newest first, defaulting to those involving the current user.
 
     Pass mine=false to view all matches. Filter by status when provided.
+    Results are paginated: pass the returned `next_cursor` as `cursor` to
+    fetch the next page; it is null on the last page.
     """
-    pass
+    try:
+        return MatchesDbService(db).list_matches_page(
+            user_id=user.id if mine else None,
+            limit=limit,
+            cursor=cursor,
+            status=MatchStatusModel(status.value) if status is not None else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/matches/{match_id}")
-def get_match(match_id: str, user: User = Depends(get_current_user)) -> None:
-    """Fetch a specific match, including its games, if the user participates."""
-    pass
+@router.get("/matches/{match_id}", response_model=MatchDetail)
+def get_match(
+    match_id: int, user: User = Depends(current_user), db: Session = Depends(get_db)
+) -> Response:
+    """Fetch a specific match, including its games, if the user participates.
 
+    The detail is serialized straight to JSON by its Pydantic model, skipping
+    FastAPI's second validation pass over the response. The ETag carries the
+    match version; send it back as If-Match to make a write conditional.
+    """
+    detail = MatchesDbService(db).get_match_detail(user_id=user.id, match_id=match_id)
+    if detail is None:
+        raise HTTPException(status_code=404, detail="Match not found")
+    return Response(
+        content=detail.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag(detail.version)},
+    )
+
+
+@router.post("/matches/{match_id}/games", response_model=GameAdded)
+def add_game(
+    match_id: int,
+    payload: GameAdd,
+    request: Request,
+    response: Response,
+    version: Optional[int] = Depends(expected_version),
+    key: Optional[str] = Depends(idempotency_key),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> Union[GameAdded, Response]:
+    """Append a game result to a pending match by specifying the winner.
+
+    The game that brings a player to the match's race-to target submits the
+    match for the opponent's approval. With If-Match, the game is only
+    recorded if the match is still at that version (412 otherwise). A retry
+    with the same Idempotency-Key returns the original response without
+    recording the game again.
+    """
+    idempotent = Idempotent(db, user, key, request, payload.model_dump_json())
+    replayed = idempotent.replay()
+    if replayed is not None:
+        return replayed
+    m = db.get(Match, match_id)
+    if m is None:
+        raise HTTPException(status_code=404, detail="match not found")
+    loser_user_id = m.opponent_id if payload.winner_user_id == m.creator_id else m.creator_id
+    with match_errors():
+        game = MatchesDbService(db).add_game(
+            match_id=match_id,
+            winner_user_id=payload.winner_user_id,
+            loser_user_id=loser_user_id,
+            game_type=m.game_type,
+            acting_user_id=user.id,
+            expected_version=version,
+        )
+    added = GameAdded(game=GameOut.model_validate(game), match=MatchSummary.model_validate(m))
+    replayed = idempotent.commit(added)
+    if replayed is not None:
+        return replayed
+    response.headers["ETag"] = etag(added.match.version)
+    return added
 
-@router.post("/matches/{match_id}/games")
-def add_game(match_id: str, payload: GameAdd, user: User = Depends(get_current_user)) -> None:
-    """Append a game result to a pending match by specifying the winner."""
-    pass
+
+def _transition(
+    action: str,
+    match_id: int,
+    user: User,
+    db: Session,
+    response: Response,
+    version: Optional[int],
+    **kwargs: Any,
+) -> MatchSummary:
+    with match_errors():
+        m = getattr(MatchesDbService(db), action)(
+            user_id=user.id, match_id=match_id, expected_version=version, **kwargs
+        )
+    summary = MatchSummary.model_validate(m)
+    db.commit()
+    response.headers["ETag"] = etag(summary.version)
+    return summary
 
 
 @router.post("/matches/{match_id}/submit")
-def submit(match_id: str, user: User = Depends(get_current_user)) -> None:
+def submit(
+    match_id: int,
+    response: Response,
+    version: Optional[int] = Depends(expected_version),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> MatchSummary:
     """Submit a pending match for opponent approval (creator only)."""
-    pass
+    return _transition("submit", match_id, user, db, response, version)
 
 
 @router.post("/matches/{match_id}/approve")
-def approve(match_id: str, user: User = Depends(get_current_user)) -> None:
+def approve(
+    match_id: int,
+    response: Response,
+    payload: Optional[Decision] = None,
+    version: Optional[int] = Depends(expected_version),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> MatchSummary:
     """Approve a submitted match (opponent only)."""
-    pass
+    note = payload.note if payload else None
+    return _transition("approve", match_id, user, db, response, version, note=note)
 
 
 @router.post("/matches/{match_id}/decline")
-def decline(match_id: str, user: User = Depends(get_current_user)) -> None:
+def decline(
+    match_id: int,
+    response: Response,
+    payload: Optional[Decision] = None,
+    version: Optional[int] = Depends(expected_version),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> MatchSummary:
     """Decline a submitted match (opponent only)."""
-    pass
+    note = payload.note if payload else None
+    return _transition("decline", match_id, user, db, response, version, note=note)
+
+
+@router.post("/matches/{match_id}/void")
+def void(
+    match_id: int,
+    response: Response,
+    version: Optional[int] = Depends(expected_version),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> MatchSummary:
+    """Void an approved match (opponent only); it no longer counts toward stats."""
+    return _transition("void", match_id, user, db, response, version)
+
+
+@router.post("/matches/{match_id}/cancel")
+def cancel(
+    match_id: int,
+    response: Response,
+    version: Optional[int] = Depends(expected_version),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> MatchSummary:
+    """Cancel a pending or submitted match (creator only)."""
+    return _transition("cancel", match_id, user, db, response, version)
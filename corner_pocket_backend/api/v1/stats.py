@@ -1,21 +1,166 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional
+from corner_pocket_backend.core.db import get_db
+from corner_pocket_backend.core.security import current_user
+from corner_pocket_backend.models import GameType as GameTypeModel
+from corner_pocket_backend.models.users import User
+from corner_pocket_backend.schemas.common import GameType
+from corner_pocket_backend.schemas.stats import (
+    HeadToHead,
+    Leaderboard,
+    PlayerForm,
+    PlayerRatings,
+    Rivals,
+    StatsSummary,
+    WindowStats,
+)
+from corner_pocket_backend.services.head_to_head import HeadToHeadDbService
+from corner_pocket_backend.services.leaderboard import LeaderboardDbService
+from corner_pocket_backend.services.ratings import RatingsDbService
+from corner_pocket_backend.services.recent import RecentStatsDbService
+from corner_pocket_backend.services.stats import StatsDbService
+from corner_pocket_backend.services.stats_cache import stats_cache
 
 router = APIRouter()
 
-# TODO: implement stats endpoints
-# from fastapi import Depends, Query
-# from typing import Optional
-# from corner_pocket_backend.services.users import UsersDbService
-# from corner_pocket_backend.services.stats import StatsService
-# from corner_pocket_backend.core.security import get_current_user
-
-# @router.get("/stats/summary")
-# def summary(user_id: Optional[str] = Query(None), user=Depends(get_current_user)):
-#     """Return a simple summary of results for a user.
-
-#     Defaults to the current user. Another user's id may be supplied by query
-#     for administrative/preview purposes.
-#     """
-#     pass
-#     # target = user_id or user.id
-#     # return StatsService().summary(user_id=target)
+
+@router.get("/stats/summary")
+def summary(
+    user_id: Optional[int] = Query(None),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> StatsSummary:
+    """Return a summary of results over approved matches for a user.
+
+    Defaults to the current user. Another user's id may be supplied by query
+    to view their record.
+    """
+    target = user_id if user_id is not None else user.id
+    return stats_cache.get_or_load(
+        target, ("summary",), lambda: StatsDbService(db).summary(user_id=target)
+    )
+
+
+@router.get("/stats/ratings")
+def ratings(
+    user_id: Optional[int] = Query(None),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> PlayerRatings:
+    """Return a user's Elo rating in each game type they have an approved match in.
+
+    Defaults to the current user.
+    """
+    target = user_id if user_id is not None else user.id
+    return stats_cache.get_or_load(
+        target, ("ratings",), lambda: RatingsDbService(db).ratings(user_id=target)
+    )
+
+
+@router.get("/stats/leaderboard")
+def leaderboard(
+    game_type: GameType,
+    limit: int = Query(20),
+    offset: int = Query(0),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> Leaderboard:
+    """Return a page of the rating leaderboard for a game type, with the caller's rank.
+
+    Served from this worker's in-memory board of the top-rated players.
+    """
+    try:
+        return LeaderboardDbService(db).leaderboard(
+            GameTypeModel(game_type.value), user_id=user.id, limit=limit, offset=offset
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/stats/head-to-head")
+def head_to_head(
+    opponent_id: int,
+    user_id: Optional[int] = Query(None),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> HeadToHead:
+    """Return a user's record against one opponent over approved matches.
+
+    Defaults to the current user's record.
+    """
+    target = user_id if user_id is not None else user.id
+    try:
+        return stats_cache.get_or_load(
+            target,
+            ("head_to_head", opponent_id),
+            lambda: HeadToHeadDbService(db).head_to_head(user_id=target, opponent_id=opponent_id),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/stats/rivals")
+def rivals(
+    user_id: Optional[int] = Query(None),
+    game_type: Optional[GameType] = None,
+    limit: int = Query(10),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> Rivals:
+    """Return a user's most-played opponents and their record against each.
+
+    Defaults to the current user, across all game types unless one is given.
+    """
+    target = user_id if user_id is not None else user.id
+    type_ = GameTypeModel(game_type.value) if game_type is not None else None
+    try:
+        return stats_cache.get_or_load(
+            target,
+            ("rivals", type_, limit),
+            lambda: HeadToHeadDbService(db).rivals(user_id=target, game_type=type_, limit=limit),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/stats/window")
+def window(
+    days: int = Query(30),
+    game_type: Optional[GameType] = None,
+    user_id: Optional[int] = Query(None),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> WindowStats:
+    """Return a user's record over approved matches played in the last `days` days.
+
+    Defaults to the current user, across all game types unless one is given.
+    """
+    target = user_id if user_id is not None else user.id
+    type_ = GameTypeModel(game_type.value) if game_type is not None else None
+    try:
+        # Keyed by day too: the window moves at midnight without any write.
+        return stats_cache.get_or_load(
+            target,
+            ("window", days, type_, datetime.utcnow().date()),
+            lambda: RecentStatsDbService(db).window(user_id=target, days=days, game_type=type_),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/stats/form")
+def form(
+    user_id: Optional[int] = Query(None),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> PlayerForm:
+    """Return a user's current and best streak and recent racks in each game type.
+
+    Defaults to the current user.
+    """
+    target = user_id if user_id is not None else user.id
+    return stats_cache.get_or_load(
+        target, ("form",), lambda: RecentStatsDbService(db).form(user_id=target)
+    )
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+from corner_pocket_backend.core.db import get_db
+from corner_pocket_backend.core.security import current_user
+from corner_pocket_backend.models.users import User
+from corner_pocket_backend.schemas.sync import SyncPage
+from corner_pocket_backend.services.sync import MAX_SYNC_LIMIT, SyncDbService
+
+router = APIRouter()
+
+
+@router.get("/sync", response_model=SyncPage)
+def sync(
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=MAX_SYNC_LIMIT),
+    user: User = Depends(current_user),
+    db: Session = Depends(get_db),
+) -> Response:
+    """Matches, games and approvals of the current user changed after `since`.
+
+    Start with since=0 and store the returned `next_since`; later launches
+    then download only what changed in between. Rows deleted in the meantime
+    come back as tombstones in `deleted`.
+    """
+    page = SyncDbService(db).changes_since(user_id=user.id, since=since, limit=limit)
+    return Response(content=page.model_dump_json(), media_type="application/json")
@@ -0,0 +1,76 @@
+"""In-process periodic jobs.
+
+`PeriodicTask` runs a callable every `interval` seconds on a daemon thread.
+Housekeeping jobs (e.g. reaping expired refresh tokens) are started and
+stopped with the application lifespan in `main.py`. Every worker process runs
+its own copy, so jobs must be idempotent and cheap to repeat.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from corner_pocket_backend.core.metrics import LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Run `fn` every `interval` seconds until stopped.
+
+    The first run happens one interval after `start()`. Exceptions are logged
+    and counted; they never stop the schedule.
+
+    Args:
+        name: Thread name and log label.
+        interval: Seconds between the end of one run and the start of the next.
+        fn: Job to run; takes no arguments.
+    """
+
+    def __init__(self, name: str, interval: float, fn: Callable[[], object]):
+        self.name = name
+        self.interval = interval
+        self._fn = fn
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.runs = 0
+        self.failures = 0
+        self.latency = LatencyRecorder()
+
+    def start(self) -> None:
+        """Start the background thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal the thread to exit and wait for an in-flight run to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> None:
+        """Run the job now on the calling thread."""
+        started = time.perf_counter()
+        try:
+            self._fn()
+        except Exception:
+            self.failures += 1
+            logger.exception("periodic task %s failed", self.name)
+        finally:
+            self.runs += 1
+            self.latency.observe(time.perf_counter() - started)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.run_once()
+
+    def stats(self) -> Dict[str, float]:
+        """Run and failure counts plus run latency."""
+        counters: Dict[str, float] = {"runs": self.runs, "failures": self.failures}
+        counters.update({f"latency_{k}": v for k, v in self.latency.snapshot().items()})
+        return counters
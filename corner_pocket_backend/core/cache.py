@@ -0,0 +1,130 @@
+"""In-process caches.
+
+`TTLCache` is a thread-safe LRU map whose entries also expire after a
+time-to-live. It backs the hot-path caches (authenticated users, decoded
+tokens, stats responses) and reports hit/miss counters for `/metrics`.
+`NullCache` has the same interface and stores nothing, for disabling a cache
+by configuration.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Protocol, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+K_contra = TypeVar("K_contra", bound=Hashable, contravariant=True)
+
+
+class Cache(Protocol[K_contra, V]):
+    """Interface shared by the cache implementations."""
+
+    def get(self, key: K_contra) -> Optional[V]: ...
+
+    def set(self, key: K_contra, value: V, ttl: Optional[float] = None) -> None: ...
+
+    def delete(self, key: K_contra) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> Dict[str, float]: ...
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache with per-entry expiry.
+
+    Args:
+        max_size: Maximum number of entries; the least recently used entry is
+            evicted when full.
+        ttl: Default time-to-live in seconds for entries set without one.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the live value for `key`, or None on a miss or expired entry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Store `value`, expiring after `ttl` seconds (defaults to the cache TTL)."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        """Drop `key` if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters, hit ratio and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "max_size": self.max_size,
+            }
+
+
+class NullCache(Generic[K, V]):
+    """Cache that never stores anything; every lookup is a miss."""
+
+    def __init__(self) -> None:
+        self.misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        self.misses += 1
+        return None
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        pass
+
+    def delete(self, key: K) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, float]:
+        return {"hits": 0, "misses": self.misses, "hit_ratio": 0.0, "size": 0, "max_size": 0}
+
+
+def build_cache(max_size: int, ttl: float) -> "Cache[K, V]":
+    """Return a `TTLCache`, or a `NullCache` when `max_size` or `ttl` is 0."""
+    if max_size <= 0 or ttl <= 0:
+        return NullCache()
+    return TTLCache(max_size=max_size, ttl=ttl)
@@ -12,11 +12,38 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = "changeme"
     JWT_SECRET: str = "change_me"
     CORS_ORIGINS: str = "http://localhost:19006,http://localhost:8081"
+    DB_ASYNC: bool = False  # Serve authenticated requests from the asyncpg engine
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    PASSWORD_HASH_WORKERS: int = 4  # Concurrent Argon2 hashes per process
+    PASSWORD_HASH_QUEUE: int = 32  # Waiting hash requests before answering 503
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+    USER_CACHE_TTL_SECONDS: float = 30  # 0 disables the authenticated-user cache
+    USER_CACHE_MAX_SIZE: int = 10_000
+    TOKEN_CACHE_TTL_SECONDS: float = 3600  # Upper bound; entries never outlive the token's exp
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+    TOKEN_REAPER_INTERVAL_SECONDS: float = 3600  # 0 disables the in-process reaper
+    TOKEN_REAPER_BATCH_SIZE: int = 1000
+    TOKEN_REAPER_REVOKED_RETENTION_HOURS: float = 24  # Keep revoked tokens for reuse detection
+    IDEMPOTENCY_KEY_TTL_HOURS: float = 24  # How long a retried write is answered from storage
+    IDEMPOTENCY_REAPER_INTERVAL_SECONDS: float = 3600  # 0 disables the in-process reaper
+    IDEMPOTENCY_REAPER_BATCH_SIZE: int = 1000
+    RATING_INITIAL: float = 1500  # Rating of a player's first match in a game type
+    RATING_K_FACTOR: float = 16  # Elo points at stake per rack
+    LEADERBOARD_MAX_SIZE: int = 10_000  # Players held in memory per game type
+    LEADERBOARD_CHECK_INTERVAL_SECONDS: float = 60  # 0 disables the drift check
+    STATS_CACHE_TTL_SECONDS: float = 60  # 0 disables the stats response cache
+    STATS_CACHE_MAX_SIZE: int = 50_000
+    BROKER_SOCKET_DIR: str = ""  # Shared by the workers on a host; empty keeps messages in-process
 
     @property
     def database_url(self) -> str:
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def async_database_url(self) -> str:
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
     @property
     def cors_origins_list(self) -> List[str]:
         return [o.strip() for o in self.CORS_ORIGINS.split(",") if o.strip()]
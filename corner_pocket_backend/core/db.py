@@ -3,13 +3,25 @@
 Provides a synchronous SQLAlchemy engine and session factory bound to the
 configured database URL. Also exposes a small context manager helper for
 service-layer usage and a FastAPI-friendly `get_db` generator if needed.
+
+An asyncio engine (asyncpg) and `AsyncSession` factory live alongside the
+synchronous ones. Set ``DB_ASYNC=true`` to serve authenticated requests from
+it so waiting on Postgres no longer pins a Starlette threadpool thread.
+
+`on_commit` defers in-process side effects (leaderboard updates, cache
+invalidation) until the transaction that caused them has committed.
+
+`upsert` writes the incrementally maintained aggregates (stats, ratings,
+head-to-head) with one INSERT ... ON CONFLICT DO UPDATE.
 """
 
-from contextlib import contextmanager
-from typing import Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import Result, create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, Session, SessionTransaction
 
 from corner_pocket_backend.core.config import settings
 
@@ -20,6 +32,21 @@ engine = create_engine(settings.database_url, pool_pre_ping=True, future=True)
 # Session factory. Disable autocommit/autoflush for explicit control.
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
+# Async engine; connections are only opened on first use, so building it is cheap
+# even when DB_ASYNC is off.
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
+
+# expire_on_commit=False so ORM objects stay readable after commit without an
+# implicit (and, under asyncio, illegal) lazy refresh.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
 
 @contextmanager
 def session_scope() -> Iterator[Session]:
@@ -48,3 +75,97 @@ def get_db() -> Iterator[Session]:
         yield db
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """Async counterpart of `session_scope`: commit on success, roll back on error."""
+    db = AsyncSessionLocal()
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        await db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency to yield an `AsyncSession`."""
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+# Session.info key holding the callbacks registered with `on_commit`.
+ON_COMMIT = "on_commit"
+
+
+def on_commit(db: Session, fn: Callable[[], None]) -> None:
+    """Run `fn` after the session's current transaction commits.
+
+    Callbacks run in registration order; they are dropped if the
+    transaction rolls back or the session closes without committing.
+    """
+    db.info.setdefault(ON_COMMIT, []).append(fn)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit(session: Session) -> None:
+    callbacks: List[Callable[[], None]] = session.info.pop(ON_COMMIT, [])
+    for fn in callbacks:
+        fn()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_on_commit(session: Session, transaction: SessionTransaction) -> None:
+    # Whatever is left when the outermost transaction ends was never committed.
+    if transaction.parent is None:
+        session.info.pop(ON_COMMIT, None)
+
+
+# Dialect-specific INSERT ... ON CONFLICT constructs (same API on both).
+UPSERTS: Dict[str, Callable[..., Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def upsert(
+    db: Session,
+    model: Any,
+    keys: Sequence[str],
+    rows: Sequence[Dict[str, Any]],
+    increments: Sequence[str] = (),
+    set_: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    returning: Sequence[Any] = (),
+) -> "Result[Any]":
+    """Insert `rows` into `model`, merging them into existing rows with the same `keys`.
+
+    On conflict the `increments` columns are added to the stored values and
+    the other non-key columns of `rows` overwrite them. `set_`, called with
+    the statement's `excluded` row, overrides the merge for the columns it
+    returns.
+
+    Raises:
+        NotImplementedError: On a dialect without INSERT ... ON CONFLICT.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect not in UPSERTS:
+        raise NotImplementedError(f"upsert is not supported on {dialect}")
+    stmt = UPSERTS[dialect](model).values(list(rows))
+    excluded = stmt.excluded
+    merged = {
+        c: getattr(model, c) + getattr(excluded, c) if c in increments else getattr(excluded, c)
+        for c in rows[0]
+        if c not in keys
+    }
+    if set_ is not None:
+        merged |= set_(excluded)
+    stmt = stmt.on_conflict_do_update(index_elements=[getattr(model, k) for k in keys], set_=merged)
+    if returning:
+        stmt = stmt.returning(*returning)
+    return db.execute(stmt)
@@ -0,0 +1,128 @@
+"""In-process ranking index.
+
+`SortedIndex` keeps ids ranked by score in a sorted list maintained with
+`bisect`, so "top N" and "rank of id" are a binary search instead of an
+ORDER BY over every row. It backs the per-game-type leaderboards in
+`services/leaderboard.py` and reports its size and reload counters for
+`/metrics`.
+"""
+
+import bisect
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (-score, id): ascending order is highest score first, ties by lowest id.
+Key = Tuple[float, int]
+
+
+class SortedIndex:
+    """Bounded ranking of ids by score, highest first.
+
+    Loaded with the top of the ranking, the index remembers the lowest key
+    it was given (the floor) and from then on tracks exactly the ids ranked
+    at or above it: an update that lands below the floor drops the id. The
+    index therefore always holds a correct prefix of the full ranking, of at
+    most `max_size` entries. When updates have pushed it under half of
+    `max_size` it reports itself `stale` so the owner reloads it.
+
+    Rank and top-N lookups are a bisect (O(log n)) plus the page size;
+    updates are a bisect plus a list insert/delete.
+
+    Args:
+        max_size: Maximum number of ids held.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.loaded = False
+        self.loads = 0
+        self._keys: List[Key] = []
+        self._scores: Dict[int, float] = {}
+        self._floor: Optional[Key] = None
+        self._lock = threading.Lock()
+
+    def load(self, entries: Iterable[Tuple[int, float]], complete: bool) -> None:
+        """Replace the contents with `entries` (id, score).
+
+        Args:
+            entries: The top of the ranking, at most `max_size` of them.
+            complete: True if `entries` is every id there is; otherwise the
+                lowest one becomes the floor.
+        """
+        scores = dict(entries)
+        keys = sorted((-score, id_) for id_, score in scores.items())
+        with self._lock:
+            self._keys = keys
+            self._scores = scores
+            self._floor = None if complete or not keys else keys[-1]
+            self._trim()
+            self.loaded = True
+            self.loads += 1
+
+    def clear(self) -> None:
+        """Forget everything; the owner must `load` again."""
+        with self._lock:
+            self._keys, self._scores, self._floor = [], {}, None
+            self.loaded = False
+
+    def update(self, id_: int, score: float) -> None:
+        """Set the score of `id_`, moving, adding or dropping it."""
+        key = (-score, id_)
+        with self._lock:
+            old = self._scores.pop(id_, None)
+            if old is not None:
+                del self._keys[bisect.bisect_left(self._keys, (-old, id_))]
+            if self._floor is not None and key > self._floor:
+                return
+            self._scores[id_] = score
+            bisect.insort(self._keys, key)
+            self._trim()
+
+    def top(self, limit: int, offset: int = 0) -> List[Tuple[int, int, float]]:
+        """Entries ranked `offset + 1` to `offset + limit` as (rank, id, score)."""
+        with self._lock:
+            page = self._keys[offset : offset + limit]
+        return [(offset + i + 1, id_, -neg) for i, (neg, id_) in enumerate(page)]
+
+    def rank(self, id_: int) -> Optional[Tuple[int, float]]:
+        """(1-based rank, score) of `id_`, or None if it isn't held."""
+        with self._lock:
+            score = self._scores.get(id_)
+            if score is None:
+                return None
+            return bisect.bisect_left(self._keys, (-score, id_)) + 1, score
+
+    @property
+    def floor(self) -> Optional[Key]:
+        """Lowest key tracked, or None when every id is held."""
+        return self._floor
+
+    @property
+    def stale(self) -> bool:
+        """True once a truncated index has shrunk below half of `max_size`."""
+        return self._floor is not None and len(self._keys) < self.max_size // 2
+
+    def fingerprint(self) -> Tuple[int, float]:
+        """(count, sum of scores) of the held entries, to compare with the source."""
+        with self._lock:
+            return len(self._scores), math.fsum(self._scores.values())
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def stats(self) -> Dict[str, float]:
+        """Size, capacity and load count."""
+        return {
+            "size": len(self._keys),
+            "max_size": self.max_size,
+            "truncated": float(self._floor is not None),
+            "loads": self.loads,
+        }
+
+    def _trim(self) -> None:
+        if len(self._keys) > self.max_size:
+            for _, id_ in self._keys[self.max_size :]:
+                del self._scores[id_]
+            del self._keys[self.max_size :]
+            self._floor = self._keys[-1]
@@ -0,0 +1,66 @@
+"""In-process metrics.
+
+Components register a collector callable that returns a flat mapping of
+numbers; `GET /metrics` serves a snapshot of every registered collector.
+Values are per worker process.
+"""
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict
+
+Collector = Callable[[], Dict[str, float]]
+
+
+class LatencyRecorder:
+    """Track durations over a bounded window of recent samples.
+
+    Lifetime count and mean are exact; percentiles and max cover the most
+    recent `window` observations only, so memory stays constant.
+    """
+
+    def __init__(self, window: int = 1024):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        with self._lock:
+            self._samples.append(seconds)
+            self._count += 1
+            self._total += seconds
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return count, mean, p50, p95 and max in milliseconds."""
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total = self._count, self._total
+        if not samples:
+            return {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": count,
+            "mean_ms": total / count * 1000,
+            "p50_ms": samples[len(samples) // 2] * 1000,
+            "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+            "max_ms": samples[-1] * 1000,
+        }
+
+
+class MetricsRegistry:
+    """Named collectors gathered into one snapshot."""
+
+    def __init__(self) -> None:
+        self._collectors: Dict[str, Collector] = {}
+
+    def register(self, name: str, collector: Collector) -> None:
+        """Register (or replace) the collector published under `name`."""
+        self._collectors[name] = collector
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Collect every registered metric group."""
+        return {name: collect() for name, collect in sorted(self._collectors.items())}
+
+
+registry = MetricsRegistry()
@@ -1,8 +1,35 @@
 # core/password.py
+"""Password hashing.
+
+Argon2 is deliberately CPU-expensive, so request handlers hash and verify
+through `password_pool`, a bounded worker pool with its own admission limit.
+A burst of logins then queues behind a fixed number of hashing workers and,
+once the queue is full, is rejected with `HashingPoolSaturated` (served as
+503 + Retry-After) instead of tying up every request thread.
+
+argon2-cffi releases the GIL while hashing, so a thread pool gives real
+parallelism without the pickling and startup cost of a process pool.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, TypeVar
+
 from pwdlib import PasswordHash
 
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.metrics import LatencyRecorder, registry
+
 password_hasher = PasswordHash.recommended()
 
+T = TypeVar("T")
+
+
+class HashingPoolSaturated(RuntimeError):
+    """Raised when the hashing pool has no free worker or queue slot."""
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plaintext password against a hash."""
@@ -12,3 +39,86 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     """Hash a plaintext password."""
     return password_hasher.hash(password)
+
+
+class PasswordHashingPool:
+    """Bounded executor for password hashing and verification.
+
+    Args:
+        max_workers: Hashes computed concurrently.
+        max_queue: Additional requests allowed to wait for a worker. Anything
+            beyond `max_workers + max_queue` in flight is rejected.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pwhash")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._rejected = 0
+        self.latency = LatencyRecorder()
+
+    def _submit(self, fn: Callable[..., T], *args: str) -> "Future[T]":
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingPoolSaturated("password hashing pool is saturated")
+        with self._lock:
+            self._queued += 1
+
+        def run() -> T:
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self.latency.observe(time.perf_counter() - started)
+                with self._lock:
+                    self._active -= 1
+                self._slots.release()
+
+        def forget(future: "Future[T]") -> None:
+            # A job cancelled while queued (its caller went away) never runs,
+            # so `run` cannot hand its slot back.
+            if future.cancelled():
+                with self._lock:
+                    self._queued -= 1
+                self._slots.release()
+
+        future = self._executor.submit(run)
+        future.add_done_callback(forget)
+        return future
+
+    async def hash(self, password: str) -> str:
+        """Hash a plaintext password without blocking the event loop."""
+        return await asyncio.wrap_future(self._submit(password_hasher.hash, password))
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a hash without blocking the event loop."""
+        return await asyncio.wrap_future(
+            self._submit(password_hasher.verify, plain_password, hashed_password)
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """Queue depth, active workers, rejections and hash latency."""
+        with self._lock:
+            counters: Dict[str, float] = {
+                "queue_depth": self._queued,
+                "active": self._active,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "rejected": self._rejected,
+            }
+        counters.update({f"latency_{k}": v for k, v in self.latency.snapshot().items()})
+        return counters
+
+
+password_pool = PasswordHashingPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS, max_queue=settings.PASSWORD_HASH_QUEUE
+)
+registry.register("password_hashing", password_pool.stats)
@@ -0,0 +1,168 @@
+"""Publish/subscribe between worker processes.
+
+`LocalBroker` is a stand-in for a shared message broker (Redis pub/sub,
+Postgres LISTEN/NOTIFY) that needs nothing but the local filesystem. A
+message is always delivered to this process's subscribers, synchronously.
+With `BROKER_SOCKET_DIR` set, every worker on the host also binds a Unix
+datagram socket in that directory while the app runs and `publish` sends
+the message to each peer's socket, where a listener thread delivers it to
+the peer's subscribers. Delivery is best effort and unordered across
+workers, so subscribers must be idempotent (cache invalidation is).
+
+Replace `broker` with any `Broker` implementation to span hosts.
+"""
+
+import glob
+import json
+import logging
+import os
+import socket
+import threading
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Protocol
+
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+Message = Dict[str, Any]
+Handler = Callable[[Message], None]
+
+# Largest datagram read; messages are small JSON documents.
+MAX_MESSAGE_BYTES = 64 * 1024
+
+
+class Broker(Protocol):
+    """Interface shared by broker implementations."""
+
+    def subscribe(self, channel: str, handler: Handler) -> None: ...
+
+    def publish(self, channel: str, message: Message) -> None: ...
+
+    def start(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+    def stats(self) -> Dict[str, float]: ...
+
+
+class LocalBroker:
+    """In-process fan-out, extended to the other workers on this host by socket.
+
+    Args:
+        socket_dir: Directory holding one socket per worker; empty keeps
+            messages inside this process.
+    """
+
+    def __init__(self, socket_dir: str = ""):
+        self.socket_dir = socket_dir
+        self._handlers: DefaultDict[str, List[Handler]] = defaultdict(list)
+        self._sock: Optional[socket.socket] = None
+        self._path: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.published = 0
+        self.sent = 0
+        self.received = 0
+        self.failures = 0
+
+    def subscribe(self, channel: str, handler: Handler) -> None:
+        """Call `handler` with every message published on `channel`, from any worker."""
+        self._handlers[channel].append(handler)
+
+    def publish(self, channel: str, message: Message) -> None:
+        """Deliver `message` to this process's subscribers, then send it to the peers."""
+        self.published += 1
+        self._deliver(channel, message)
+        sock, own_path = self._sock, self._path
+        if sock is None:
+            return
+        payload = json.dumps({"channel": channel, "message": message}).encode()
+        for peer in glob.glob(os.path.join(self.socket_dir, "*.sock")):
+            if peer == own_path:
+                continue
+            try:
+                sock.sendto(payload, peer)
+                self.sent += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Left behind by a worker that died without unlinking it.
+                self._unlink(peer)
+            except OSError:
+                self.failures += 1
+                logger.warning("broker could not reach %s", peer, exc_info=True)
+
+    def start(self) -> None:
+        """Bind this worker's socket and start listening (no-op without `socket_dir`)."""
+        if not self.socket_dir or self._thread is not None:
+            return
+        os.makedirs(self.socket_dir, exist_ok=True)
+        self._path = os.path.join(self.socket_dir, f"{os.getpid()}.sock")
+        self._unlink(self._path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(self._path)
+        sock.settimeout(0.5)
+        self._sock = sock
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="broker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop listening and remove this worker's socket."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        if self._path is not None:
+            self._unlink(self._path)
+            self._path = None
+
+    def stats(self) -> Dict[str, float]:
+        """Messages published here, sent to peers, received from peers, and failures."""
+        return {
+            "published": self.published,
+            "sent": self.sent,
+            "received": self.received,
+            "failures": self.failures,
+            "listening": float(self._thread is not None),
+        }
+
+    def _listen(self) -> None:
+        assert self._sock is not None
+        while not self._stop.is_set():
+            try:
+                data = self._sock.recv(MAX_MESSAGE_BYTES)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            try:
+                envelope = json.loads(data)
+                channel, message = envelope["channel"], envelope["message"]
+            except (ValueError, KeyError, TypeError):
+                self.failures += 1
+                continue
+            self.received += 1
+            self._deliver(channel, message)
+
+    def _deliver(self, channel: str, message: Message) -> None:
+        for handler in self._handlers.get(channel, []):
+            try:
+                handler(message)
+            except Exception:
+                self.failures += 1
+                logger.exception("broker handler failed on %s", channel)
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+broker: Broker = LocalBroker(socket_dir=settings.BROKER_SOCKET_DIR)
+registry.register("broker", lambda: broker.stats())
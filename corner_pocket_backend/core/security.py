@@ -1,13 +1,18 @@
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
+import hashlib
+import time
 import uuid
 from jose import jwt
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from corner_pocket_backend.core.cache import Cache, build_cache
 from corner_pocket_backend.core.config import settings
-from corner_pocket_backend.core.db import get_db
-from corner_pocket_backend.services.users import UsersDbService
+from corner_pocket_backend.core.db import get_async_db, get_db
+from corner_pocket_backend.core.metrics import registry
+from corner_pocket_backend.services.users import AsyncUsersDbService, UsersDbService
 from corner_pocket_backend.models import User
 
 """Security utilities for JWT creation and authentication dependencies.
@@ -24,6 +29,19 @@ TOKEN_ISSUER = "corner-pocket-backend"
 TOKEN_AUDIENCE = "corner-pocket-frontend"
 TOKEN_VERSION = "v2"
 
+# Claims of tokens that already passed signature and claim validation, keyed
+# by token digest. Mobile clients reuse one access token for hours, so repeat
+# requests skip the HMAC check; entries expire no later than the token does.
+token_cache: Cache[str, Dict[str, Any]] = build_cache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_CACHE_TTL_SECONDS
+)
+registry.register("token_cache", lambda: token_cache.stats())
+
+
+def hash_token(token: str) -> str:
+    """Return the SHA-256 hex digest of a token (64 characters)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 
 def _base_claims(token_type: str) -> Dict[str, Any]:
     now = datetime.now(timezone.utc)
@@ -81,41 +99,49 @@ def create_refresh_token(
     return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=ALGO)
 
 
-def verify_token(token: str, token_type: Optional[str] = None) -> Dict[str, Any]:
+def verify_token(
+    token: str, token_type: Optional[str] = None, use_cache: bool = True
+) -> Dict[str, Any]:
     """Verify a JWT token and return the payload.
 
+    Verified claims are cached by token digest until the token's `exp` (capped
+    at TOKEN_CACHE_TTL_SECONDS), so a repeat token skips signature, audience
+    and issuer checks. Expiry is re-checked on every hit, and tokens that are
+    not yet valid (`nbf`) are never cached.
+
     Args:
         token: The JWT token to verify.
+        token_type: Expected "token_type" claim, if any.
+        use_cache: Set False to force a full decode.
     Returns:
         The payload of the verified token.
     """
-    data = jwt.decode(
-        token,
-        settings.JWT_SECRET,
-        algorithms=[ALGO],
-        audience=TOKEN_AUDIENCE,
-        issuer=TOKEN_ISSUER,
-    )
+    digest = hash_token(token) if use_cache else ""
+    now = time.time()
+    cached = token_cache.get(digest) if use_cache else None
+    if cached is not None and cached.get("exp", 0) > now:
+        data = dict(cached)
+    else:
+        data = jwt.decode(
+            token,
+            settings.JWT_SECRET,
+            algorithms=[ALGO],
+            audience=TOKEN_AUDIENCE,
+            issuer=TOKEN_ISSUER,
+        )
+        ttl = min(data.get("exp", now) - now, settings.TOKEN_CACHE_TTL_SECONDS)
+        if use_cache and ttl > 0 and data.get("nbf", 0) <= now:
+            token_cache.set(digest, dict(data), ttl=ttl)
     if token_type and data.get("token_type") != token_type:
         raise HTTPException(status_code=401, detail="Invalid token type")
     return data
 
 
-def get_current_user(
-    creds: HTTPAuthorizationCredentials = Depends(bearer), db: Session = Depends(get_db)
-) -> User:
-    """Validate the bearer token and return the authenticated user.
-
-    This dependency extracts the token from the Authorization header, verifies
-    its signature and expiry, looks up the user by subject, and returns the
-    user object. It raises 401 for any authentication failure.
+def _authenticated_user_id(creds: Optional[HTTPAuthorizationCredentials]) -> int:
+    """Verify the bearer credentials and return the subject's user id.
 
-    Args:
-        creds: Parsed Authorization header provided by HTTPBearer.
-        db: Database session injected by FastAPI.
-
-    Returns:
-        The authenticated user object from UsersDbService.
+    Raises:
+        HTTPException: 401 for a missing, invalid, or outdated token.
     """
     if not creds:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -129,12 +155,58 @@ def get_current_user(
     if not uid:
         raise HTTPException(status_code=401, detail="Invalid token payload")
     try:
-        user_id = int(uid)
+        return int(uid)
     except (ValueError, TypeError):
         raise HTTPException(status_code=401, detail="Token format outdated. Please log in again.")
 
+
+def get_current_user(
+    creds: HTTPAuthorizationCredentials = Depends(bearer), db: Session = Depends(get_db)
+) -> User:
+    """Validate the bearer token and return the authenticated user.
+
+    This dependency extracts the token from the Authorization header, verifies
+    its signature and expiry, looks up the user by subject, and returns the
+    user object. It raises 401 for any authentication failure.
+
+    Args:
+        creds: Parsed Authorization header provided by HTTPBearer.
+        db: Database session injected by FastAPI.
+
+    Returns:
+        The authenticated user object from UsersDbService.
+
+    The user is read through the short-TTL user cache, and FastAPI resolves
+    the dependency once per request, so protected endpoints normally skip the
+    user lookup entirely.
+    """
+    user_id = _authenticated_user_id(creds)
     user_svc = UsersDbService(db=db)
-    user = user_svc.get_by_id(user_id)
+    user = user_svc.get_by_id_cached(user_id)
     if not user:
         raise HTTPException(status_code=401, detail="Invalid user")
     return user
+
+
+async def get_current_user_async(
+    creds: HTTPAuthorizationCredentials = Depends(bearer),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """Async variant of `get_current_user` backed by the asyncpg engine.
+
+    Runs on the event loop, so a request waiting on Postgres does not occupy
+    a threadpool thread.
+    """
+    user_id = _authenticated_user_id(creds)
+    user = await AsyncUsersDbService(db=db).get_by_id_cached(user_id)
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid user")
+    return user
+
+
+# Dependency for protected routes; DB_ASYNC picks the engine it runs on.
+current_user: Callable[..., Any]
+if settings.DB_ASYNC:
+    current_user = get_current_user_async
+else:
+    current_user = get_current_user
@@ -1,10 +1,115 @@
-from typing import Dict
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import AsyncIterator, Dict
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from corner_pocket_backend.core.background import PeriodicTask
 from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import session_scope
+from corner_pocket_backend.core.metrics import registry
+from corner_pocket_backend.core.password import HashingPoolSaturated
+from corner_pocket_backend.core.pubsub import broker
 from corner_pocket_backend.api.routes import router as api_router
+from corner_pocket_backend.models import GameType
+from corner_pocket_backend.services.idempotency import IdempotencyDbService
+from corner_pocket_backend.services.leaderboard import LeaderboardDbService
+from corner_pocket_backend.services.security import SecurityDbService
 
-corner_pocket_backend = FastAPI(title="Corner-Pocket API", version="0.1.0")
+logger = logging.getLogger(__name__)
+
+
+def reap_refresh_tokens() -> None:
+    """Delete expired and long-revoked refresh tokens in bounded batches."""
+    with session_scope() as db:
+        result = SecurityDbService(db).purge_expired_refresh_tokens(
+            batch_size=settings.TOKEN_REAPER_BATCH_SIZE,
+            revoked_retention=timedelta(hours=settings.TOKEN_REAPER_REVOKED_RETENTION_HOURS),
+        )
+    logger.info(
+        "reaped %d refresh tokens in %d batches (%.1f ms)",
+        result["deleted"],
+        result["batches"],
+        result["elapsed_ms"],
+    )
+
+
+token_reaper = PeriodicTask(
+    "refresh-token-reaper", settings.TOKEN_REAPER_INTERVAL_SECONDS, reap_refresh_tokens
+)
+registry.register("token_reaper", token_reaper.stats)
+
+
+def reap_idempotency_keys() -> None:
+    """Delete expired idempotency keys in bounded batches."""
+    with session_scope() as db:
+        result = IdempotencyDbService(db).purge_expired(
+            batch_size=settings.IDEMPOTENCY_REAPER_BATCH_SIZE
+        )
+    logger.info(
+        "reaped %d idempotency keys in %d batches (%.1f ms)",
+        result["deleted"],
+        result["batches"],
+        result["elapsed_ms"],
+    )
+
+
+idempotency_reaper = PeriodicTask(
+    "idempotency-key-reaper", settings.IDEMPOTENCY_REAPER_INTERVAL_SECONDS, reap_idempotency_keys
+)
+registry.register("idempotency_reaper", idempotency_reaper.stats)
+
+
+def check_leaderboards() -> None:
+    """Reload leaderboards that drifted from the ratings table (e.g. rated by another worker)."""
+    with session_scope() as db:
+        reloaded = LeaderboardDbService(db).check()
+    if reloaded:
+        logger.info("reloaded leaderboards: %s", ", ".join(t.value for t in reloaded))
+
+
+leaderboard_checker = PeriodicTask(
+    "leaderboard-checker", settings.LEADERBOARD_CHECK_INTERVAL_SECONDS, check_leaderboards
+)
+registry.register("leaderboard_checker", leaderboard_checker.stats)
+
+# Housekeeping jobs started with the app; an interval of 0 disables a job.
+BACKGROUND_TASKS = [token_reaper, idempotency_reaper, leaderboard_checker]
+
+
+def warm_leaderboards() -> None:
+    """Load every leaderboard before serving.
+
+    A failure is logged and not fatal: boards also load on first use.
+    """
+    try:
+        with session_scope() as db:
+            svc = LeaderboardDbService(db)
+            for game_type in GameType:
+                svc.load(game_type)
+    except Exception:
+        logger.warning("leaderboard warm-up failed; boards will load on first use", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm in-memory state and start background housekeeping for the lifetime of the app."""
+    await run_in_threadpool(warm_leaderboards)
+    broker.start()
+    tasks = [task for task in BACKGROUND_TASKS if task.interval > 0]
+    for task in tasks:
+        task.start()
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.stop()
+        broker.stop()
+
+
+corner_pocket_backend = FastAPI(title="Corner-Pocket API", version="0.1.0", lifespan=lifespan)
 
 corner_pocket_backend.add_middleware(
     CORSMiddleware,
@@ -15,10 +120,26 @@ corner_pocket_backend.add_middleware(
 )
 
 
+@corner_pocket_backend.exception_handler(HashingPoolSaturated)
+async def hashing_pool_saturated(request: Request, exc: HashingPoolSaturated) -> JSONResponse:
+    """Shed login/register load when the password hashing pool is full."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+    )
+
+
 @corner_pocket_backend.get("/health")
 def health() -> Dict[str, bool]:
     """Basic liveness probe used for smoke tests and container healthchecks."""
     return {"ok": True}
 
 
+@corner_pocket_backend.get("/metrics")
+def metrics() -> Dict[str, Dict[str, float]]:
+    """Per-process counters (hashing pool, caches) for dashboards and load tests."""
+    return registry.snapshot()
+
+
 corner_pocket_backend.include_router(api_router, prefix="/api/v1")
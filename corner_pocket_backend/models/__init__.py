@@ -5,6 +5,10 @@ from .games import Game, GameType, RaceTo
 from .base import Base
 from .approvals import Approval, ApprovalStatus
 from .security import RefreshToken
+from .idempotency import IdempotencyKey
+from .changes import Change, ChangeEntity, ChangeLogHead, ChangeOp
+from .stats import HeadToHead, UserDailyStats, UserForm, UserStats
+from .ratings import Rating
 
 __all__ = [
     "User",
@@ -17,4 +21,14 @@ __all__ = [
     "Approval",
     "ApprovalStatus",
     "RefreshToken",
+    "IdempotencyKey",
+    "Change",
+    "ChangeEntity",
+    "ChangeLogHead",
+    "ChangeOp",
+    "UserStats",
+    "HeadToHead",
+    "UserDailyStats",
+    "UserForm",
+    "Rating",
 ]
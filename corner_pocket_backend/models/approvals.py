@@ -27,7 +27,9 @@ class Approval(Base):
         Integer, ForeignKey("matches.id"), nullable=False, unique=True
     )
     match: Mapped["Match"] = relationship("Match", back_populates="approval")
-    approver_user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    approver_user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False, index=True
+    )
     approver: Mapped["User"] = relationship("User", foreign_keys=[approver_user_id])
     status: Mapped[ApprovalStatus] = mapped_column(
         SQLEnum(ApprovalStatus), nullable=False, default=ApprovalStatus.PENDING
@@ -0,0 +1,88 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+from sqlalchemy import (
+    Connection,
+    Index,
+    Integer,
+    DateTime,
+    Enum as SQLEnum,
+    Table,
+    event,
+    insert,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+
+
+class ChangeEntity(str, Enum):
+    """Kind of row a change refers to."""
+
+    MATCH = "MATCH"
+    GAME = "GAME"
+    APPROVAL = "APPROVAL"
+
+
+class ChangeOp(str, Enum):
+    """What happened to the row."""
+
+    UPSERT = "UPSERT"  # Created or updated; clients fetch its current state
+    DELETE = "DELETE"  # Removed; clients drop their copy (tombstone)
+
+
+class Change(Base):
+    """One entry of the match change feed served by ``GET /sync``.
+
+    Appended by MatchesDbService in the same transaction as the write it
+    records. `seq` is assigned on insert, so a slow transaction can commit
+    a lower `seq` after a higher one was already served; the feed is read
+    by `position` instead, which is assigned just before the transaction
+    commits (see `services.sync`) and so follows commit order. A client
+    that remembers the last position it saw asks for ``position > since``
+    and receives only what changed. The match participants are copied onto
+    every entry so a user's feed is an index range scan rather than a join
+    through matches (which may be gone).
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_creator_id_position", "creator_id", "position"),
+        Index("ix_change_log_opponent_id_position", "opponent_id", "position"),
+        # Only the entries of transactions still committing lack a position.
+        Index(
+            "ix_change_log_unstamped",
+            "seq",
+            postgresql_where=text("position IS NULL"),
+            sqlite_where=text("position IS NULL"),
+        ),
+    )
+
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    position: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    entity: Mapped[ChangeEntity] = mapped_column(SQLEnum(ChangeEntity), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    op: Mapped[ChangeOp] = mapped_column(SQLEnum(ChangeOp), nullable=False)
+    # No foreign keys: entries outlive the rows they describe.
+    match_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    creator_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    opponent_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class ChangeLogHead(Base):
+    """Single row holding the last `Change.position` handed out.
+
+    Committing transactions advance it with an UPDATE whose row lock they
+    hold until they commit, so positions are handed out in commit order.
+    """
+
+    __tablename__ = "change_log_head"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(ChangeLogHead.__table__, "after_create")
+def _seed_change_log_head(target: Table, connection: Connection, **kw: Any) -> None:
+    connection.execute(insert(target).values(id=1, position=0))
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
-from sqlalchemy import Integer, DateTime, ForeignKey, func, Enum as SQLEnum
+from sqlalchemy import Index, Integer, DateTime, ForeignKey, func, Enum as SQLEnum
 from enum import Enum
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from .base import Base
@@ -37,6 +37,10 @@ class Game(Base):
     """
 
     __tablename__ = "games"
+    __table_args__ = (
+        # Games of a match, in insertion order.
+        Index("ix_games_match_id_id", "match_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     match_id: Mapped[int] = mapped_column(
@@ -46,10 +50,10 @@ class Game(Base):
         SQLEnum(GameType), nullable=False
     )  # 8-ball, 9-ball, etc.
     winner_user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id"), nullable=False
+        Integer, ForeignKey("users.id"), nullable=False, index=True
     )  # Who sank the money ball
     loser_user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id"), nullable=False
+        Integer, ForeignKey("users.id"), nullable=False, index=True
     )  # Who got schooled
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now()
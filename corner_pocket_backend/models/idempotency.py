@@ -0,0 +1,28 @@
+from sqlalchemy import Index, Integer, ForeignKey, String, Text, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+from datetime import datetime
+
+
+class IdempotencyKey(Base):
+    """The stored response to a write made with an ``Idempotency-Key`` header.
+
+    A retried request carrying the same key is answered from this row instead
+    of being run again. Keys are scoped per user; the unique (user_id, key)
+    index makes the lookup a single index probe and turns two concurrent
+    first attempts into one winner and one constraint violation.
+    """
+
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (Index("ix_idempotency_keys_user_id_key", "user_id", "key", unique=True),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    key: Mapped[str] = mapped_column(String(255), nullable=False)
+    # SHA-256 of method, path and body: the same key sent with a different
+    # request is an error, not a replay.
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int] = mapped_column(Integer, nullable=False)
+    response_body: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
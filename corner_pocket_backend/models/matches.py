@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING, List
-from sqlalchemy import Integer, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Index, Integer, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from enum import Enum
 from .base import Base
@@ -15,9 +15,11 @@ class MatchStatus(str, Enum):
     """The status of a match."""
 
     PENDING = "PENDING"  # Creator is adding games, not ready for approval
+    SUBMITTED = "SUBMITTED"  # Waiting for the opponent to approve or decline
     APPROVED = "APPROVED"  # Opponent approved, match is official
     DECLINED = "DECLINED"  # Opponent said "nah, that didn't happen"
     CANCELLED = "CANCELLED"  # Creator cancelled the match
+    VOIDED = "VOIDED"  # Opponent withdrew an approval; no longer counts toward stats
 
 
 class Match(Base):
@@ -29,6 +31,15 @@ class Match(Base):
     """
 
     __tablename__ = "matches"
+    __table_args__ = (
+        # "My matches" listings filter by participant (and often status) and
+        # page by id; one index per participant column serves each side.
+        Index("ix_matches_creator_id_status_id", "creator_id", "status", "id"),
+        Index("ix_matches_opponent_id_status_id", "opponent_id", "status", "id"),
+        # Unfiltered pages (any status) walk these in id order.
+        Index("ix_matches_creator_id_id", "creator_id", "id"),
+        Index("ix_matches_opponent_id_id", "opponent_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     creator_id: Mapped[int] = mapped_column(
@@ -44,13 +55,25 @@ class Match(Base):
         nullable=False,
         default=MatchStatus.PENDING,
     )  # Status of the match
+    # Racks won by each side, kept in step with `games` by MatchesDbService
+    # (atomic increments) so scores and race-to checks need no games scan.
+    creator_score: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    opponent_score: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Bumped by every write to the match or its games; clients send it back
+    # as If-Match so a stale write fails with 412 instead of taking a lock.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"version_id_col": version}
 
     # Relationships give you easy access to related objects
     creator: Mapped["User"] = relationship("User", foreign_keys=[creator_id])
     opponent: Mapped["User"] = relationship("User", foreign_keys=[opponent_id])
     games: Mapped[List["Game"]] = relationship(
-        "Game", back_populates="match"
-    )  # All racks in this match
+        "Game", back_populates="match", order_by="Game.id"
+    )  # All racks in this match, oldest first
     approval: Mapped["Approval"] = relationship(
         "Approval", back_populates="match", uselist=False
     )  # Approval of the match
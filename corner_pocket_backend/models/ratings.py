@@ -0,0 +1,24 @@
+from sqlalchemy import Float, Index, Integer, ForeignKey, text, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+from .games import GameType
+
+
+class Rating(Base):
+    """A player's Elo rating in one game type.
+
+    Moved by `RatingsDbService` once per approved match, and recomputed
+    from the full approved history by `RatingsDbService.recompute` when the
+    rating rules change.
+    """
+
+    __tablename__ = "ratings"
+    __table_args__ = (
+        # Leaderboard loads (top N by rating) and rank counts below the board.
+        Index("ix_ratings_game_type_rating_user_id", "game_type", text("rating DESC"), "user_id"),
+    )
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    game_type: Mapped[GameType] = mapped_column(SQLEnum(GameType), primary_key=True)
+    rating: Mapped[float] = mapped_column(Float, nullable=False)
+    matches_rated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
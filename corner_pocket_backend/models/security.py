@@ -1,15 +1,35 @@
 from typing import Optional
-from sqlalchemy import Integer, ForeignKey, String, DateTime, func
+from sqlalchemy import Index, Integer, ForeignKey, String, DateTime, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 from .base import Base
 from datetime import datetime
 
 
 class RefreshToken(Base):
+    """A refresh token issued to a user.
+
+    Only the SHA-256 digest of the token is stored (see
+    `core.security.hash_token`); the unique index makes lookups by digest a
+    single index probe however large the table grows.
+    """
+
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Reaper batches (`purge_expired_refresh_tokens`): expired tokens by
+        # range, revoked ones from a partial index that skips live tokens.
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+        Index(
+            "ix_refresh_tokens_revoked_at",
+            "revoked_at",
+            postgresql_where=text("revoked_at IS NOT NULL"),
+            sqlite_where=text("revoked_at IS NOT NULL"),
+        ),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
-    token_hash: Mapped[str] = mapped_column(String, nullable=False)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False, index=True
+    )
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,92 @@
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import CheckConstraint, Date, Index, Integer, ForeignKey, DateTime, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+from .games import GameType
+
+
+class UserStats(Base):
+    """A player's record for one game type, over their approved matches.
+
+    Maintained incrementally by `StatsDbService` when a match is approved
+    (and reversed when it is voided), so a stats summary is a primary-key
+    lookup instead of a scan of the player's games. Racks are counted by
+    each game's own type; matches by the match's type.
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    game_type: Mapped[GameType] = mapped_column(SQLEnum(GameType), primary_key=True)
+    matches_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    matches_won: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    matches_lost: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    racks_won: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    racks_lost: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_played_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class HeadToHead(Base):
+    """Two players' record against each other in one game type.
+
+    Each pair is stored once, under its lower user id first, with each
+    side's match wins and racks from the approved matches between them.
+    Maintained by `HeadToHeadDbService` on approval and void, from the
+    matches' running scores, so a "vs" screen is one primary-key lookup.
+    """
+
+    __tablename__ = "head_to_head"
+    __table_args__ = (
+        CheckConstraint("min_user_id < max_user_id", name="ck_head_to_head_user_order"),
+        # Rivals of a player who is the higher id of the pair; the primary key
+        # serves the lower side.
+        Index("ix_head_to_head_max_user_id", "max_user_id"),
+    )
+
+    min_user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    max_user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    game_type: Mapped[GameType] = mapped_column(SQLEnum(GameType), primary_key=True)
+    matches_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    min_user_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_user_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    min_user_racks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_user_racks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class UserDailyStats(Base):
+    """A player's record for one game type on one (UTC) day.
+
+    Each approved match is counted on the day its last rack was played,
+    by `RecentStatsDbService` on approval and void. A "last N days" window
+    is then a primary-key range read of at most N rows per game type.
+    """
+
+    __tablename__ = "user_daily_stats"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    game_type: Mapped[GameType] = mapped_column(SQLEnum(GameType), primary_key=True)
+    matches_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    matches_won: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    matches_lost: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    racks_won: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    racks_lost: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class UserForm(Base):
+    """A player's current form in one game type, in approval order.
+
+    `current_streak` counts consecutive match wins (positive) or losses
+    (negative). `recent_racks` is a bit per rack over the last
+    `recent_rack_count` racks, most recent in bit 0, set for a rack won.
+    """
+
+    __tablename__ = "user_form"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    game_type: Mapped[GameType] = mapped_column(SQLEnum(GameType), primary_key=True)
+    current_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    best_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    recent_racks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    recent_rack_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -5,3 +5,18 @@ class GameType(str, Enum):
     EIGHT_BALL = "EIGHT_BALL"
     NINE_BALL = "NINE_BALL"
     TEN_BALL = "TEN_BALL"
+
+
+class MatchStatus(str, Enum):
+    PENDING = "PENDING"
+    SUBMITTED = "SUBMITTED"
+    APPROVED = "APPROVED"
+    DECLINED = "DECLINED"
+    CANCELLED = "CANCELLED"
+    VOIDED = "VOIDED"
+
+
+class ApprovalStatus(str, Enum):
+    PENDING = "PENDING"
+    APPROVED = "APPROVED"
+    DECLINED = "DECLINED"
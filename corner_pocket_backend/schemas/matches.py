@@ -0,0 +1,91 @@
+"""Response models for match endpoints.
+
+Built from ORM objects with ``from_attributes``. Pydantic compiles each
+model's validator and serializer once, at import time, so per-request work is
+a single `model_validate` plus `model_dump_json`.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from corner_pocket_backend.schemas.common import ApprovalStatus, GameType, MatchStatus
+
+
+class GameOut(BaseModel):
+    """One rack within a match."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    match_id: int
+    game_type: GameType
+    winner_user_id: int
+    loser_user_id: int
+    created_at: Optional[datetime] = None
+
+
+class GameEdit(BaseModel):
+    """New result for an existing game."""
+
+    game_id: int
+    winner_user_id: int
+    loser_user_id: int
+
+
+class ApprovalOut(BaseModel):
+    """The opponent's decision on a submitted match."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    approver_user_id: int
+    status: ApprovalStatus
+    note: Optional[str] = None
+    decided_at: Optional[datetime] = None
+
+
+class MatchSummary(BaseModel):
+    """A match and its running score, without games."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    creator_id: int
+    opponent_id: int
+    game_type: GameType
+    race_to: int
+    status: MatchStatus
+    creator_score: int
+    opponent_score: int
+    version: int
+
+
+class MatchDetail(MatchSummary):
+    """A match with its games (oldest first) and approval, if any."""
+
+    games: List[GameOut]
+    approval: Optional[ApprovalOut] = None
+
+
+class GameAdded(BaseModel):
+    """The recorded game and the match after it (score, possibly submitted)."""
+
+    game: GameOut
+    match: MatchSummary
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one match of a batch: what was recorded, or why not."""
+
+    index: int
+    status_code: int
+    match: Optional[MatchSummary] = None
+    games: List[GameOut] = []
+    error: Optional[str] = None
+
+
+class MatchBatchResult(BaseModel):
+    """Per-match results of a batch, in request order."""
+
+    results: List[BatchItemResult]
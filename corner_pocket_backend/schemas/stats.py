@@ -0,0 +1,168 @@
+"""Response models for stats endpoints."""
+
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from corner_pocket_backend.schemas.common import GameType
+
+
+class GameTypeStats(BaseModel):
+    """A player's record in one game type."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    game_type: GameType
+    matches_played: int
+    matches_won: int
+    matches_lost: int
+    racks_won: int
+    racks_lost: int
+    last_played_at: Optional[datetime] = None
+
+
+class StatsSummary(BaseModel):
+    """A player's record over approved matches, overall and by game type."""
+
+    user_id: int
+    matches_played: int
+    matches_won: int
+    matches_lost: int
+    racks_won: int
+    racks_lost: int
+    by_game_type: List[GameTypeStats]
+
+
+class StatsDrift(BaseModel):
+    """A `user_stats` row whose counters differ from the live aggregate."""
+
+    user_id: int
+    game_type: GameType
+    live: Dict[str, int]
+    materialized: Dict[str, int]
+
+
+class GameTypeRating(BaseModel):
+    """A player's Elo rating in one game type."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    game_type: GameType
+    rating: float
+    matches_rated: int
+
+
+class PlayerRatings(BaseModel):
+    """A player's ratings by game type."""
+
+    user_id: int
+    ratings: List[GameTypeRating]
+
+
+class LeaderboardEntry(BaseModel):
+    """One ranked player."""
+
+    rank: int
+    user_id: int
+    handle: str
+    display_name: str
+    rating: float
+
+
+class Leaderboard(BaseModel):
+    """A page of the rating leaderboard for one game type, plus the caller's own rank.
+
+    `me` is None when the caller has no rating in the game type.
+    """
+
+    game_type: GameType
+    entries: List[LeaderboardEntry]
+    me: Optional[LeaderboardEntry] = None
+
+
+class HeadToHeadRecord(BaseModel):
+    """A player's record against one opponent in one game type."""
+
+    game_type: GameType
+    matches_played: int
+    matches_won: int
+    matches_lost: int
+    racks_won: int
+    racks_lost: int
+
+
+class HeadToHead(BaseModel):
+    """A player's record against one opponent, overall and by game type."""
+
+    user_id: int
+    opponent_id: int
+    matches_played: int
+    matches_won: int
+    matches_lost: int
+    racks_won: int
+    racks_lost: int
+    by_game_type: List[HeadToHeadRecord]
+
+
+class Rival(BaseModel):
+    """An opponent and the player's record against them."""
+
+    user_id: int
+    handle: str
+    display_name: str
+    matches_played: int
+    matches_won: int
+    matches_lost: int
+    racks_won: int
+    racks_lost: int
+
+
+class Rivals(BaseModel):
+    """A player's most-played opponents, most matches first.
+
+    `game_type` is None when the records span every game type.
+    """
+
+    user_id: int
+    game_type: Optional[GameType] = None
+    rivals: List[Rival]
+
+
+class WindowStats(BaseModel):
+    """A player's record over approved matches played in the last `days` days.
+
+    `since` is the first day counted; today is the last.
+    """
+
+    user_id: int
+    days: int
+    since: date
+    matches_played: int
+    matches_won: int
+    matches_lost: int
+    racks_won: int
+    racks_lost: int
+    by_game_type: List[GameTypeStats]
+
+
+class GameTypeForm(BaseModel):
+    """A player's current form in one game type.
+
+    `current_streak` is consecutive match wins (positive) or losses
+    (negative). `recent_racks` is the last racks played, most recent first,
+    as W and L.
+    """
+
+    game_type: GameType
+    current_streak: int
+    best_streak: int
+    recent_racks: str
+    recent_racks_won: int
+
+
+class PlayerForm(BaseModel):
+    """A player's streaks and recent racks by game type."""
+
+    user_id: int
+    by_game_type: List[GameTypeForm]
@@ -0,0 +1,37 @@
+"""Response models for the change feed (``GET /sync``)."""
+
+from typing import List
+
+from pydantic import BaseModel
+
+from corner_pocket_backend.schemas.matches import ApprovalOut, GameOut, MatchSummary
+
+
+class ApprovalChange(ApprovalOut):
+    """An approval as synced on its own, keyed by id and match."""
+
+    id: int
+    match_id: int
+
+
+class Tombstone(BaseModel):
+    """A row the client should drop: ``entity`` is MATCH, GAME or APPROVAL."""
+
+    entity: str
+    id: int
+
+
+class SyncPage(BaseModel):
+    """Current state of the rows that changed after `since`, plus deletions.
+
+    Pass `next_since` as `since` on the next call; keep paging while
+    `has_more` is true.
+    """
+
+    since: int
+    next_since: int
+    has_more: bool
+    matches: List[MatchSummary]
+    games: List[GameOut]
+    approvals: List[ApprovalChange]
+    deleted: List[Tombstone]
@@ -1,5 +1,20 @@
-from .matches import MatchesDbService
+from .matches import MatchesDbService, AsyncMatchesDbService
 from .games import GamesDbService
-from .users import UsersDbService
+from .head_to_head import HeadToHeadDbService
+from .ratings import RatingsDbService
+from .recent import RecentStatsDbService
+from .stats import StatsDbService, StatsService
+from .users import UsersDbService, AsyncUsersDbService
 
-__all__ = ["MatchesDbService", "GamesDbService", "UsersDbService"]
+__all__ = [
+    "MatchesDbService",
+    "AsyncMatchesDbService",
+    "GamesDbService",
+    "HeadToHeadDbService",
+    "RatingsDbService",
+    "RecentStatsDbService",
+    "StatsDbService",
+    "StatsService",
+    "UsersDbService",
+    "AsyncUsersDbService",
+]
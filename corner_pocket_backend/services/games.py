@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from corner_pocket_backend.models import Match, Game, GameType
@@ -41,6 +42,29 @@ class GamesDbService:
         self.db.flush()
         return game
 
+    def insert_games(self, match_id: int, games: List[Dict[str, Any]]) -> List[Game]:
+        """Insert many games for one match in a single INSERT ... RETURNING.
+
+        No validation is done here; callers (``MatchesDbService.add_games``)
+        check the match and participants once for the whole batch.
+
+        Args:
+            match_id: Match the games belong to.
+            games: Column values per game: ``winner_user_id``,
+                ``loser_user_id`` and ``game_type``.
+
+        Returns:
+            The inserted games ordered by id, which follows input order: ids
+            come from the sequence as the VALUES rows are inserted.
+        """
+        if not games:
+            return []
+        rows = [{**g, "match_id": match_id} for g in games]
+        # Not sort_by_parameter_order: dialects without an insert sentinel
+        # (SQLite) would fall back to one statement per row.
+        inserted = self.db.scalars(insert(Game).returning(Game), rows)
+        return sorted(inserted, key=lambda g: g.id)
+
     def delete_game(self, game_id: int) -> None:
         """Delete a game from the database.
 
@@ -0,0 +1,204 @@
+"""Head-to-head records.
+
+`HeadToHeadDbService` keeps the `head_to_head` aggregate in step with
+approved matches: `MatchesDbService` applies each match when it is approved
+and reverses it when it is voided, in the same transaction. A pair of
+players is stored once, lower user id first, so a "vs" screen is one
+primary-key range read and a player's rivals are two indexed reads, with no
+scan of `matches` or `games`.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import case, delete, func, insert, select, union_all
+from sqlalchemy.orm import Session
+
+from corner_pocket_backend.core.db import upsert
+from corner_pocket_backend.models import GameType, HeadToHead, Match, MatchStatus, User
+from corner_pocket_backend.schemas.common import GameType as GameTypeSchema
+from corner_pocket_backend.schemas.stats import HeadToHead as HeadToHeadSchema
+from corner_pocket_backend.schemas.stats import HeadToHeadRecord, Rival, Rivals
+from corner_pocket_backend.services.stats_cache import invalidate_stats
+
+COUNTERS = (
+    "matches_played",
+    "min_user_wins",
+    "max_user_wins",
+    "min_user_racks",
+    "max_user_racks",
+)
+RECORD = ("matches_played", "matches_won", "matches_lost", "racks_won", "racks_lost")
+
+MAX_RIVALS_LIMIT = 50
+
+
+class HeadToHeadDbService:
+    """Materialized records between pairs of players (`head_to_head`)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def head_to_head(self, user_id: int, opponent_id: int) -> HeadToHeadSchema:
+        """`user_id`'s record against `opponent_id`, overall and by game type.
+
+        Raises:
+            ValueError: If both ids are the same player.
+        """
+        if user_id == opponent_id:
+            raise ValueError("a player has no head-to-head record against themselves")
+        low = user_id < opponent_id
+        rows = self.db.scalars(
+            select(HeadToHead)
+            .where(
+                HeadToHead.min_user_id == min(user_id, opponent_id),
+                HeadToHead.max_user_id == max(user_id, opponent_id),
+                HeadToHead.matches_played > 0,
+            )
+            .order_by(HeadToHead.game_type)
+            .execution_options(populate_existing=True)
+        ).all()
+        by_type = [
+            HeadToHeadRecord(
+                game_type=GameTypeSchema(r.game_type.value),
+                matches_played=r.matches_played,
+                matches_won=r.min_user_wins if low else r.max_user_wins,
+                matches_lost=r.max_user_wins if low else r.min_user_wins,
+                racks_won=r.min_user_racks if low else r.max_user_racks,
+                racks_lost=r.max_user_racks if low else r.min_user_racks,
+            )
+            for r in rows
+        ]
+        totals = {c: sum(getattr(r, c) for r in by_type) for c in RECORD}
+        return HeadToHeadSchema(
+            user_id=user_id, opponent_id=opponent_id, by_game_type=by_type, **totals
+        )
+
+    def rivals(self, user_id: int, game_type: Optional[GameType] = None, limit: int = 10) -> Rivals:
+        """`user_id`'s most-played opponents and the record against each.
+
+        Reads the pairs where the player is the lower id (primary key) and
+        the higher id (`ix_head_to_head_max_user_id`) as two branches of a
+        UNION ALL, flipped to the player's side, and sums them per opponent.
+
+        Args:
+            user_id: The player.
+            game_type: Only count matches of this type; all types when omitted.
+            limit: Number of rivals, 1 to MAX_RIVALS_LIMIT.
+
+        Raises:
+            ValueError: If `limit` is out of range.
+        """
+        if not 1 <= limit <= MAX_RIVALS_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_RIVALS_LIMIT}")
+
+        def side(me: Any, rival: Any, prefix: str, other: str) -> Any:
+            q = select(
+                rival.label("rival_id"),
+                HeadToHead.matches_played.label("matches_played"),
+                getattr(HeadToHead, f"{prefix}_user_wins").label("matches_won"),
+                getattr(HeadToHead, f"{other}_user_wins").label("matches_lost"),
+                getattr(HeadToHead, f"{prefix}_user_racks").label("racks_won"),
+                getattr(HeadToHead, f"{other}_user_racks").label("racks_lost"),
+            ).where(me == user_id)
+            if game_type is not None:
+                q = q.where(HeadToHead.game_type == game_type)
+            return q
+
+        pairs = union_all(
+            side(HeadToHead.min_user_id, HeadToHead.max_user_id, "min", "max"),
+            side(HeadToHead.max_user_id, HeadToHead.min_user_id, "max", "min"),
+        ).subquery()
+        played = func.sum(pairs.c.matches_played)
+        rows = self.db.execute(
+            select(
+                pairs.c.rival_id,
+                User.handle,
+                User.display_name,
+                *(func.sum(pairs.c[c]).label(c) for c in RECORD),
+            )
+            .join(User, User.id == pairs.c.rival_id)
+            .group_by(pairs.c.rival_id, User.handle, User.display_name)
+            .having(played > 0)
+            .order_by(played.desc(), pairs.c.rival_id)
+            .limit(limit)
+        ).all()
+        return Rivals(
+            user_id=user_id,
+            game_type=GameTypeSchema(game_type.value) if game_type is not None else None,
+            rivals=[
+                Rival(
+                    user_id=r.rival_id,
+                    handle=r.handle,
+                    display_name=r.display_name,
+                    **{c: r._mapping[c] for c in RECORD},
+                )
+                for r in rows
+            ],
+        )
+
+    def apply_match(self, m: Match, sign: int = 1) -> None:
+        """Add an approved match to its pair's record (`sign=-1` removes it).
+
+        Uses the match's running scores, so no games are read; one upsert
+        adds the deltas to the existing row.
+        """
+        low, high = m.creator_score, m.opponent_score
+        if m.creator_id > m.opponent_id:
+            low, high = high, low
+        upsert(
+            self.db,
+            HeadToHead,
+            ["min_user_id", "max_user_id", "game_type"],
+            [
+                {
+                    "min_user_id": min(m.creator_id, m.opponent_id),
+                    "max_user_id": max(m.creator_id, m.opponent_id),
+                    "game_type": m.game_type,
+                    "matches_played": sign,
+                    "min_user_wins": sign * (low > high),
+                    "max_user_wins": sign * (high > low),
+                    "min_user_racks": sign * low,
+                    "max_user_racks": sign * high,
+                }
+            ],
+            increments=COUNTERS,
+        )
+
+    def rebuild(self) -> int:
+        """Recompute `head_to_head` from all approved matches in SQL.
+
+        For backfills and repairs; the regular path is `apply_match`.
+
+        Returns:
+            Number of pair rows written.
+        """
+        creator_low = Match.creator_id < Match.opponent_id
+        low_score = case((creator_low, Match.creator_score), else_=Match.opponent_score)
+        high_score = case((creator_low, Match.opponent_score), else_=Match.creator_score)
+        min_user = case((creator_low, Match.creator_id), else_=Match.opponent_id)
+        max_user = case((creator_low, Match.opponent_id), else_=Match.creator_id)
+
+        def wins(won: Any) -> Any:
+            return func.sum(case((won, 1), else_=0))
+
+        self.db.execute(delete(HeadToHead))
+        invalidate_stats(self.db)
+        result = self.db.execute(
+            insert(HeadToHead).from_select(
+                ["min_user_id", "max_user_id", "game_type", *COUNTERS],
+                select(
+                    min_user,
+                    max_user,
+                    Match.game_type,
+                    func.count(),
+                    wins(low_score > high_score),
+                    wins(high_score > low_score),
+                    func.sum(low_score),
+                    func.sum(high_score),
+                )
+                .where(Match.status == MatchStatus.APPROVED)
+                .group_by(min_user, max_user, Match.game_type),
+            )
+        )
+        self.db.expire_all()
+        return result.rowcount or 0  # type: ignore[attr-defined]
@@ -0,0 +1,171 @@
+import hashlib
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, TypeVar
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from corner_pocket_backend.models.idempotency import IdempotencyKey
+
+T = TypeVar("T")
+
+
+class IdempotencyKeyMismatch(ValueError):
+    """The key was already used by the same user for a different request."""
+
+
+def hash_request(method: str, path: str, body: str) -> str:
+    """Fingerprint of a request, compared when a key is presented again."""
+    return hashlib.sha256(f"{method} {path}\n{body}".encode()).hexdigest()
+
+
+class IdempotencyDbService:
+    """Store and look up responses to writes retried with an Idempotency-Key.
+
+    The route looks the key up before doing any work and, on a miss, records
+    the response in the same transaction as the write it describes, so a
+    stored key always means the write committed.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def lookup(self, user_id: int, key: str, request_hash: str) -> Optional[IdempotencyKey]:
+        """Return the stored response for a live key, or None if it is unused.
+
+        An expired row is deleted so the key can be used again.
+
+        Raises:
+            IdempotencyKeyMismatch: If the key was used for a different request.
+        """
+        row = self.db.scalars(
+            select(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id, IdempotencyKey.key == key
+            )
+        ).one_or_none()
+        if row is None:
+            return None
+        if row.expires_at <= datetime.utcnow():
+            self.db.delete(row)
+            self.db.flush()
+            return None
+        if row.request_hash != request_hash:
+            raise IdempotencyKeyMismatch("Idempotency-Key was already used for a different request")
+        return row
+
+    def remember(
+        self,
+        user_id: int,
+        key: str,
+        request_hash: str,
+        status_code: int,
+        response_body: str,
+        ttl: timedelta,
+    ) -> IdempotencyKey:
+        """Record the response to a write under `key`; the caller commits.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: If a concurrent request stored the
+                same key first (from the flush).
+        """
+        row = IdempotencyKey(
+            user_id=user_id,
+            key=key,
+            request_hash=request_hash,
+            status_code=status_code,
+            response_body=response_body,
+            expires_at=datetime.utcnow() + ttl,
+        )
+        self.db.add(row)
+        self.db.flush()
+        return row
+
+    def purge_expired(
+        self, batch_size: int = 1000, max_batches: Optional[int] = None
+    ) -> Dict[str, float]:
+        """Delete expired keys in bounded batches, committing after each.
+
+        Args:
+            batch_size: Rows deleted per statement/transaction.
+            max_batches: Stop after this many batches (None drains everything).
+
+        Returns:
+            ``deleted`` rows, ``batches`` run and ``elapsed_ms``.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        started = time.perf_counter()
+        now = datetime.utcnow()
+        deleted = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            ids = (
+                select(IdempotencyKey.id)
+                .where(IdempotencyKey.expires_at <= now)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = self.db.execute(
+                delete(IdempotencyKey)
+                .where(IdempotencyKey.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            batches += 1
+            removed = result.rowcount or 0  # type: ignore[attr-defined]
+            deleted += removed
+            if removed < batch_size:
+                break
+        return {
+            "deleted": deleted,
+            "batches": batches,
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }
+
+
+class AsyncIdempotencyDbService:
+    """Asyncio counterpart of `IdempotencyDbService`.
+
+    Methods run the synchronous implementation through `AsyncSession.run_sync`.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, fn: Callable[[IdempotencyDbService], T]) -> T:
+        return await self.db.run_sync(lambda session: fn(IdempotencyDbService(session)))
+
+    async def lookup(self, user_id: int, key: str, request_hash: str) -> Optional[IdempotencyKey]:
+        """See `IdempotencyDbService.lookup`."""
+        return await self._run(
+            lambda svc: svc.lookup(user_id=user_id, key=key, request_hash=request_hash)
+        )
+
+    async def remember(
+        self,
+        user_id: int,
+        key: str,
+        request_hash: str,
+        status_code: int,
+        response_body: str,
+        ttl: timedelta,
+    ) -> IdempotencyKey:
+        """See `IdempotencyDbService.remember`."""
+        return await self._run(
+            lambda svc: svc.remember(
+                user_id=user_id,
+                key=key,
+                request_hash=request_hash,
+                status_code=status_code,
+                response_body=response_body,
+                ttl=ttl,
+            )
+        )
+
+    async def purge_expired(
+        self, batch_size: int = 1000, max_batches: Optional[int] = None
+    ) -> Dict[str, float]:
+        """See `IdempotencyDbService.purge_expired`."""
+        return await self._run(
+            lambda svc: svc.purge_expired(batch_size=batch_size, max_batches=max_batches)
+        )
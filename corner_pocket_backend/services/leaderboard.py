@@ -0,0 +1,189 @@
+"""Rating leaderboards.
+
+Each worker process holds one `SortedIndex` per game type with the top
+`LEADERBOARD_MAX_SIZE` ratings, so a leaderboard page or a player's rank is
+a binary search instead of an ORDER BY over every rating. Boards are loaded
+at startup (or on first use), updated in place when a new rating commits,
+and periodically compared with the `ratings` table by `check`; a board that
+disagrees, say because another worker rated a match, is reloaded.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import on_commit
+from corner_pocket_backend.core.leaderboard import SortedIndex
+from corner_pocket_backend.core.metrics import registry
+from corner_pocket_backend.models import GameType, Rating, User
+from corner_pocket_backend.schemas.common import GameType as GameTypeSchema
+from corner_pocket_backend.schemas.stats import Leaderboard, LeaderboardEntry
+
+MAX_LEADERBOARD_LIMIT = 100
+
+leaderboards: Dict[GameType, SortedIndex] = {
+    t: SortedIndex(max_size=settings.LEADERBOARD_MAX_SIZE) for t in GameType
+}
+registry.register(
+    "leaderboards",
+    lambda: {
+        f"{t.value.lower()}_{k}": v
+        for t, board in leaderboards.items()
+        for k, v in board.stats().items()
+    },
+)
+
+
+def record_ratings(db: Session, game_type: GameType, ratings: Dict[int, float]) -> None:
+    """Move players on this worker's leaderboard once `db` commits their new ratings."""
+    board = leaderboards[game_type]
+
+    def apply() -> None:
+        # An unloaded board reads the committed ratings when it loads.
+        if board.loaded:
+            for user_id, rating in ratings.items():
+                board.update(user_id, rating)
+
+    on_commit(db, apply)
+
+
+def reset_leaderboards(db: Session, game_type: Optional[GameType] = None) -> None:
+    """Drop the `game_type` board (all boards when None) once `db` commits, e.g. after a re-rate."""
+
+    def clear() -> None:
+        for t, board in leaderboards.items():
+            if game_type is None or t == game_type:
+                board.clear()
+
+    on_commit(db, clear)
+
+
+class LeaderboardDbService:
+    """Serve leaderboards from the in-memory boards, loading them from `ratings`."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def leaderboard(
+        self, game_type: GameType, user_id: int, limit: int = 20, offset: int = 0
+    ) -> Leaderboard:
+        """A page of the top ratings in `game_type` and `user_id`'s own rank.
+
+        Only the top `LEADERBOARD_MAX_SIZE` players are held, so pages past
+        them are empty. The player's own rank comes from the board when they
+        are on it and from a count over the ratings index when they are not.
+
+        Raises:
+            ValueError: If `limit` or `offset` is out of range.
+        """
+        if not 1 <= limit <= MAX_LEADERBOARD_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_LEADERBOARD_LIMIT}")
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        board = self._board(game_type)
+        ranked = board.top(limit, offset)
+        mine = board.rank(user_id)
+        if mine is None and board.floor is not None:
+            mine = self._rank_below_board(game_type, user_id)
+        me = [(mine[0], user_id, mine[1])] if mine is not None else []
+        entries = self._entries(ranked + me)
+        return Leaderboard(
+            game_type=GameTypeSchema(game_type.value),
+            entries=entries[: len(ranked)],
+            me=entries[-1] if me else None,
+        )
+
+    def load(self, game_type: GameType) -> int:
+        """(Re)load one board with the top ratings; returns the number held."""
+        board = leaderboards[game_type]
+        rows = (
+            self.db.execute(
+                select(Rating.user_id, Rating.rating)
+                .where(Rating.game_type == game_type)
+                .order_by(Rating.rating.desc(), Rating.user_id)
+                .limit(board.max_size + 1)
+            )
+            .tuples()
+            .all()
+        )
+        board.load(rows[: board.max_size], complete=len(rows) <= board.max_size)
+        return len(board)
+
+    def check(self) -> List[GameType]:
+        """Reload every loaded board whose contents differ from `ratings`.
+
+        Compares the count and sum of ratings held with the same aggregate
+        over the rows ranked at or above the board's floor, one query per
+        board.
+
+        Returns:
+            Game types whose board was reloaded.
+        """
+        reloaded = []
+        for game_type, board in leaderboards.items():
+            if not board.loaded:
+                continue
+            query = select(func.count(), func.coalesce(func.sum(Rating.rating), 0.0)).where(
+                Rating.game_type == game_type
+            )
+            if board.floor is not None:
+                neg_score, floor_id = board.floor
+                query = query.where(
+                    or_(
+                        Rating.rating > -neg_score,
+                        and_(Rating.rating == -neg_score, Rating.user_id <= floor_id),
+                    )
+                )
+            count, total = self.db.execute(query).one()
+            held_count, held_total = board.fingerprint()
+            if count != held_count or not math.isclose(total, held_total, abs_tol=1e-6):
+                self.load(game_type)
+                reloaded.append(game_type)
+        return reloaded
+
+    def _board(self, game_type: GameType) -> SortedIndex:
+        board = leaderboards[game_type]
+        if not board.loaded or board.stale:
+            self.load(game_type)
+        return board
+
+    def _rank_below_board(self, game_type: GameType, user_id: int) -> Optional[Tuple[int, float]]:
+        rating = self.db.scalar(
+            select(Rating.rating).where(Rating.user_id == user_id, Rating.game_type == game_type)
+        )
+        if rating is None:
+            return None
+        ahead = self.db.scalar(
+            select(func.count()).where(
+                Rating.game_type == game_type,
+                or_(
+                    Rating.rating > rating,
+                    and_(Rating.rating == rating, Rating.user_id < user_id),
+                ),
+            )
+        )
+        return (ahead or 0) + 1, rating
+
+    def _entries(self, ranked: List[Tuple[int, int, float]]) -> List[LeaderboardEntry]:
+        """Attach handles and names to (rank, user_id, rating) with one users query."""
+        if not ranked:
+            return []
+        users = {
+            u.id: u
+            for u in self.db.scalars(
+                select(User).where(User.id.in_({user_id for _, user_id, _ in ranked}))
+            )
+        }
+        return [
+            LeaderboardEntry(
+                rank=rank,
+                user_id=user_id,
+                handle=users[user_id].handle,
+                display_name=users[user_id].display_name,
+                rating=rating,
+            )
+            for rank, user_id, rating in ranked
+        ]
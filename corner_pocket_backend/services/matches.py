@@ -1,9 +1,80 @@
-from typing import List, Optional, Dict, Any
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Dict, Any, Tuple, TypeVar
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, case, delete, func, or_, select, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, joinedload
 
-from corner_pocket_backend.models import Match, Game, MatchStatus, GameType
+from corner_pocket_backend.models import (
+    Approval,
+    ApprovalStatus,
+    Change,
+    ChangeEntity,
+    ChangeOp,
+    Match,
+    Game,
+    MatchStatus,
+    GameType,
+    User,
+)
+from corner_pocket_backend.schemas.matches import GameEdit, MatchDetail
 from corner_pocket_backend.services.games import GamesDbService
+from corner_pocket_backend.services.head_to_head import HeadToHeadDbService
+from corner_pocket_backend.services.ratings import RatingsDbService
+from corner_pocket_backend.services.recent import RecentStatsDbService
+from corner_pocket_backend.services.stats import StatsDbService
+from corner_pocket_backend.services.stats_cache import invalidate_stats
+from corner_pocket_backend.services.sync import mark_unstamped
+
+T = TypeVar("T")
+
+MAX_PAGE_SIZE = 100
+
+# action -> (who may perform it, statuses it is allowed from, resulting status)
+TRANSITIONS: Dict[str, Tuple[str, Tuple[MatchStatus, ...], MatchStatus]] = {
+    "submit": ("creator", (MatchStatus.PENDING,), MatchStatus.SUBMITTED),
+    "approve": ("opponent", (MatchStatus.SUBMITTED,), MatchStatus.APPROVED),
+    "decline": ("opponent", (MatchStatus.SUBMITTED,), MatchStatus.DECLINED),
+    "cancel": ("creator", (MatchStatus.PENDING, MatchStatus.SUBMITTED), MatchStatus.CANCELLED),
+    "void": ("opponent", (MatchStatus.APPROVED,), MatchStatus.VOIDED),
+}
+
+
+class MatchNotFound(ValueError):
+    """The match does not exist."""
+
+
+class MatchStateConflict(ValueError):
+    """The match's current status does not allow the requested change."""
+
+
+class MatchVersionConflict(ValueError):
+    """The match changed since the version the caller last read."""
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the keyset position after `last_id` as an opaque cursor."""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor from `encode_cursor` back to the last seen match id.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        last_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ValueError("invalid cursor")
+    if not isinstance(last_id, int):
+        raise ValueError("invalid cursor")
+    return last_id
 
 
 class MatchesDbService:
@@ -17,6 +88,10 @@ class MatchesDbService:
         """Initialize the service with a database session."""
         self.db = db
         self.game_svc = GamesDbService(db=db)
+        self.stats_svc = StatsDbService(db=db)
+        self.ratings_svc = RatingsDbService(db=db)
+        self.head_to_head_svc = HeadToHeadDbService(db=db)
+        self.recent_svc = RecentStatsDbService(db=db)
 
     def list_matches(
         self,
@@ -58,34 +133,116 @@ class MatchesDbService:
         matches: List[Match] = q.order_by(Match.id.desc()).all()
         return [self._serialize_match(m) for m in matches]
 
+    def list_matches_page(
+        self,
+        user_id: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        status: Optional[MatchStatus] = None,
+        game_type: Optional[GameType] = None,
+    ) -> Dict[str, Any]:
+        """List matches newest first, one keyset page at a time.
+
+        Pages are keyed on `Match.id` (``id < last seen id``) rather than an
+        offset, so every page costs one bounded index range scan no matter how
+        many matches the user has played. For a participant, the creator and
+        opponent sides are read as two index-ordered, limited branches of a
+        UNION ALL instead of a single OR that would defeat the indexes.
+
+        Args:
+            user_id: Restrict to matches this user created or was challenged in.
+                None lists all matches.
+            limit: Page size, 1 to MAX_PAGE_SIZE.
+            cursor: `next_cursor` from the previous page; None for the first page.
+            status: Optional status filter.
+            game_type: Optional game type filter.
+
+        Returns:
+            ``items`` (serialized matches) and ``next_cursor``, which is None on
+            the last page.
+
+        Raises:
+            ValueError: If `limit` is out of range or `cursor` is malformed.
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        before_id = decode_cursor(cursor) if cursor is not None else None
+
+        def branch(*criteria: Any) -> "Select[tuple[Match]]":
+            q = select(Match).where(*criteria)
+            if before_id is not None:
+                q = q.where(Match.id < before_id)
+            if status is not None:
+                q = q.where(Match.status == status)
+            if game_type is not None:
+                q = q.where(Match.game_type == game_type)
+            # Fetch one extra row to learn whether another page exists.
+            return q.order_by(Match.id.desc()).limit(limit + 1)
+
+        if user_id is None:
+            stmt = branch()
+        else:
+            sides = union_all(
+                select(branch(Match.creator_id == user_id).subquery()),
+                select(
+                    branch(Match.opponent_id == user_id, Match.creator_id != user_id).subquery()
+                ),
+            ).subquery()
+            page_match = aliased(Match, sides)
+            stmt = select(page_match).order_by(page_match.id.desc()).limit(limit + 1)
+
+        matches: List[Match] = list(self.db.scalars(stmt))
+        has_more = len(matches) > limit
+        matches = matches[:limit]
+        return {
+            "items": [self._serialize_match(m) for m in matches],
+            "next_cursor": encode_cursor(matches[-1].id) if has_more else None,
+        }
+
     def get_match(self, user_id: int, match_id: int) -> Optional[Dict[str, Any]]:
         """Fetch a single match with related games if the user participates."""
-        m = self.db.query(Match).filter(Match.id == match_id).first()
-        if not m:
-            return None
-        if user_id not in (m.creator_id, m.opponent_id):
+        detail = self.get_match_detail(user_id=user_id, match_id=match_id)
+        if detail is None:
             return None
+        return detail.model_dump(mode="json")
+
+    def get_match_detail(self, user_id: int, match_id: int) -> Optional[MatchDetail]:
+        """Fetch a match with its games and approval in one round trip.
 
-        result = self._serialize_match(m)
-        # attach games
-        games: List[Game] = (
-            self.db.query(Game).filter(Game.match_id == m.id).order_by(Game.id.asc()).all()
-        )
-        result["games"] = [
-            {
-                "id": g.id,
-                "match_id": g.match_id,
-                "game_type": g.game_type.value,
-                "winner_user_id": g.winner_user_id,
-                "loser_user_id": g.loser_user_id,
-                "created_at": g.created_at.isoformat() if g.created_at else None,
-            }
-            for g in games
-        ]
-        return result
+        Games and approval are joined into the match query (LEFT OUTER JOIN)
+        rather than lazy-loaded, so this is a single SELECT however many games
+        the match has.
+
+        Returns:
+            The match detail, or None if the match does not exist or the user
+            is not a participant.
+        """
+        m = (
+            self.db.execute(
+                select(Match)
+                .where(Match.id == match_id)
+                .options(joinedload(Match.games), joinedload(Match.approval))
+            )
+            .unique()
+            .scalar_one_or_none()
+        )
+        if m is None or user_id not in (m.creator_id, m.opponent_id):
+            return None
+        return MatchDetail.model_validate(m)
 
     def add_match(self, user_id: int, opponent_id: int, game_type: GameType, race_to: int) -> Match:
-        """Add a new match to the database."""
+        """Add a new match to the database.
+
+        Raises:
+            ValueError: If the opponent is the creator or does not exist, or
+                `race_to` is not positive.
+        """
+        if opponent_id == user_id:
+            raise ValueError("cannot play against yourself")
+        if race_to < 1:
+            raise ValueError("race_to must be positive")
+        if self.db.get(User, opponent_id) is None:
+            raise ValueError("opponent not found")
         new_m = Match(
             creator_id=user_id,
             opponent_id=opponent_id,
@@ -95,22 +252,88 @@ class MatchesDbService:
         )
         self.db.add(new_m)
         self.db.flush()
+        self._record(new_m, ChangeEntity.MATCH, [new_m.id])
         return new_m
 
+    def record_match(
+        self,
+        user_id: int,
+        opponent_id: int,
+        game_type: GameType,
+        race_to: int,
+        winner_user_ids: List[int],
+        submit: bool = False,
+    ) -> Tuple[Match, List[Game]]:
+        """Create a match together with its games, in order, and optionally submit it.
+
+        For clients that score a session offline and sync it afterwards: the
+        match insert, one bulk games insert and the score update run in the
+        caller's transaction. A game that reaches `race_to` submits the match
+        as usual; `submit` also submits one that ended short of it.
+
+        Raises:
+            ValueError: If the match or any game is invalid (nothing is written
+                by this call, provided the caller rolls back).
+        """
+        m = self.add_match(
+            user_id=user_id, opponent_id=opponent_id, game_type=game_type, race_to=race_to
+        )
+        games: List[Game] = []
+        if winner_user_ids:
+            games = self.add_games(
+                user_id=user_id,
+                match_id=m.id,
+                games=[
+                    Game(
+                        winner_user_id=winner,
+                        loser_user_id=opponent_id if winner == user_id else user_id,
+                        game_type=game_type,
+                    )
+                    for winner in winner_user_ids
+                ],
+            )
+        if submit and m.status == MatchStatus.PENDING:
+            m = self.submit(user_id=user_id, match_id=m.id)
+        return m, games
+
     def delete_match(self, user_id: int, match_id: int) -> Match:
-        """Delete a match from the database.
+        """Delete a match together with its games and approval.
+
+        The children go first, one DELETE ... RETURNING each, and every
+        removed row gets a tombstone in the change feed. The match itself is
+        deleted by a DELETE conditional on its status, so a concurrent
+        approval cannot slip in between the check and the delete. Approved
+        matches count toward stats and ratings and must be voided first.
 
         Raises:
-            ValueError: If match not found.
+            MatchNotFound: If match not found.
             PermissionError: If user is not a participant.
+            MatchStateConflict: If the match is APPROVED.
         """
-        m = self.db.query(Match).filter(Match.id == match_id).first()
+        m = self.db.get(Match, match_id)
         if not m:
-            raise ValueError("match not found")
+            raise MatchNotFound("match not found")
         if user_id not in (m.creator_id, m.opponent_id):
             raise PermissionError("not a participant")
-        self.db.delete(m)
-        self.db.flush()
+        if m.status == MatchStatus.APPROVED:
+            raise MatchStateConflict("cannot delete an APPROVED match; void it first")
+
+        games = self.db.scalars(delete(Game).where(Game.match_id == m.id).returning(Game.id)).all()
+        approvals = self.db.scalars(
+            delete(Approval).where(Approval.match_id == m.id).returning(Approval.id)
+        ).all()
+        deleted = self.db.scalars(
+            delete(Match)
+            .where(Match.id == m.id, Match.status != MatchStatus.APPROVED)
+            .returning(Match.id)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if deleted is None:
+            raise MatchStateConflict("cannot delete an APPROVED match; void it first")
+        self.db.expunge(m)
+        self._record(m, ChangeEntity.GAME, games, ChangeOp.DELETE)
+        self._record(m, ChangeEntity.APPROVAL, approvals, ChangeOp.DELETE)
+        self._record(m, ChangeEntity.MATCH, [m.id], ChangeOp.DELETE)
         return m
 
     def add_game(
@@ -120,59 +343,118 @@ class MatchesDbService:
         loser_user_id: int,
         game_type: GameType,
         acting_user_id: int,
+        expected_version: Optional[int] = None,
     ) -> Game:
         """Append a game result to a pending match.
 
+        A game that brings either side to `race_to` submits the match for
+        approval.
+
         Raises:
-            ValueError: If match not found, not PENDING, or invalid game data.
+            MatchNotFound: If match not found.
+            MatchStateConflict: If the match is not PENDING.
+            MatchVersionConflict: If `expected_version` is not the current one.
+            ValueError: If invalid game data.
             PermissionError: If acting user is not a participant.
         """
         m = self.db.get(Match, match_id)
         if not m:
-            raise ValueError("match not found")
+            raise MatchNotFound("match not found")
         if acting_user_id not in (m.creator_id, m.opponent_id):
             raise PermissionError("not a participant")
         if m.status != MatchStatus.PENDING:
-            raise ValueError("cannot add games unless match is PENDING")
+            raise MatchStateConflict("cannot add games unless match is PENDING")
+        self._check_version(m, expected_version)
 
         # Validate that winner and loser are match participants
         if {winner_user_id, loser_user_id} != {m.creator_id, m.opponent_id}:
             raise ValueError("winner and loser must be match participants")
 
-        return self.game_svc.add_game(
+        game = self.game_svc.add_game(
             match_id=m.id,
             winner_user_id=winner_user_id,
             loser_user_id=loser_user_id,
             game_type=game_type,
         )
+        self._bump_scores(m, *self._score_delta(m, [winner_user_id]), expected_version)
+        self._record(m, ChangeEntity.GAME, [game.id])
+        return game
+
+    def add_games(
+        self,
+        user_id: int,
+        match_id: int,
+        games: List[Game],
+        expected_version: Optional[int] = None,
+    ) -> List[Game]:
+        """Append a list of game results to a pending match.
+
+        The match is loaded and checked once for the whole batch, every game
+        is validated, and then all of them are written with one multi-row
+        INSERT ... RETURNING. Nothing is inserted if any game is invalid or
+        would be played after a side reached `race_to`; the game that reaches
+        it submits the match for approval.
+
+        Raises:
+            ValueError: If match not found, not PENDING, or invalid game data.
+            MatchVersionConflict: If `expected_version` is not the current one.
+            PermissionError: If user is not a participant.
+        """
+        m = self.db.get(Match, match_id)
+        if not m:
+            raise MatchNotFound("match not found")
+        if user_id not in (m.creator_id, m.opponent_id):
+            raise PermissionError("not a participant")
+        if m.status != MatchStatus.PENDING:
+            raise MatchStateConflict("cannot add games unless match is PENDING")
+        self._check_version(m, expected_version)
 
-    def add_games(self, user_id: int, match_id: int, games: List[Game]) -> List[Game]:
-        """Append a list of game results to a pending match."""
-        gs = []
+        participants = {m.creator_id, m.opponent_id}
+        scores = {m.creator_id: m.creator_score, m.opponent_id: m.opponent_score}
+        rows = []
         for game in games:
-            gs.append(
-                self.add_game(
-                    match_id=match_id,
-                    winner_user_id=game.winner_user_id,
-                    loser_user_id=game.loser_user_id,
-                    game_type=game.game_type,
-                    acting_user_id=user_id,
-                )
+            if game.winner_user_id == game.loser_user_id:
+                raise ValueError("winner and loser must be different")
+            if {game.winner_user_id, game.loser_user_id} != participants:
+                raise ValueError("winner and loser must be match participants")
+            if max(scores.values()) >= m.race_to:
+                raise ValueError(f"match is already decided (race to {m.race_to})")
+            scores[game.winner_user_id] += 1
+            rows.append(
+                {
+                    "winner_user_id": game.winner_user_id,
+                    "loser_user_id": game.loser_user_id,
+                    "game_type": game.game_type,
+                }
             )
 
-        return gs
+        inserted = self.game_svc.insert_games(match_id=m.id, games=rows)
+        self._bump_scores(
+            m, *self._score_delta(m, [g.winner_user_id for g in games]), expected_version
+        )
+        self._record(m, ChangeEntity.GAME, [g.id for g in inserted])
+        return inserted
 
-    def delete_game(self, match_id: int, acting_user_id: int, game_id: int) -> None:
+    def delete_game(
+        self,
+        match_id: int,
+        acting_user_id: int,
+        game_id: int,
+        expected_version: Optional[int] = None,
+    ) -> None:
         """Delete a game from the database.
 
         Raises:
             ValueError: If match or game not found.
+            MatchVersionConflict: If `expected_version` is not the current one.
             PermissionError: If user is not a participant in the match.
         """
         m = self._query_match(match_id)
 
         if acting_user_id not in (m.creator_id, m.opponent_id):
             raise PermissionError("not a participant")
+        self._require_pending(m)
+        self._check_version(m, expected_version)
 
         g = self.db.query(Game).filter(Game.id == game_id).first()
         if not g:
@@ -180,12 +462,52 @@ class MatchesDbService:
         if g.match_id != match_id:
             raise ValueError("game does not belong to this match")
 
+        winner_user_id = g.winner_user_id
         self.game_svc.delete_game(game_id=game_id)
+        self._bump_scores(m, *self._score_delta(m, [winner_user_id], sign=-1), expected_version)
+        self._record(m, ChangeEntity.GAME, [game_id], ChangeOp.DELETE)
+
+    def delete_games(
+        self,
+        match_id: int,
+        acting_user_id: int,
+        game_ids: List[int],
+        expected_version: Optional[int] = None,
+    ) -> List[int]:
+        """Delete a set of games from a match with one DELETE.
+
+        Participation is checked with a single match lookup; the games are
+        then removed by ``DELETE ... WHERE match_id = :m AND id IN (...)``, so
+        ids belonging to other matches are never touched.
 
-    def delete_games(self, match_id: int, acting_user_id: int, game_ids: List[int]) -> None:
-        """Delete a list of games from the database."""
-        for game_id in game_ids:
-            self.delete_game(match_id=match_id, acting_user_id=acting_user_id, game_id=game_id)
+        Returns:
+            Requested ids that were not found in this match (nothing is
+            deleted for those).
+
+        Raises:
+            ValueError: If match not found.
+            MatchVersionConflict: If `expected_version` is not the current one.
+            PermissionError: If user is not a participant in the match.
+        """
+        m = self._query_match(match_id)
+        if acting_user_id not in (m.creator_id, m.opponent_id):
+            raise PermissionError("not a participant")
+        self._require_pending(m)
+        self._check_version(m, expected_version)
+        if not game_ids:
+            return []
+
+        deleted = {
+            row.id: row.winner_user_id
+            for row in self.db.execute(
+                delete(Game)
+                .where(Game.match_id == match_id, Game.id.in_(game_ids))
+                .returning(Game.id, Game.winner_user_id)
+            )
+        }
+        self._bump_scores(m, *self._score_delta(m, deleted.values(), sign=-1), expected_version)
+        self._record(m, ChangeEntity.GAME, deleted, ChangeOp.DELETE)
+        return [game_id for game_id in dict.fromkeys(game_ids) if game_id not in deleted]
 
     def edit_game(
         self,
@@ -194,17 +516,21 @@ class MatchesDbService:
         game_id: int,
         winner_user_id: int,
         loser_user_id: int,
+        expected_version: Optional[int] = None,
     ) -> Game:
         """Edit a game in the database.
 
         Raises:
             ValueError: If match or game not found.
+            MatchVersionConflict: If `expected_version` is not the current one.
             PermissionError: If user is not a participant in the match.
         """
         m = self._query_match(match_id)
 
         if acting_user_id not in (m.creator_id, m.opponent_id):
             raise PermissionError("not a participant")
+        self._require_pending(m)
+        self._check_version(m, expected_version)
 
         g = self.db.query(Game).filter(Game.id == game_id).first()
         if not g:
@@ -220,19 +546,292 @@ class MatchesDbService:
         if {winner_user_id, loser_user_id} != {m.creator_id, m.opponent_id}:
             raise ValueError("winner and loser must be match participants")
 
-        return self.game_svc.edit_game(
+        previous_winner = g.winner_user_id
+        game = self.game_svc.edit_game(
             game_id=game_id, winner_user_id=winner_user_id, loser_user_id=loser_user_id
         )
+        lost = self._score_delta(m, [previous_winner], sign=-1)
+        won = self._score_delta(m, [winner_user_id])
+        self._bump_scores(m, lost[0] + won[0], lost[1] + won[1], expected_version)
+        self._record(m, ChangeEntity.GAME, [game_id])
+        return game
 
-    def edit_match(self, user_id: int, match_id: int, status: MatchStatus) -> Match:
-        """Edit a match (e.g., update status)."""
+    def edit_games(
+        self,
+        match_id: int,
+        acting_user_id: int,
+        edits: List[GameEdit],
+        expected_version: Optional[int] = None,
+    ) -> List[int]:
+        """Change the result of several games of a match with one UPDATE.
+
+        Every edit is validated up front against a single match lookup, then
+        all rows are rewritten by one ``UPDATE ... SET winner_user_id = CASE id
+        ... END`` restricted to ``match_id = :m AND id IN (...)``. The match
+        score is then recounted with one more UPDATE, since RETURNING only
+        yields the new winners.
+
+        Returns:
+            Edited game ids that were not found in this match.
+
+        Raises:
+            ValueError: If match not found, a game id repeats, or a winner/loser
+                pair is invalid.
+            MatchVersionConflict: If `expected_version` is not the current one.
+            PermissionError: If user is not a participant in the match.
+        """
         m = self._query_match(match_id)
-        if user_id not in (m.creator_id, m.opponent_id):
+        if acting_user_id not in (m.creator_id, m.opponent_id):
             raise PermissionError("not a participant")
-        m.status = status
-        self.db.flush()
+        self._require_pending(m)
+        self._check_version(m, expected_version)
+        if not edits:
+            return []
+
+        participants = {m.creator_id, m.opponent_id}
+        winners: Dict[int, int] = {}
+        losers: Dict[int, int] = {}
+        for edit in edits:
+            if edit.game_id in winners:
+                raise ValueError(f"game {edit.game_id} edited more than once")
+            if edit.winner_user_id == edit.loser_user_id:
+                raise ValueError("winner and loser must be different")
+            if {edit.winner_user_id, edit.loser_user_id} != participants:
+                raise ValueError("winner and loser must be match participants")
+            winners[edit.game_id] = edit.winner_user_id
+            losers[edit.game_id] = edit.loser_user_id
+
+        updated = set(
+            self.db.scalars(
+                update(Game)
+                .where(Game.match_id == match_id, Game.id.in_(list(winners)))
+                .values(
+                    winner_user_id=case(winners, value=Game.id),
+                    loser_user_id=case(losers, value=Game.id),
+                )
+                .returning(Game.id)
+                .execution_options(synchronize_session="fetch")
+            )
+        )
+        if updated:
+            self.recount_scores(match_id, expected_version=expected_version)
+            self._record(m, ChangeEntity.GAME, sorted(updated))
+            self._submit_if_race_won(match_id)
+        return [game_id for game_id in winners if game_id not in updated]
+
+    def submit(self, user_id: int, match_id: int, expected_version: Optional[int] = None) -> Match:
+        """Submit a pending match for the opponent's approval (creator only)."""
+        m = self._transition("submit", user_id, match_id, expected_version)
+        self._open_approval(m)
+        return m
+
+    def approve(
+        self,
+        user_id: int,
+        match_id: int,
+        note: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> Match:
+        """Approve a submitted match (opponent only); it now counts toward stats and ratings."""
+        m = self._transition("approve", user_id, match_id, expected_version)
+        self._decide_approval(m, ApprovalStatus.APPROVED, note)
+        self.stats_svc.apply_match(m)
+        self.head_to_head_svc.apply_match(m)
+        self.recent_svc.apply_match(m)
+        invalidate_stats(self.db, [m.creator_id, m.opponent_id])
+        self.ratings_svc.rate_match(m)
+        return m
+
+    def decline(
+        self,
+        user_id: int,
+        match_id: int,
+        note: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> Match:
+        """Decline a submitted match (opponent only)."""
+        m = self._transition("decline", user_id, match_id, expected_version)
+        self._decide_approval(m, ApprovalStatus.DECLINED, note)
+        return m
+
+    def void(self, user_id: int, match_id: int, expected_version: Optional[int] = None) -> Match:
+        """Void an approved match (opponent only), taking it back out of stats and ratings."""
+        m = self._transition("void", user_id, match_id, expected_version)
+        self.stats_svc.apply_match(m, sign=-1)
+        self.head_to_head_svc.apply_match(m, sign=-1)
+        self.recent_svc.apply_match(m, sign=-1)
+        invalidate_stats(self.db, [m.creator_id, m.opponent_id])
+        self.ratings_svc.rate_match(m, sign=-1)
+        return m
+
+    def cancel(self, user_id: int, match_id: int, expected_version: Optional[int] = None) -> Match:
+        """Cancel a pending or submitted match (creator only)."""
+        m = self._transition("cancel", user_id, match_id, expected_version)
+        withdrawn = self.db.scalars(
+            delete(Approval)
+            .where(Approval.match_id == m.id, Approval.status == ApprovalStatus.PENDING)
+            .returning(Approval.id)
+        ).all()
+        self._record(m, ChangeEntity.APPROVAL, withdrawn, ChangeOp.DELETE)
+        return m
+
+    def edit_match(self, user_id: int, match_id: int, status: MatchStatus) -> Match:
+        """Move a match to `status` through the public method of that transition.
+
+        So approving or voiding this way updates stats, ratings and the
+        approval exactly as `approve`/`void` do.
+
+        Raises:
+            MatchNotFound: If match not found.
+            PermissionError: If user may not perform the transition.
+            MatchStateConflict: If `status` is not reachable from the current one.
+        """
+        actions: Dict[MatchStatus, Callable[..., Match]] = {
+            MatchStatus.SUBMITTED: self.submit,
+            MatchStatus.APPROVED: self.approve,
+            MatchStatus.DECLINED: self.decline,
+            MatchStatus.CANCELLED: self.cancel,
+            MatchStatus.VOIDED: self.void,
+        }
+        if status not in actions:
+            raise MatchStateConflict(f"cannot move a match to {status.value}")
+        return actions[status](user_id=user_id, match_id=match_id)
+
+    def _transition(
+        self, action: str, user_id: int, match_id: int, expected_version: Optional[int] = None
+    ) -> Match:
+        """Apply a state transition as one conditional UPDATE ... RETURNING.
+
+        The current status and the actor's role (and `expected_version`, when
+        given) are part of the WHERE clause, so the check and the write are a
+        single atomic statement: of two concurrent transitions from the same
+        state (say approve and decline) exactly one matches a row, and the
+        other sees the new status.
+
+        Raises:
+            MatchNotFound: If match not found.
+            PermissionError: If user is not a participant or has the wrong role.
+            MatchVersionConflict: If `expected_version` is not the current one.
+            MatchStateConflict: If the match is not in an allowed status.
+        """
+        role, from_statuses, to_status = TRANSITIONS[action]
+        actor = Match.creator_id if role == "creator" else Match.opponent_id
+        stmt = update(Match).where(
+            Match.id == match_id, actor == user_id, Match.status.in_(from_statuses)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(Match.version == expected_version)
+        m = self.db.scalars(
+            stmt.values(status=to_status, version=Match.version + 1)
+            .returning(Match)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).one_or_none()
+        if m is not None:
+            self._record(m, ChangeEntity.MATCH, [m.id])
+            return m
+
+        # Nothing matched: read the match once to explain why.
+        current = self.db.get(Match, match_id, populate_existing=True)
+        if current is None:
+            raise MatchNotFound("match not found")
+        if user_id not in (current.creator_id, current.opponent_id):
+            raise PermissionError("not a participant")
+        if user_id != getattr(current, actor.key):
+            raise PermissionError(f"only the {role} can {action} a match")
+        self._check_version(current, expected_version)
+        raise MatchStateConflict(f"cannot {action} a {current.status.value} match")
+
+    def _submit_if_race_won(self, match_id: int) -> Optional[Match]:
+        """Submit a pending match once either side has reached `race_to`."""
+        m = self.db.scalars(
+            update(Match)
+            .where(
+                Match.id == match_id,
+                Match.status == MatchStatus.PENDING,
+                or_(Match.creator_score >= Match.race_to, Match.opponent_score >= Match.race_to),
+            )
+            .values(status=MatchStatus.SUBMITTED, version=Match.version + 1)
+            .returning(Match)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).one_or_none()
+        if m is not None:
+            self._record(m, ChangeEntity.MATCH, [m.id])
+            self._open_approval(m)
         return m
 
+    def _open_approval(self, m: Match) -> None:
+        """Create the opponent's pending approval for a just-submitted match."""
+        approval = Approval(
+            match_id=m.id, approver_user_id=m.opponent_id, status=ApprovalStatus.PENDING
+        )
+        self.db.add(approval)
+        self.db.flush()
+        self._record(m, ChangeEntity.APPROVAL, [approval.id])
+
+    def _decide_approval(self, m: Match, status: ApprovalStatus, note: Optional[str]) -> None:
+        """Record the opponent's decision on the match's approval row."""
+        decided = self.db.scalars(
+            update(Approval)
+            .where(Approval.match_id == m.id)
+            .values(status=status, note=note, decided_at=datetime.utcnow())
+            .returning(Approval.id)
+            .execution_options(synchronize_session="fetch")
+        ).one_or_none()
+        if decided is None:
+            # Matches submitted before approvals were opened on submit.
+            approval = Approval(
+                match_id=m.id,
+                approver_user_id=m.opponent_id,
+                status=status,
+                note=note,
+                decided_at=datetime.utcnow(),
+            )
+            self.db.add(approval)
+            self.db.flush()
+            decided = approval.id
+        self._record(m, ChangeEntity.APPROVAL, [decided])
+
+    def _record(
+        self,
+        m: Match,
+        entity: ChangeEntity,
+        entity_ids: Iterable[int],
+        op: ChangeOp = ChangeOp.UPSERT,
+    ) -> None:
+        """Append change-feed entries for rows of match `m`.
+
+        The entries are added to the session rather than inserted here, so
+        everything a request records goes out with its next flush as one
+        multi-row INSERT, in the write's own transaction. Callers running a
+        write under a savepoint must flush before releasing or rolling it
+        back, since the session does not autoflush. Their feed positions are
+        assigned when the transaction commits.
+        """
+        mark_unstamped(self.db)
+        now = datetime.utcnow()
+        self.db.add_all(
+            Change(
+                entity=entity,
+                entity_id=entity_id,
+                op=op,
+                match_id=m.id,
+                creator_id=m.creator_id,
+                opponent_id=m.opponent_id,
+                created_at=now,
+            )
+            for entity_id in entity_ids
+        )
+
+    def _check_version(self, m: Match, expected_version: Optional[int]) -> None:
+        """Reject a write made against a stale read of the match."""
+        if expected_version is not None and m.version != expected_version:
+            raise MatchVersionConflict(f"match is at version {m.version}, not {expected_version}")
+
+    def _require_pending(self, m: Match) -> None:
+        """Games can only change while the match is still being recorded."""
+        if m.status != MatchStatus.PENDING:
+            raise MatchStateConflict("cannot change games unless match is PENDING")
+
     def _serialize_match(self, m: Match) -> Dict[str, Any]:
         return {
             "id": m.id,
@@ -241,8 +840,120 @@ class MatchesDbService:
             "game_type": m.game_type.value if hasattr(m.game_type, "value") else str(m.game_type),
             "race_to": m.race_to,
             "status": m.status.value if hasattr(m.status, "value") else str(m.status),
+            "creator_score": m.creator_score,
+            "opponent_score": m.opponent_score,
         }
 
+    def recount_scores(
+        self, match_id: Optional[int] = None, expected_version: Optional[int] = None
+    ) -> None:
+        """Recompute match scores from their games in one UPDATE.
+
+        Used where the previous winners are not known without an extra read
+        (`edit_games`) and to repair drift. None recounts every match, but
+        only rewrites (and bumps the version of) those whose score drifted.
+
+        Raises:
+            MatchVersionConflict: If `expected_version` is given and the match
+                is no longer at it.
+        """
+
+        def racks_won(player_id: Any) -> Any:
+            return (
+                select(func.count(Game.id))
+                .where(Game.match_id == Match.id, Game.winner_user_id == player_id)
+                .scalar_subquery()
+            )
+
+        stmt = update(Match).values(
+            creator_score=racks_won(Match.creator_id),
+            opponent_score=racks_won(Match.opponent_id),
+            version=Match.version + 1,
+        )
+        if match_id is not None:
+            stmt = stmt.where(Match.id == match_id)
+        else:
+            stmt = stmt.where(
+                or_(
+                    Match.creator_score != racks_won(Match.creator_id),
+                    Match.opponent_score != racks_won(Match.opponent_id),
+                )
+            )
+        if expected_version is not None:
+            stmt = stmt.where(Match.version == expected_version)
+        recounted = self.db.execute(
+            stmt.returning(Match.id, Match.creator_id, Match.opponent_id).execution_options(
+                synchronize_session="fetch"
+            )
+        ).all()
+        if expected_version is not None and not recounted:
+            raise MatchVersionConflict(f"match is no longer at version {expected_version}")
+        now = datetime.utcnow()
+        self.db.add_all(
+            Change(
+                entity=ChangeEntity.MATCH,
+                entity_id=row.id,
+                op=ChangeOp.UPSERT,
+                match_id=row.id,
+                creator_id=row.creator_id,
+                opponent_id=row.opponent_id,
+                created_at=now,
+            )
+            for row in recounted
+        )
+
+    def _score_delta(
+        self, m: Match, winner_user_ids: Iterable[int], sign: int = 1
+    ) -> Tuple[int, int]:
+        """(creator, opponent) score change for games won by `winner_user_ids`."""
+        winners = list(winner_user_ids)
+        creator_wins = sum(1 for w in winners if w == m.creator_id)
+        return sign * creator_wins, sign * (len(winners) - creator_wins)
+
+    def _bump_scores(
+        self,
+        m: Match,
+        creator_delta: int,
+        opponent_delta: int,
+        expected_version: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """Apply a score change as an atomic in-database increment.
+
+        ``SET creator_score = creator_score + :d`` never reads the old value
+        into Python, so concurrent game writes on one match cannot lose an
+        update. The increment only applies while the match is PENDING (and at
+        `expected_version`, when given), and a score reaching `race_to`
+        submits the match for approval. The version is bumped even for a zero
+        delta, since the games changed.
+
+        Returns:
+            The new (creator_score, opponent_score).
+        """
+        stmt = update(Match).where(Match.id == m.id, Match.status == MatchStatus.PENDING)
+        if expected_version is not None:
+            stmt = stmt.where(Match.version == expected_version)
+        row = self.db.execute(
+            stmt.values(
+                creator_score=Match.creator_score + creator_delta,
+                opponent_score=Match.opponent_score + opponent_delta,
+                version=Match.version + 1,
+            )
+            .returning(Match.creator_score, Match.opponent_score, Match.race_to)
+            .execution_options(synchronize_session="fetch")
+        ).one_or_none()
+        if row is None:
+            # Submitted, closed or otherwise changed by a concurrent request
+            # since `m` was read.
+            current = self.db.get(Match, m.id, populate_existing=True)
+            if current is not None:
+                self._require_pending(current)
+            raise MatchVersionConflict(f"match is no longer at version {expected_version}")
+        if max(row.creator_score, row.opponent_score) >= row.race_to:
+            self._submit_if_race_won(m.id)
+        else:
+            self._record(m, ChangeEntity.MATCH, [m.id])
+        return row.creator_score, row.opponent_score
+
     def _query_match(self, match_id: int) -> Match:
         """Helper to fetch and validate match existence.
 
@@ -251,5 +962,262 @@ class MatchesDbService:
         """
         m = self.db.query(Match).filter(Match.id == match_id).first()
         if not m:
-            raise ValueError("match not found")
+            raise MatchNotFound("match not found")
         return m
+
+
+class AsyncMatchesDbService:
+    """Asyncio counterpart of `MatchesDbService`.
+
+    Methods run the synchronous implementation through `AsyncSession.run_sync`,
+    so participant and status rules are shared with the sync service.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, fn: Callable[[MatchesDbService], T]) -> T:
+        return await self.db.run_sync(lambda session: fn(MatchesDbService(session)))
+
+    async def list_matches(
+        self,
+        creator_id: Optional[int] = None,
+        opponent_id: Optional[int] = None,
+        status: Optional[str] = None,
+        game_type: Optional[GameType] = None,
+    ) -> List[Dict[str, Any]]:
+        """See `MatchesDbService.list_matches`."""
+        return await self._run(
+            lambda svc: svc.list_matches(
+                creator_id=creator_id, opponent_id=opponent_id, status=status, game_type=game_type
+            )
+        )
+
+    async def list_matches_page(
+        self,
+        user_id: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        status: Optional[MatchStatus] = None,
+        game_type: Optional[GameType] = None,
+    ) -> Dict[str, Any]:
+        """See `MatchesDbService.list_matches_page`."""
+        return await self._run(
+            lambda svc: svc.list_matches_page(
+                user_id=user_id, limit=limit, cursor=cursor, status=status, game_type=game_type
+            )
+        )
+
+    async def get_match(self, user_id: int, match_id: int) -> Optional[Dict[str, Any]]:
+        """See `MatchesDbService.get_match`."""
+        return await self._run(lambda svc: svc.get_match(user_id=user_id, match_id=match_id))
+
+    async def get_match_detail(self, user_id: int, match_id: int) -> Optional[MatchDetail]:
+        """See `MatchesDbService.get_match_detail`."""
+        return await self._run(lambda svc: svc.get_match_detail(user_id=user_id, match_id=match_id))
+
+    async def add_match(
+        self, user_id: int, opponent_id: int, game_type: GameType, race_to: int
+    ) -> Match:
+        """See `MatchesDbService.add_match`."""
+        return await self._run(
+            lambda svc: svc.add_match(
+                user_id=user_id, opponent_id=opponent_id, game_type=game_type, race_to=race_to
+            )
+        )
+
+    async def record_match(
+        self,
+        user_id: int,
+        opponent_id: int,
+        game_type: GameType,
+        race_to: int,
+        winner_user_ids: List[int],
+        submit: bool = False,
+    ) -> Tuple[Match, List[Game]]:
+        """See `MatchesDbService.record_match`."""
+        return await self._run(
+            lambda svc: svc.record_match(
+                user_id=user_id,
+                opponent_id=opponent_id,
+                game_type=game_type,
+                race_to=race_to,
+                winner_user_ids=winner_user_ids,
+                submit=submit,
+            )
+        )
+
+    async def delete_match(self, user_id: int, match_id: int) -> Match:
+        """See `MatchesDbService.delete_match`."""
+        return await self._run(lambda svc: svc.delete_match(user_id=user_id, match_id=match_id))
+
+    async def add_game(
+        self,
+        match_id: int,
+        winner_user_id: int,
+        loser_user_id: int,
+        game_type: GameType,
+        acting_user_id: int,
+        expected_version: Optional[int] = None,
+    ) -> Game:
+        """See `MatchesDbService.add_game`."""
+        return await self._run(
+            lambda svc: svc.add_game(
+                match_id=match_id,
+                winner_user_id=winner_user_id,
+                loser_user_id=loser_user_id,
+                game_type=game_type,
+                acting_user_id=acting_user_id,
+                expected_version=expected_version,
+            )
+        )
+
+    async def add_games(
+        self,
+        user_id: int,
+        match_id: int,
+        games: List[Game],
+        expected_version: Optional[int] = None,
+    ) -> List[Game]:
+        """See `MatchesDbService.add_games`."""
+        return await self._run(
+            lambda svc: svc.add_games(
+                user_id=user_id, match_id=match_id, games=games, expected_version=expected_version
+            )
+        )
+
+    async def delete_game(
+        self,
+        match_id: int,
+        acting_user_id: int,
+        game_id: int,
+        expected_version: Optional[int] = None,
+    ) -> None:
+        """See `MatchesDbService.delete_game`."""
+        await self._run(
+            lambda svc: svc.delete_game(
+                match_id=match_id,
+                acting_user_id=acting_user_id,
+                game_id=game_id,
+                expected_version=expected_version,
+            )
+        )
+
+    async def delete_games(
+        self,
+        match_id: int,
+        acting_user_id: int,
+        game_ids: List[int],
+        expected_version: Optional[int] = None,
+    ) -> List[int]:
+        """See `MatchesDbService.delete_games`."""
+        return await self._run(
+            lambda svc: svc.delete_games(
+                match_id=match_id,
+                acting_user_id=acting_user_id,
+                game_ids=game_ids,
+                expected_version=expected_version,
+            )
+        )
+
+    async def edit_game(
+        self,
+        match_id: int,
+        acting_user_id: int,
+        game_id: int,
+        winner_user_id: int,
+        loser_user_id: int,
+        expected_version: Optional[int] = None,
+    ) -> Game:
+        """See `MatchesDbService.edit_game`."""
+        return await self._run(
+            lambda svc: svc.edit_game(
+                match_id=match_id,
+                acting_user_id=acting_user_id,
+                game_id=game_id,
+                winner_user_id=winner_user_id,
+                loser_user_id=loser_user_id,
+                expected_version=expected_version,
+            )
+        )
+
+    async def edit_games(
+        self,
+        match_id: int,
+        acting_user_id: int,
+        edits: List[GameEdit],
+        expected_version: Optional[int] = None,
+    ) -> List[int]:
+        """See `MatchesDbService.edit_games`."""
+        return await self._run(
+            lambda svc: svc.edit_games(
+                match_id=match_id,
+                acting_user_id=acting_user_id,
+                edits=edits,
+                expected_version=expected_version,
+            )
+        )
+
+    async def submit(
+        self, user_id: int, match_id: int, expected_version: Optional[int] = None
+    ) -> Match:
+        """See `MatchesDbService.submit`."""
+        return await self._run(
+            lambda svc: svc.submit(
+                user_id=user_id, match_id=match_id, expected_version=expected_version
+            )
+        )
+
+    async def approve(
+        self,
+        user_id: int,
+        match_id: int,
+        note: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> Match:
+        """See `MatchesDbService.approve`."""
+        return await self._run(
+            lambda svc: svc.approve(
+                user_id=user_id, match_id=match_id, note=note, expected_version=expected_version
+            )
+        )
+
+    async def decline(
+        self,
+        user_id: int,
+        match_id: int,
+        note: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> Match:
+        """See `MatchesDbService.decline`."""
+        return await self._run(
+            lambda svc: svc.decline(
+                user_id=user_id, match_id=match_id, note=note, expected_version=expected_version
+            )
+        )
+
+    async def void(
+        self, user_id: int, match_id: int, expected_version: Optional[int] = None
+    ) -> Match:
+        """See `MatchesDbService.void`."""
+        return await self._run(
+            lambda svc: svc.void(
+                user_id=user_id, match_id=match_id, expected_version=expected_version
+            )
+        )
+
+    async def cancel(
+        self, user_id: int, match_id: int, expected_version: Optional[int] = None
+    ) -> Match:
+        """See `MatchesDbService.cancel`."""
+        return await self._run(
+            lambda svc: svc.cancel(
+                user_id=user_id, match_id=match_id, expected_version=expected_version
+            )
+        )
+
+    async def edit_match(self, user_id: int, match_id: int, status: MatchStatus) -> Match:
+        """See `MatchesDbService.edit_match`."""
+        return await self._run(
+            lambda svc: svc.edit_match(user_id=user_id, match_id=match_id, status=status)
+        )
@@ -0,0 +1,254 @@
+"""Player ratings.
+
+Elo per game type, rated by match: a match between players rated r_a and
+r_b, won a racks to b racks, moves a by
+
+    K * (a - (a + b) * E),   E = 1 / (1 + 10 ** ((r_b - r_a) / 400))
+
+and b by the opposite amount, so every rack is worth K points spread by
+how surprising it was. `MatchesDbService` rates each match as it is
+approved (`RatingsDbService.rate_match`). `RatingsDbService.recompute`
+replays the approved history, in approval order: all of it to re-rate
+everyone after a rule change, or one game type's when a match is voided.
+"""
+
+from itertools import chain
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import case, delete, insert, select
+from sqlalchemy.orm import Session
+
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import upsert
+from corner_pocket_backend.models import (
+    Approval,
+    GameType,
+    Match,
+    MatchStatus,
+    Rating,
+)
+from corner_pocket_backend.schemas.stats import GameTypeRating, PlayerRatings
+from corner_pocket_backend.services.leaderboard import record_ratings, reset_leaderboards
+from corner_pocket_backend.services.stats_cache import invalidate_stats
+
+GAME_TYPES = list(GameType)
+
+IntArray = npt.NDArray[np.int64]
+FloatArray = npt.NDArray[np.float64]
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """Probability that a player rated `rating` wins a rack against `opponent_rating`."""
+    return float(1 / (1 + 10 ** ((opponent_rating - rating) / 400)))
+
+
+def replay(
+    a: IntArray,
+    b: IntArray,
+    a_racks: IntArray,
+    b_racks: IntArray,
+    slots: int,
+    k_factor: float,
+    initial: float,
+) -> Tuple[FloatArray, IntArray]:
+    """Rate a sequence of matches from scratch.
+
+    Matches are given in rating order as parallel arrays of player slots
+    (0 to `slots` - 1) and racks won. Elo is order dependent, so matches
+    can't all be rated at once; instead they are grouped into generations
+    in which no slot appears twice, each match landing one generation
+    after the latest one either of its slots played in. A generation's
+    matches are independent and are rated with one set of array
+    operations, which gives exactly the sequential result.
+
+    Returns:
+        (rating, matches rated) per slot.
+    """
+    generation = np.empty(len(a), dtype=np.int64)
+    last = [0] * slots
+    for i, (x, y) in enumerate(zip(a.tolist(), b.tolist())):
+        g = max(last[x], last[y]) + 1
+        last[x] = last[y] = g
+        generation[i] = g
+    order = np.argsort(generation, kind="stable")
+    bounds = np.cumsum(np.bincount(generation)[1:])
+
+    rating = np.full(slots, initial, dtype=np.float64)
+    racks = (a_racks + b_racks).astype(np.float64)
+    lo = 0
+    for hi in bounds.tolist():
+        idx = order[lo:hi]
+        sa, sb = a[idx], b[idx]
+        expected = 1 / (1 + 10 ** ((rating[sb] - rating[sa]) / 400))
+        delta = k_factor * (a_racks[idx] - racks[idx] * expected)
+        rating[sa] += delta
+        rating[sb] -= delta
+        lo = hi
+    played = np.bincount(np.concatenate([a, b]), minlength=slots).astype(np.int64)
+    return rating, played
+
+
+class RatingsDbService:
+    """Per-player, per-game-type Elo ratings (`ratings`)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def ratings(self, user_id: int) -> PlayerRatings:
+        """A player's ratings, one per game type they have a rated match in."""
+        rows = self.db.scalars(
+            select(Rating)
+            .where(Rating.user_id == user_id)
+            .order_by(Rating.game_type)
+            .execution_options(populate_existing=True)
+        ).all()
+        return PlayerRatings(
+            user_id=user_id, ratings=[GameTypeRating.model_validate(r) for r in rows]
+        )
+
+    def rate_match(self, m: Match, sign: int = 1) -> None:
+        """Move both players' ratings by an approved match (`sign=-1` takes it back).
+
+        Reads the two ratings (locking them on Postgres) and adds the
+        deltas with one upsert, whose RETURNING values move the players on
+        the leaderboard once the transaction commits.
+
+        Elo is path dependent: every later match of either player was rated
+        from ratings this match moved. Taking a match back (`m` must no
+        longer be APPROVED) therefore re-rates its game type from the
+        remaining history with `recompute`, one pass over that type's
+        approved matches, rather than subtracting an approximate delta.
+        """
+        if sign < 0:
+            self.recompute(game_type=m.game_type)
+            return
+        current: Dict[int, float] = dict(
+            self.db.execute(
+                select(Rating.user_id, Rating.rating)
+                .where(
+                    Rating.user_id.in_([m.creator_id, m.opponent_id]),
+                    Rating.game_type == m.game_type,
+                )
+                .with_for_update()
+            )
+            .tuples()
+            .all()
+        )
+        initial = settings.RATING_INITIAL
+        r_creator = current.get(m.creator_id, initial)
+        r_opponent = current.get(m.opponent_id, initial)
+        racks = m.creator_score + m.opponent_score
+        delta = settings.RATING_K_FACTOR * (
+            m.creator_score - racks * expected_score(r_creator, r_opponent)
+        )
+        self._upsert(m.game_type, {m.creator_id: delta, m.opponent_id: -delta})
+
+    def recompute(
+        self,
+        k_factor: Optional[float] = None,
+        initial: Optional[float] = None,
+        game_type: Optional[GameType] = None,
+    ) -> int:
+        """Re-rate every player from all approved matches, in approval order.
+
+        The history is read as plain integer columns (one row per match,
+        its racks taken from the running scores) into NumPy arrays and
+        rated with `replay`; the `ratings` table is then replaced.
+
+        Args:
+            k_factor: Points per rack; defaults to `RATING_K_FACTOR`.
+            initial: Starting rating; defaults to `RATING_INITIAL`.
+            game_type: Re-rate only this game type's matches and ratings.
+
+        Returns:
+            Number of ratings written.
+        """
+        type_index = case(*((Match.game_type == t, i) for i, t in enumerate(GAME_TYPES)), else_=-1)
+        history_query = (
+            select(
+                Match.creator_id,
+                Match.opponent_id,
+                type_index,
+                Match.creator_score,
+                Match.opponent_score,
+            )
+            .outerjoin(Approval, Approval.match_id == Match.id)
+            .where(Match.status == MatchStatus.APPROVED)
+            # Matches approved before decisions were timestamped come first.
+            .order_by(Approval.decided_at.nulls_first(), Match.id)
+        )
+        stale = delete(Rating)
+        if game_type is not None:
+            history_query = history_query.where(Match.game_type == game_type)
+            stale = stale.where(Rating.game_type == game_type)
+        rows = self.db.connection().execute(history_query).all()
+        rerated = set(self.db.scalars(stale.returning(Rating.user_id)))
+        reset_leaderboards(self.db, game_type)
+        if not rows:
+            invalidate_stats(self.db, None if game_type is None else rerated)
+            return 0
+        # np.array() on Row objects probes each one for the array protocol;
+        # reading the flat values is an order of magnitude faster.
+        history = np.fromiter(
+            chain.from_iterable(rows), dtype=np.int64, count=len(rows) * 5
+        ).reshape(-1, 5)
+        # Dense slot per (player, game type).
+        users, player = np.unique(history[:, :2], return_inverse=True)
+        slot = player.reshape(-1, 2) * len(GAME_TYPES) + history[:, 2:3]
+        rating, played = replay(
+            slot[:, 0],
+            slot[:, 1],
+            history[:, 3],
+            history[:, 4],
+            slots=len(users) * len(GAME_TYPES),
+            k_factor=settings.RATING_K_FACTOR if k_factor is None else k_factor,
+            initial=settings.RATING_INITIAL if initial is None else initial,
+        )
+        rated = np.flatnonzero(played)
+        user_ids = users.tolist()
+        invalidate_stats(self.db, None if game_type is None else rerated | set(user_ids))
+        self.db.execute(
+            insert(Rating),
+            [
+                {
+                    "user_id": user_ids[s // len(GAME_TYPES)],
+                    "game_type": GAME_TYPES[s % len(GAME_TYPES)],
+                    "rating": r,
+                    "matches_rated": n,
+                }
+                for s, r, n in zip(rated.tolist(), rating[rated].tolist(), played[rated].tolist())
+            ],
+        )
+        if game_type is None:
+            # A single type is re-rated inside a void, whose loaded objects
+            # must stay usable; `ratings` reads with populate_existing anyway.
+            self.db.expire_all()
+        return len(rated)
+
+    def _upsert(self, game_type: GameType, deltas: Dict[int, float]) -> None:
+        initial = settings.RATING_INITIAL
+
+        def add_delta(excluded: Any) -> Dict[str, Any]:
+            # The inserted row carries initial + delta; add just the delta.
+            return {"rating": Rating.rating + (excluded.rating - initial)}
+
+        ratings = upsert(
+            self.db,
+            Rating,
+            ["user_id", "game_type"],
+            [
+                {
+                    "user_id": user_id,
+                    "game_type": game_type,
+                    "rating": initial + delta,
+                    "matches_rated": 1,
+                }
+                for user_id, delta in deltas.items()
+            ],
+            increments=["matches_rated"],
+            set_=add_delta,
+            returning=[Rating.user_id, Rating.rating],
+        ).tuples()
+        record_ratings(self.db, game_type, dict(ratings.all()))
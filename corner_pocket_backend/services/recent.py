@@ -0,0 +1,316 @@
+"""Recent results: time windows, streaks and form.
+
+`RecentStatsDbService` keeps two aggregates in step with approved matches,
+written by `MatchesDbService` on approval and void in the same transaction:
+
+- `user_daily_stats`: per-player, per-game-type counters for each day, so
+  "the last N days" sums at most N buckets per game type instead of
+  scanning the player's history.
+- `user_form`: the current and best match streak and the last
+  `FORM_RACKS` racks as a bitmask, advanced one match at a time in
+  approval order.
+
+A streak cannot be rewound by one match, so voiding a match replays the
+form of its two players from their remaining history instead.
+"""
+
+from datetime import datetime, timedelta
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import case, delete, func, insert, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from corner_pocket_backend.core.db import upsert
+from corner_pocket_backend.models import (
+    Approval,
+    Game,
+    GameType,
+    Match,
+    MatchStatus,
+    UserDailyStats,
+    UserForm,
+)
+from corner_pocket_backend.schemas.common import GameType as GameTypeSchema
+from corner_pocket_backend.schemas.stats import (
+    GameTypeForm,
+    GameTypeStats,
+    PlayerForm,
+    WindowStats,
+)
+from corner_pocket_backend.services.stats import COUNTERS
+from corner_pocket_backend.services.stats_cache import invalidate_stats
+
+FORM_RACKS = 20
+FORM_MASK = (1 << FORM_RACKS) - 1
+FORM_COLUMNS = ("current_streak", "best_streak", "recent_racks", "recent_rack_count")
+
+MAX_WINDOW_DAYS = 366
+
+
+def advance(form: Dict[str, Any], margin: int, racks: Sequence[bool]) -> None:
+    """Move a `user_form` row on by one match.
+
+    Args:
+        form: The row's FORM_COLUMNS, updated in place.
+        margin: The player's racks minus the opponent's; positive is a win.
+        racks: Whether the player won each rack, in the order played.
+    """
+    streak = form["current_streak"]
+    if margin > 0:
+        streak = streak + 1 if streak > 0 else 1
+    elif margin < 0:
+        streak = streak - 1 if streak < 0 else -1
+    else:
+        streak = 0
+    form["current_streak"] = streak
+    form["best_streak"] = max(form["best_streak"], streak)
+    for won in racks:
+        form["recent_racks"] = ((form["recent_racks"] << 1) | won) & FORM_MASK
+    form["recent_rack_count"] = min(form["recent_rack_count"] + len(racks), FORM_RACKS)
+
+
+class RecentStatsDbService:
+    """Daily buckets (`user_daily_stats`) and streaks (`user_form`)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def window(self, user_id: int, days: int, game_type: Optional[GameType] = None) -> WindowStats:
+        """A player's record over the last `days` days, today included.
+
+        One primary-key range read over the daily buckets, grouped by game
+        type: at most `days` rows per game type, whatever the history.
+
+        Raises:
+            ValueError: If `days` is out of range.
+        """
+        if not 1 <= days <= MAX_WINDOW_DAYS:
+            raise ValueError(f"days must be between 1 and {MAX_WINDOW_DAYS}")
+        since = datetime.utcnow().date() - timedelta(days=days - 1)
+        query = select(
+            UserDailyStats.game_type,
+            *(func.sum(getattr(UserDailyStats, c)).label(c) for c in COUNTERS),
+        ).where(UserDailyStats.user_id == user_id, UserDailyStats.day >= since)
+        if game_type is not None:
+            query = query.where(UserDailyStats.game_type == game_type)
+        rows = self.db.execute(
+            query.group_by(UserDailyStats.game_type)
+            .having(func.sum(UserDailyStats.matches_played) > 0)
+            .order_by(UserDailyStats.game_type)
+        ).all()
+        by_type = [GameTypeStats.model_validate(r._mapping) for r in rows]
+        totals = {c: sum(getattr(s, c) for s in by_type) for c in COUNTERS}
+        return WindowStats(user_id=user_id, days=days, since=since, by_game_type=by_type, **totals)
+
+    def form(self, user_id: int) -> PlayerForm:
+        """A player's streaks and recent racks, one entry per game type played."""
+        rows = self.db.scalars(
+            select(UserForm)
+            .where(UserForm.user_id == user_id)
+            .order_by(UserForm.game_type)
+            .execution_options(populate_existing=True)
+        ).all()
+        return PlayerForm(
+            user_id=user_id,
+            by_game_type=[
+                GameTypeForm(
+                    game_type=GameTypeSchema(r.game_type.value),
+                    current_streak=r.current_streak,
+                    best_streak=r.best_streak,
+                    recent_racks="".join(
+                        "W" if r.recent_racks >> i & 1 else "L" for i in range(r.recent_rack_count)
+                    ),
+                    recent_racks_won=bin(r.recent_racks).count("1"),
+                )
+                for r in rows
+            ],
+        )
+
+    def apply_match(self, m: Match, sign: int = 1) -> None:
+        """Add an approved match to both players' recent results (`sign=-1` removes it).
+
+        The match lands in the daily bucket of the day its last rack was
+        played, as an additive upsert, so removing it is exact. Approving
+        advances both players' form by the match's racks; voiding replays
+        their form in the match's game type from what is left.
+        """
+        winners = self.db.execute(
+            select(Game.winner_user_id, Game.created_at)
+            .where(Game.match_id == m.id)
+            .order_by(Game.id)
+        ).all()
+        played_at = max((g.created_at for g in winners if g.created_at), default=None)
+        if played_at is None:
+            played_at = (
+                self.db.scalar(select(Approval.decided_at).where(Approval.match_id == m.id))
+                or datetime.utcnow()
+            )
+        rows = []
+        for user_id, mine, theirs in (
+            (m.creator_id, m.creator_score, m.opponent_score),
+            (m.opponent_id, m.opponent_score, m.creator_score),
+        ):
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "day": played_at.date(),
+                    "game_type": m.game_type,
+                    "matches_played": sign,
+                    "matches_won": sign * (mine > theirs),
+                    "matches_lost": sign * (mine < theirs),
+                    "racks_won": sign * mine,
+                    "racks_lost": sign * theirs,
+                }
+            )
+        upsert(self.db, UserDailyStats, ["user_id", "day", "game_type"], rows, increments=COUNTERS)
+
+        if sign < 0:
+            self._replay_form([m.creator_id, m.opponent_id], m.game_type)
+            return
+        current = {
+            r.user_id: {c: r._mapping[c] for c in FORM_COLUMNS}
+            for r in self.db.execute(
+                select(UserForm.user_id, *(getattr(UserForm, c) for c in FORM_COLUMNS))
+                .where(
+                    UserForm.user_id.in_([m.creator_id, m.opponent_id]),
+                    UserForm.game_type == m.game_type,
+                )
+                .with_for_update()
+            )
+        }
+        forms = []
+        for user_id, margin in (
+            (m.creator_id, m.creator_score - m.opponent_score),
+            (m.opponent_id, m.opponent_score - m.creator_score),
+        ):
+            form = current.get(user_id) or dict.fromkeys(FORM_COLUMNS, 0)
+            advance(form, margin, [g.winner_user_id == user_id for g in winners])
+            forms.append({"user_id": user_id, "game_type": m.game_type} | form)
+        upsert(self.db, UserForm, ["user_id", "game_type"], forms)
+
+    def rebuild(self) -> int:
+        """Recompute `user_daily_stats` (in SQL) and `user_form` from all approved matches.
+
+        For backfills and repairs; the regular path is `apply_match`.
+
+        Returns:
+            Number of daily buckets written.
+        """
+        last_rack = (
+            select(Game.match_id, func.max(Game.created_at).label("played_at"))
+            .group_by(Game.match_id)
+            .subquery()
+        )
+        day = func.date(
+            func.coalesce(last_rack.c.played_at, Approval.decided_at, func.current_timestamp())
+        )
+
+        def side(user_id: Any, mine: Any, theirs: Any) -> Any:
+            return (
+                select(
+                    user_id.label("user_id"),
+                    day.label("day"),
+                    Match.game_type.label("game_type"),
+                    literal(1).label("matches_played"),
+                    case((mine > theirs, 1), else_=0).label("matches_won"),
+                    case((mine < theirs, 1), else_=0).label("matches_lost"),
+                    mine.label("racks_won"),
+                    theirs.label("racks_lost"),
+                )
+                .outerjoin(last_rack, last_rack.c.match_id == Match.id)
+                .outerjoin(Approval, Approval.match_id == Match.id)
+                .where(Match.status == MatchStatus.APPROVED)
+            )
+
+        rows = union_all(
+            side(Match.creator_id, Match.creator_score, Match.opponent_score),
+            side(Match.opponent_id, Match.opponent_score, Match.creator_score),
+        ).subquery()
+        self.db.execute(delete(UserDailyStats))
+        invalidate_stats(self.db)
+        result = self.db.execute(
+            insert(UserDailyStats).from_select(
+                ["user_id", "day", "game_type", *COUNTERS],
+                select(
+                    rows.c.user_id,
+                    rows.c.day,
+                    rows.c.game_type,
+                    *(func.sum(rows.c[c]) for c in COUNTERS),
+                ).group_by(rows.c.user_id, rows.c.day, rows.c.game_type),
+            )
+        )
+        self._replay_form()
+        self.db.expire_all()
+        return result.rowcount or 0  # type: ignore[attr-defined]
+
+    def _replay_form(
+        self, user_ids: Optional[List[int]] = None, game_type: Optional[GameType] = None
+    ) -> None:
+        """Rewrite `user_form` rows from the approved history, in approval order.
+
+        Restricted to `user_ids` in `game_type` when given (a void); every
+        player otherwise (a rebuild). Reads one row per rack, each player's
+        side of a match as its own UNION ALL branch.
+        """
+
+        def side(user_id: Any, margin: Any) -> Any:
+            q = (
+                select(
+                    user_id.label("user_id"),
+                    Match.game_type.label("game_type"),
+                    Match.id.label("match_id"),
+                    margin.label("margin"),
+                    Approval.decided_at.label("decided_at"),
+                )
+                .outerjoin(Approval, Approval.match_id == Match.id)
+                .where(Match.status == MatchStatus.APPROVED)
+            )
+            if user_ids is not None:
+                q = q.where(user_id.in_(user_ids))
+            if game_type is not None:
+                q = q.where(Match.game_type == game_type)
+            return q
+
+        matches = union_all(
+            side(Match.creator_id, Match.creator_score - Match.opponent_score),
+            side(Match.opponent_id, Match.opponent_score - Match.creator_score),
+        ).subquery()
+        history = self.db.execute(
+            select(
+                matches.c.user_id,
+                matches.c.game_type,
+                matches.c.match_id,
+                matches.c.margin,
+                Game.winner_user_id,
+            )
+            .outerjoin(Game, Game.match_id == matches.c.match_id)
+            .order_by(
+                matches.c.user_id,
+                matches.c.game_type,
+                matches.c.decided_at.nulls_first(),
+                matches.c.match_id,
+                Game.id,
+            )
+        ).all()
+
+        forms = []
+        for (user_id, type_), player_rows in groupby(history, key=lambda r: (r[0], r[1])):
+            form: Dict[str, Any] = dict.fromkeys(FORM_COLUMNS, 0)
+            for (_, margin), racks in groupby(player_rows, key=lambda r: (r.match_id, r.margin)):
+                advance(form, margin, _racks_won(user_id, racks))
+            forms.append({"user_id": user_id, "game_type": type_} | form)
+
+        stale = delete(UserForm)
+        if user_ids is not None:
+            stale = stale.where(UserForm.user_id.in_(user_ids))
+        if game_type is not None:
+            stale = stale.where(UserForm.game_type == game_type)
+        self.db.execute(stale)
+        if forms:
+            self.db.execute(insert(UserForm), forms)
+
+
+def _racks_won(user_id: int, rows: Iterable[Any]) -> List[bool]:
+    # A match without games comes back as one row with no winner.
+    return [r.winner_user_id == user_id for r in rows if r.winner_user_id is not None]
@@ -1,9 +1,26 @@
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Dict, Optional, TypeVar
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from corner_pocket_backend.models.security import RefreshToken
 from corner_pocket_backend.core.security import REFRESH_TOKEN_EXPIRES_DAYS
 
+T = TypeVar("T")
+
+
+class RefreshTokenError(ValueError):
+    """The refresh token is unknown, expired, revoked, or not the caller's."""
+
+
+class RefreshTokenReuseError(RefreshTokenError):
+    """An already-rotated refresh token was presented again.
+
+    Treated as a sign the token leaked: every live refresh token of the user
+    is revoked, forcing a fresh login.
+    """
+
 
 class SecurityDbService:
     """Service for managing security tokens in the database.
@@ -21,7 +38,8 @@ class SecurityDbService:
 
         Args:
             user_id: The ID of the user associated with the token.
-            token_hash: The hash of the token.
+            token_hash: The digest of the token (`core.security.hash_token`);
+                the raw token is never stored.
             expires_at: When the token expires (defaults to now + REFRESH_TOKEN_EXPIRES_DAYS).
         """
         if expires_at is None:
@@ -38,6 +56,8 @@ class SecurityDbService:
     def get_refresh_token(self, token_hash: str) -> Optional[RefreshToken]:
         """Get a refresh token by its hash.
 
+        Served by the unique index on `token_hash`.
+
         Args:
             token_hash: The hash of the token.
         """
@@ -66,6 +86,76 @@ class SecurityDbService:
         refresh_token.revoked_at = datetime.utcnow()
         self.db.flush()
 
+    def rotate_refresh_token(
+        self,
+        token_hash: str,
+        new_token_hash: str,
+        user_id: int,
+        expires_at: Optional[datetime] = None,
+    ) -> RefreshToken:
+        """Revoke a live refresh token and store its replacement in one transaction.
+
+        The old token is claimed with a single conditional
+        ``UPDATE ... WHERE revoked_at IS NULL AND expires_at > now RETURNING``,
+        so of several concurrent rotations of the same token exactly one
+        succeeds; the row lock makes the others re-check and miss. The new
+        token is inserted and everything committed together.
+
+        Args:
+            token_hash: Digest of the presented refresh token.
+            new_token_hash: Digest of the replacement token.
+            user_id: Subject of the presented token; the row must belong to it.
+            expires_at: Expiry of the replacement (defaults to now + REFRESH_TOKEN_EXPIRES_DAYS).
+
+        Returns:
+            The newly stored refresh token.
+
+        Raises:
+            RefreshTokenReuseError: If the token was already revoked. All of the
+                user's live tokens are revoked and committed before raising.
+            RefreshTokenError: If the token is unknown, expired, or belongs to
+                another user.
+        """
+        now = datetime.utcnow()
+        claimed = self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+            )
+            .values(revoked_at=now)
+            .returning(RefreshToken.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+
+        if claimed is None:
+            reused = self.db.execute(
+                select(RefreshToken.id).where(
+                    RefreshToken.token_hash == token_hash,
+                    RefreshToken.user_id == user_id,
+                    RefreshToken.revoked_at.is_not(None),
+                )
+            ).scalar_one_or_none()
+            if reused is None:
+                self.db.rollback()
+                raise RefreshTokenError("invalid refresh token")
+            self.db.execute(
+                update(RefreshToken)
+                .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+                .values(revoked_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            raise RefreshTokenReuseError("refresh token reuse detected")
+
+        new_token = self.store_refresh_token(
+            user_id=user_id, token_hash=new_token_hash, expires_at=expires_at
+        )
+        self.db.commit()
+        return new_token
+
     def delete_refresh_token(self, token_hash: str) -> None:
         """Delete a refresh token.
 
@@ -74,3 +164,127 @@ class SecurityDbService:
         """
         self.db.query(RefreshToken).filter(RefreshToken.token_hash == token_hash).delete()
         self.db.commit()
+
+    def purge_expired_refresh_tokens(
+        self,
+        batch_size: int = 1000,
+        revoked_retention: timedelta = timedelta(days=1),
+        max_batches: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """Delete expired refresh tokens and long-revoked ones in bounded batches.
+
+        Each batch deletes at most `batch_size` rows picked by primary key and
+        commits on its own, so locks are held only briefly and a live database
+        keeps serving logins while a large backlog is drained.
+
+        Revoked tokens are kept for `revoked_retention` so that replaying a
+        recently rotated token is still recognised as reuse by
+        `rotate_refresh_token`.
+
+        Args:
+            batch_size: Rows deleted per statement/transaction.
+            revoked_retention: How long revoked tokens are kept after revocation.
+            max_batches: Stop after this many batches (None drains everything).
+
+        Returns:
+            ``deleted`` rows, ``batches`` run and ``elapsed_ms``.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        started = time.perf_counter()
+        now = datetime.utcnow()
+        reapable = or_(
+            RefreshToken.expires_at <= now,
+            RefreshToken.revoked_at <= now - revoked_retention,
+        )
+        deleted = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            ids = select(RefreshToken.id).where(reapable).limit(batch_size).scalar_subquery()
+            result = self.db.execute(
+                delete(RefreshToken)
+                .where(RefreshToken.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            batches += 1
+            removed = result.rowcount or 0  # type: ignore[attr-defined]
+            deleted += removed
+            if removed < batch_size:
+                break
+        return {
+            "deleted": deleted,
+            "batches": batches,
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }
+
+
+class AsyncSecurityDbService:
+    """Asyncio counterpart of `SecurityDbService`.
+
+    Methods run the synchronous implementation through `AsyncSession.run_sync`.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, fn: Callable[[SecurityDbService], T]) -> T:
+        return await self.db.run_sync(lambda session: fn(SecurityDbService(session)))
+
+    async def store_refresh_token(
+        self, user_id: int, token_hash: str, expires_at: Optional[datetime] = None
+    ) -> RefreshToken:
+        """See `SecurityDbService.store_refresh_token`."""
+        return await self._run(
+            lambda svc: svc.store_refresh_token(
+                user_id=user_id, token_hash=token_hash, expires_at=expires_at
+            )
+        )
+
+    async def get_refresh_token(self, token_hash: str) -> Optional[RefreshToken]:
+        """See `SecurityDbService.get_refresh_token`."""
+        return await self._run(lambda svc: svc.get_refresh_token(token_hash))
+
+    async def verify_refresh_token(self, token_hash: str) -> bool:
+        """See `SecurityDbService.verify_refresh_token`."""
+        return await self._run(lambda svc: svc.verify_refresh_token(token_hash))
+
+    async def revoke_refresh_token(self, token_hash: str) -> None:
+        """See `SecurityDbService.revoke_refresh_token`."""
+        await self._run(lambda svc: svc.revoke_refresh_token(token_hash))
+
+    async def rotate_refresh_token(
+        self,
+        token_hash: str,
+        new_token_hash: str,
+        user_id: int,
+        expires_at: Optional[datetime] = None,
+    ) -> RefreshToken:
+        """See `SecurityDbService.rotate_refresh_token`."""
+        return await self._run(
+            lambda svc: svc.rotate_refresh_token(
+                token_hash=token_hash,
+                new_token_hash=new_token_hash,
+                user_id=user_id,
+                expires_at=expires_at,
+            )
+        )
+
+    async def delete_refresh_token(self, token_hash: str) -> None:
+        """See `SecurityDbService.delete_refresh_token`."""
+        await self._run(lambda svc: svc.delete_refresh_token(token_hash))
+
+    async def purge_expired_refresh_tokens(
+        self,
+        batch_size: int = 1000,
+        revoked_retention: timedelta = timedelta(days=1),
+        max_batches: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """See `SecurityDbService.purge_expired_refresh_tokens`."""
+        return await self._run(
+            lambda svc: svc.purge_expired_refresh_tokens(
+                batch_size=batch_size,
+                revoked_retention=revoked_retention,
+                max_batches=max_batches,
+            )
+        )
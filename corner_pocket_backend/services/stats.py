@@ -1,26 +1,282 @@
-# from collections import Counter
-# from .matches import MATCHES, GAMES
-
-# class StatsService:
-#     """Aggregate basic statistics for users from in-memory match data."""
-
-#     def summary(self, user_id: str):
-#         """Compute a naive score differential by game type for a user.
-
-#         Counts wins and losses across approved matches and returns a per-game
-#         type score differential (wins minus losses). Intended as a placeholder
-#         until real analytics are implemented.
-#         """
-#         by_type = Counter()
-#         for m in MATCHES.values():
-#             if m["status"] != "APPROVED":
-#                 continue
-#             # BUG: This counts games from ALL matches, even ones the user didn't play in.
-#             # Should filter to matches where user_id is creator or opponent first.
-#             # Also, losses should only count games where opponent won, not "anyone != user".
-#             # Will fix when we replace this with proper DB queries.
-#             wins = sum(1 for g in GAMES.get(m["id"], []) if g.get("winner_user_id") == user_id)
-#             losses = sum(1 for g in GAMES.get(m["id"], []) if g.get("winner_user_id") != user_id)
-#             t = m["game_type"]
-#             by_type[t] += wins - losses
-#         return {"user_id": user_id, "by_game_type_score_diff": dict(by_type)}
+"""Player statistics.
+
+`StatsDbService` keeps the `user_stats` aggregate in step with approved
+matches: `MatchesDbService` applies each match when it is approved and
+reverses it when it is voided, in the same transaction. Reads are then a
+primary-key lookup per player.
+
+`StatsService` computes the same numbers straight from `games` and
+`matches` in one aggregate query. It is the fallback while `user_stats` is
+rebuilt and the reference `check` compares the materialized rows against.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    and_,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from corner_pocket_backend.core.db import upsert
+from corner_pocket_backend.models import Game, GameType, Match, MatchStatus, UserStats
+from corner_pocket_backend.schemas.stats import GameTypeStats, StatsDrift, StatsSummary
+from corner_pocket_backend.services.stats_cache import invalidate_stats
+
+COUNTERS = ("matches_played", "matches_won", "matches_lost", "racks_won", "racks_lost")
+
+
+class StatsDbService:
+    """Materialized per-player, per-game-type records (`user_stats`)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def summary(self, user_id: int) -> StatsSummary:
+        """A player's record overall and by game type.
+
+        One query on the (user_id, game_type) primary key, at most one row
+        per game type, however many games the player has. Rows a void has
+        brought back to zero are left out, as if never written.
+        """
+        rows = self.db.scalars(
+            select(UserStats)
+            .where(
+                UserStats.user_id == user_id,
+                or_(*(getattr(UserStats, c) != 0 for c in COUNTERS)),
+            )
+            .order_by(UserStats.game_type)
+            .execution_options(populate_existing=True)
+        ).all()
+        return _summarize(user_id, [GameTypeStats.model_validate(row) for row in rows])
+
+    def apply_match(self, m: Match, sign: int = 1) -> None:
+        """Add an approved match to both players' stats (`sign=-1` removes it).
+
+        The match's games are aggregated by (game type, winner, loser) in
+        one query and written with a single multi-row upsert that adds the
+        deltas to the existing rows. `last_played_at` only moves forward, so
+        removing a match leaves it as is.
+        """
+        deltas: Dict[Tuple[int, GameType], Dict[str, Any]] = {}
+
+        def row(user_id: int, game_type: GameType) -> Dict[str, Any]:
+            return deltas.setdefault(
+                (user_id, game_type),
+                {"user_id": user_id, "game_type": game_type, "last_played_at": None}
+                | dict.fromkeys(COUNTERS, 0),
+            )
+
+        racks = self.db.execute(
+            select(
+                Game.game_type,
+                Game.winner_user_id,
+                Game.loser_user_id,
+                func.count(Game.id),
+                func.max(Game.created_at),
+            )
+            .where(Game.match_id == m.id)
+            .group_by(Game.game_type, Game.winner_user_id, Game.loser_user_id)
+        ).all()
+        for game_type, winner_id, loser_id, count, played_at in racks:
+            row(winner_id, game_type)["racks_won"] += sign * count
+            row(loser_id, game_type)["racks_lost"] += sign * count
+            if sign > 0:
+                for user_id in (winner_id, loser_id):
+                    r = row(user_id, game_type)
+                    r["last_played_at"] = max(filter(None, (r["last_played_at"], played_at)))
+
+        for user_id, mine, theirs in (
+            (m.creator_id, m.creator_score, m.opponent_score),
+            (m.opponent_id, m.opponent_score, m.creator_score),
+        ):
+            r = row(user_id, m.game_type)
+            r["matches_played"] += sign
+            r["matches_won"] += sign * (mine > theirs)
+            r["matches_lost"] += sign * (mine < theirs)
+
+        def later(excluded: Any) -> Dict[str, Any]:
+            return {
+                "last_played_at": case(
+                    (excluded.last_played_at > UserStats.last_played_at, excluded.last_played_at),
+                    else_=func.coalesce(UserStats.last_played_at, excluded.last_played_at),
+                )
+            }
+
+        upsert(
+            self.db,
+            UserStats,
+            ["user_id", "game_type"],
+            list(deltas.values()),
+            increments=COUNTERS,
+            set_=later,
+        )
+
+    def rebuild(self) -> int:
+        """Recompute `user_stats` from all approved matches in SQL.
+
+        For backfills and repairs; the regular path is `apply_match`.
+
+        Returns:
+            Number of stats rows written.
+        """
+        self.db.execute(delete(UserStats))
+        invalidate_stats(self.db)
+        result = self.db.execute(
+            insert(UserStats).from_select(
+                ["user_id", "game_type", *COUNTERS, "last_played_at"], _aggregate_stats()
+            )
+        )
+        self.db.expire_all()
+        return result.rowcount or 0  # type: ignore[attr-defined]
+
+
+class StatsService:
+    """Player statistics computed live from approved matches and their games."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def summary(self, user_id: int) -> StatsSummary:
+        """A player's record overall and by game type, from the source tables.
+
+        One aggregate query: the player's racks won and lost (games of
+        approved matches where they are the winner or the loser) and their
+        approved matches, grouped by game type. Only the player's own games
+        are counted, and a loss is a game the player lost. Cost grows with
+        the player's history; `StatsDbService.summary` does not.
+        """
+        rows = self.db.execute(
+            _aggregate_stats(user_id).order_by(literal_column("game_type"))
+        ).all()
+        return _summarize(user_id, [GameTypeStats.model_validate(r._mapping) for r in rows])
+
+    def check(self, user_ids: Optional[Sequence[int]] = None) -> List[StatsDrift]:
+        """Compare `user_stats` counters with the live aggregate.
+
+        A full outer join in SQL of the recomputed rows and the stored ones,
+        returning only rows that differ. A missing row counts as all zeros,
+        so the zeroed rows a void leaves behind are not drift.
+        `last_played_at` is not compared: a void does not roll it back.
+
+        Args:
+            user_ids: Players to check; all of them when omitted.
+        """
+        live = _aggregate_stats(user_ids).subquery()
+        stored = select(UserStats)
+        if user_ids is not None:
+            stored = stored.where(UserStats.user_id.in_(user_ids))
+        mat = stored.subquery()
+
+        def zero_if_missing(col: Any) -> Any:
+            return func.coalesce(col, 0)
+
+        rows = self.db.execute(
+            select(
+                func.coalesce(live.c.user_id, mat.c.user_id).label("user_id"),
+                func.coalesce(live.c.game_type, mat.c.game_type).label("game_type"),
+                *(zero_if_missing(live.c[c]).label(f"live_{c}") for c in COUNTERS),
+                *(zero_if_missing(mat.c[c]).label(f"mat_{c}") for c in COUNTERS),
+            )
+            .select_from(
+                live.join(
+                    mat,
+                    and_(mat.c.user_id == live.c.user_id, mat.c.game_type == live.c.game_type),
+                    full=True,
+                )
+            )
+            .where(
+                or_(*(zero_if_missing(live.c[c]) != zero_if_missing(mat.c[c]) for c in COUNTERS))
+            )
+            .order_by(literal_column("user_id"), literal_column("game_type"))
+        ).all()
+        return [
+            StatsDrift(
+                user_id=r.user_id,
+                game_type=r.game_type,
+                live={c: r._mapping[f"live_{c}"] for c in COUNTERS},
+                materialized={c: r._mapping[f"mat_{c}"] for c in COUNTERS},
+            )
+            for r in rows
+        ]
+
+
+def _summarize(user_id: int, by_type: List[GameTypeStats]) -> StatsSummary:
+    totals = {c: sum(getattr(s, c) for s in by_type) for c in COUNTERS}
+    return StatsSummary(user_id=user_id, by_game_type=by_type, **totals)
+
+
+def _aggregate_stats(user_ids: Union[int, Sequence[int], None] = None) -> Any:
+    """SELECT of `user_stats` rows computed from approved matches and their games.
+
+    Args:
+        user_ids: Restrict to one player or a list of them; every player when
+            omitted. The filter is applied inside each branch so the
+            per-participant indexes are used.
+    """
+    approved = Match.status == MatchStatus.APPROVED
+
+    def player(user_id: Any) -> Any:
+        if user_ids is None:
+            return true()
+        if isinstance(user_ids, int):
+            return user_id == user_ids
+        return user_id.in_(user_ids)
+
+    def zero() -> ColumnElement[int]:
+        return literal(0, Integer)
+
+    def racks(user_id: Any, won: int, lost: int) -> Any:
+        return (
+            select(
+                user_id.label("user_id"),
+                Game.game_type.label("game_type"),
+                zero().label("matches_played"),
+                zero().label("matches_won"),
+                zero().label("matches_lost"),
+                literal(won, Integer).label("racks_won"),
+                literal(lost, Integer).label("racks_lost"),
+                Game.created_at.label("played_at"),
+            )
+            .join(Match, Match.id == Game.match_id)
+            .where(approved, player(user_id))
+        )
+
+    def matches(user_id: Any, mine: Any, theirs: Any) -> Any:
+        return select(
+            user_id,
+            Match.game_type,
+            literal(1, Integer),
+            case((mine > theirs, 1), else_=0),
+            case((mine < theirs, 1), else_=0),
+            zero(),
+            zero(),
+            cast(null(), DateTime),
+        ).where(approved, player(user_id))
+
+    rows = union_all(
+        racks(Game.winner_user_id, 1, 0),
+        racks(Game.loser_user_id, 0, 1),
+        matches(Match.creator_id, Match.creator_score, Match.opponent_score),
+        matches(Match.opponent_id, Match.opponent_score, Match.creator_score),
+    ).subquery()
+    return select(
+        rows.c.user_id,
+        rows.c.game_type,
+        *(func.sum(rows.c[c]).label(c) for c in COUNTERS),
+        func.max(rows.c.played_at).label("last_played_at"),
+    ).group_by(rows.c.user_id, rows.c.game_type)
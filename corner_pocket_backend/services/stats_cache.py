@@ -0,0 +1,97 @@
+"""Stats response cache.
+
+Per-player stats reads (summary, ratings, head-to-head, rivals, window,
+form) are answered from `stats_cache`, keyed by the player and the query.
+Entries expire after `STATS_CACHE_TTL_SECONDS` and are evicted LRU, but a
+player's entries are normally dropped sooner: `MatchesDbService` calls
+`invalidate_stats` for both players of a match it approves or voids, and
+the invalidation is published on the broker once the transaction commits,
+so every worker drops the entries it holds for them.
+
+Invalidating bumps a per-player generation that is part of every key
+rather than deleting entries: a read that started before the write and
+finishes after it stores its result under the old generation, where it is
+never found again, instead of reinstating stale data.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, TypeVar
+
+from sqlalchemy.orm import Session
+
+from corner_pocket_backend.core.cache import Cache, build_cache
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import on_commit
+from corner_pocket_backend.core.metrics import registry
+from corner_pocket_backend.core.pubsub import Message, broker
+
+T = TypeVar("T")
+
+CHANNEL = "stats.invalidate"
+
+# (epoch, user_id, generation, query)
+Key = Tuple[int, int, int, Hashable]
+
+
+class StatsCache:
+    """Cache of per-player results with per-player and global invalidation.
+
+    Args:
+        cache: Backing store; its TTL and size bound every entry.
+    """
+
+    def __init__(self, cache: Cache[Key, Any]):
+        self._cache = cache
+        self._generations: Dict[int, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.invalidations = 0
+
+    def get_or_load(self, user_id: int, query: Hashable, load: Callable[[], T]) -> T:
+        """Return the cached result of `query` for `user_id`, or `load()` and cache it."""
+        with self._lock:
+            key: Key = (self._epoch, user_id, self._generations.get(user_id, 0), query)
+        value = self._cache.get(key)
+        if value is None:
+            value = load()
+            self._cache.set(key, value)
+        return value
+
+    def invalidate(self, user_ids: Optional[Iterable[int]] = None) -> None:
+        """Make the cached results of `user_ids` (every player when None) unreachable."""
+        with self._lock:
+            self.invalidations += 1
+            if user_ids is None:
+                self._epoch += 1
+                self._generations.clear()
+                self._cache.clear()
+                return
+            for user_id in user_ids:
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self.invalidate()
+
+    def stats(self) -> Dict[str, float]:
+        """Backing cache counters (hits, misses, hit ratio, size) plus invalidations."""
+        return self._cache.stats() | {"invalidations": self.invalidations}
+
+
+stats_cache = StatsCache(
+    build_cache(max_size=settings.STATS_CACHE_MAX_SIZE, ttl=settings.STATS_CACHE_TTL_SECONDS)
+)
+registry.register("stats_cache", lambda: stats_cache.stats())
+
+
+def _on_message(message: Message) -> None:
+    stats_cache.invalidate(message.get("user_ids"))
+
+
+broker.subscribe(CHANNEL, _on_message)
+
+
+def invalidate_stats(db: Session, user_ids: Optional[Iterable[int]] = None) -> None:
+    """Drop cached stats of `user_ids` (everyone when None) on every worker once `db` commits."""
+    ids = sorted(set(user_ids)) if user_ids is not None else None
+    on_commit(db, lambda: broker.publish(CHANNEL, {"user_ids": ids}))
@@ -0,0 +1,164 @@
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+from sqlalchemy import Select, event, select, union_all, update
+from sqlalchemy.orm import Session, SessionTransaction, aliased
+
+from corner_pocket_backend.models import (
+    Approval,
+    Change,
+    ChangeEntity,
+    ChangeLogHead,
+    ChangeOp,
+    Game,
+    Match,
+)
+from corner_pocket_backend.schemas.matches import GameOut, MatchSummary
+from corner_pocket_backend.schemas.sync import ApprovalChange, SyncPage, Tombstone
+
+M = TypeVar("M", Match, Game, Approval)
+
+MAX_SYNC_LIMIT = 1000
+
+# Session.info key set while the session has feed entries to position on commit.
+UNSTAMPED = "change_log_unstamped"
+
+
+def mark_unstamped(db: Session) -> None:
+    """Have `db` position its new feed entries when its transaction commits."""
+    db.info[UNSTAMPED] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _stamp_changes(session: Session) -> None:
+    """Give this transaction's feed entries the next positions, in `seq` order.
+
+    Runs as the last step before COMMIT. Advancing `change_log_head` locks
+    its row until the transaction ends, so a concurrent writer waits here
+    and receives higher positions only once this one has committed: a
+    reader never sees position N before everything below it is visible.
+    Only this transaction's own entries lack a position; other writers'
+    are either invisible (uncommitted) or already stamped.
+    """
+    if session.in_nested_transaction() or not session.info.pop(UNSTAMPED, False):
+        return
+    session.flush()
+    seqs = list(
+        session.scalars(select(Change.seq).where(Change.position.is_(None)).order_by(Change.seq))
+    )
+    if not seqs:
+        return
+    head = session.scalars(
+        update(ChangeLogHead)
+        .values(position=ChangeLogHead.position + len(seqs))
+        .returning(ChangeLogHead.position)
+    ).one()
+    first = head - len(seqs) + 1
+    session.execute(
+        update(Change).execution_options(synchronize_session=False),
+        [{"seq": seq, "position": first + i} for i, seq in enumerate(seqs)],
+    )
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_unstamped(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(UNSTAMPED, None)
+
+
+class SyncDbService:
+    """Read the match change feed written by `MatchesDbService`."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def changes_since(
+        self,
+        user_id: int,
+        since: int = 0,
+        limit: int = 500,
+    ) -> SyncPage:
+        """Return what changed for `user_id` after position `since`.
+
+        Reads at most `limit` feed entries (one index range scan per
+        participant column), collapses repeated changes to the same row, and
+        loads the current state of the rows still present with one query per
+        entity type. Work is proportional to the changes since the cursor, not
+        to the user's history.
+
+        The cursor is `Change.position`, which follows commit order, so
+        a transaction still open when a page is served cannot later commit
+        entries behind `next_since`.
+
+        Raises:
+            ValueError: If `since` is negative or `limit` out of range.
+        """
+        if since < 0:
+            raise ValueError("since must not be negative")
+        if not 1 <= limit <= MAX_SYNC_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_SYNC_LIMIT}")
+
+        entries = self._entries(user_id, since, limit + 1)
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        next_since = since
+        if entries:
+            # Only stamped entries match ``position > since``.
+            assert entries[-1].position is not None
+            next_since = entries[-1].position
+
+        latest: Dict[Tuple[ChangeEntity, int], ChangeOp] = {}
+        for entry in entries:
+            latest[(entry.entity, entry.entity_id)] = entry.op
+
+        def upserted(entity: ChangeEntity) -> List[int]:
+            return [i for (e, i), op in latest.items() if e == entity and op == ChangeOp.UPSERT]
+
+        matches = self._current(Match, upserted(ChangeEntity.MATCH))
+        games = self._current(Game, upserted(ChangeEntity.GAME))
+        approvals = self._current(Approval, upserted(ChangeEntity.APPROVAL))
+        present = {
+            ChangeEntity.MATCH: matches.keys(),
+            ChangeEntity.GAME: games.keys(),
+            ChangeEntity.APPROVAL: approvals.keys(),
+        }
+        return SyncPage(
+            since=since,
+            next_since=next_since,
+            has_more=has_more,
+            matches=[MatchSummary.model_validate(m) for m in matches.values()],
+            games=[GameOut.model_validate(g) for g in games.values()],
+            approvals=[ApprovalChange.model_validate(a) for a in approvals.values()],
+            deleted=[
+                Tombstone(entity=entity.value, id=entity_id)
+                for (entity, entity_id) in latest
+                if entity_id not in present[entity]
+            ],
+        )
+
+    def _current(self, model: Type[M], ids: List[int]) -> Dict[int, M]:
+        """Current rows of `model` among `ids`; rows deleted since are absent."""
+        if not ids:
+            return {}
+        return {row.id: row for row in self.db.scalars(select(model).where(model.id.in_(ids)))}
+
+    def _entries(self, user_id: int, since: int, limit: int) -> List[Change]:
+        """Feed entries for a participant, in position order.
+
+        Each side is a separate ``participant = :u AND position > :since`` range on
+        its own index, limited before the merge, like the match listing.
+        """
+
+        def side(*criteria: Any) -> "Select[tuple[Change]]":
+            return (
+                select(Change)
+                .where(*criteria, Change.position > since)
+                .order_by(Change.position)
+                .limit(limit)
+            )
+
+        sides = union_all(
+            select(side(Change.creator_id == user_id).subquery()),
+            select(side(Change.opponent_id == user_id, Change.creator_id != user_id).subquery()),
+        ).subquery()
+        entry = aliased(Change, sides)
+        return list(self.db.scalars(select(entry).order_by(entry.position).limit(limit)))
@@ -1,9 +1,43 @@
-from typing import Optional
-from sqlalchemy.orm import Session
+import threading
+from typing import Any, Callable, Dict, Optional, TypeVar
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 from sqlalchemy.exc import IntegrityError
 
 from corner_pocket_backend.models import User
-from corner_pocket_backend.core.password import verify_password
+from corner_pocket_backend.core.cache import Cache, build_cache
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import on_commit
+from corner_pocket_backend.core.metrics import registry
+from corner_pocket_backend.core.password import password_pool, verify_password
+
+T = TypeVar("T")
+
+# Column snapshots of recently authenticated users, keyed by id. Snapshots
+# rather than ORM instances are cached so no session state leaks between
+# requests. Replace with any `Cache` implementation to plug in another store.
+user_cache: Cache[int, Dict[str, Any]] = build_cache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+registry.register("user_cache", lambda: user_cache.stats())
+
+# Never cached: only the credential checks read it, and they load the row.
+UNCACHED_COLUMNS = frozenset({"password_hash"})
+
+# Bumped by every invalidation. A refill stores its snapshot only if no
+# invalidation ran since it started reading, so a row read before an edit
+# committed cannot be put back after the edit dropped it.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop `user_id` from this worker's `user_cache` and discard refills in flight."""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        user_cache.delete(user_id)
 
 
 class UsersDbService:
@@ -66,6 +100,41 @@ class UsersDbService:
         """
         return self.db.get(User, user_id)
 
+    def get_by_id_cached(self, user_id: int) -> Optional[User]:
+        """Get a user by ID, serving repeat lookups from `user_cache`.
+
+        A hit is attached to this session with `merge(load=False)`, so it
+        behaves like a loaded row without a database round trip. The
+        password hash is not cached; reading it from a hit loads it. Entries
+        are dropped on this worker when an `edit_user`/`delete_user`
+        transaction commits, and a lookup that read the row before that
+        commit does not store it afterwards. Other workers only see the
+        change once their entry expires after USER_CACHE_TTL_SECONDS.
+
+        Args:
+            user_id: The primary key ID of the user.
+
+        Returns:
+            The User if found, None otherwise.
+        """
+        snapshot = user_cache.get(user_id)
+        if snapshot is not None:
+            cached = User(**snapshot)
+            make_transient_to_detached(cached)
+            return self.db.merge(cached, load=False)
+        generation = _generation
+        user = self.get_by_id(user_id)
+        if user is not None:
+            snapshot = {
+                attr.key: getattr(user, attr.key)
+                for attr in inspect(User).column_attrs
+                if attr.key not in UNCACHED_COLUMNS
+            }
+            with _generation_lock:
+                if generation == _generation:
+                    user_cache.set(user_id, snapshot)
+        return user
+
     def authenticate(self, email: str, password: str) -> Optional[User]:
         """Authenticate a user by email and password.
 
@@ -102,6 +171,7 @@ class UsersDbService:
             raise ValueError("user not found")
         self.db.delete(user)
         self.db.flush()
+        on_commit(self.db, lambda: invalidate_user(user_id))
         return user
 
     def edit_user(
@@ -140,4 +210,70 @@ class UsersDbService:
         except IntegrityError as e:
             self.db.rollback()
             raise ValueError("User with this email or handle already exists") from e
+        on_commit(self.db, lambda: invalidate_user(user_id))
         return user
+
+
+class AsyncUsersDbService:
+    """Asyncio counterpart of `UsersDbService`.
+
+    Each method runs the synchronous implementation through
+    `AsyncSession.run_sync`, so I/O goes through the async driver while the
+    validation rules stay in one place.
+
+    Args:
+        db: SQLAlchemy `AsyncSession` for executing queries.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, fn: Callable[[UsersDbService], T]) -> T:
+        return await self.db.run_sync(lambda session: fn(UsersDbService(session)))
+
+    async def create(self, email: str, handle: str, display_name: str, password_hash: str) -> User:
+        """See `UsersDbService.create`."""
+        return await self._run(
+            lambda svc: svc.create(
+                email=email, handle=handle, display_name=display_name, password_hash=password_hash
+            )
+        )
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """See `UsersDbService.get_by_email`."""
+        return await self._run(lambda svc: svc.get_by_email(email))
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """See `UsersDbService.get_by_id`."""
+        return await self._run(lambda svc: svc.get_by_id(user_id))
+
+    async def get_by_id_cached(self, user_id: int) -> Optional[User]:
+        """See `UsersDbService.get_by_id_cached`."""
+        return await self._run(lambda svc: svc.get_by_id_cached(user_id))
+
+    async def authenticate(self, email: str, password: str) -> Optional[User]:
+        """See `UsersDbService.authenticate`; verification runs on the hashing pool."""
+        user = await self.get_by_email(email)
+        if not user or not user.password_hash:
+            return None
+        if not await password_pool.verify(password, user.password_hash):
+            return None
+        return user
+
+    async def delete_user(self, user_id: int) -> User:
+        """See `UsersDbService.delete_user`."""
+        return await self._run(lambda svc: svc.delete_user(user_id))
+
+    async def edit_user(
+        self,
+        user_id: int,
+        email: Optional[str] = None,
+        handle: Optional[str] = None,
+        display_name: Optional[str] = None,
+    ) -> User:
+        """See `UsersDbService.edit_user`."""
+        return await self._run(
+            lambda svc: svc.edit_user(
+                user_id=user_id, email=email, handle=handle, display_name=display_name
+            )
+        )
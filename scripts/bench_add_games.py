@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark adding games to a match: per-game calls vs the bulk path.
+
+For 1, 15 and 100 games per call, times a loop of `MatchesDbService.add_game`
+against one `MatchesDbService.add_games` call and counts the SQL statements
+each issues. Every call runs in a transaction that is rolled back, so the
+database is left unchanged.
+
+Usage:
+    poetry run python scripts/bench_add_games.py --iterations 50
+    poetry run python scripts/bench_add_games.py --url sqlite:///bench.db
+"""
+
+import argparse
+import time
+import uuid
+from typing import Any, Callable, List
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.models import Base, Game, GameType, Match, User
+from corner_pocket_backend.services.matches import MatchesDbService
+
+SIZES = (1, 15, 100)
+
+
+def measure(
+    session: Session, statements: List[str], fn: Callable[[], Any], iterations: int
+) -> tuple[float, float]:
+    """Return (ms per call, statements per call), rolling back after each call."""
+    elapsed = 0.0
+    statements.clear()
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        session.flush()
+        elapsed += time.perf_counter() - started
+        session.rollback()
+    return elapsed / iterations * 1000, len(statements) / iterations
+
+
+def main(url: str, iterations: int) -> None:
+    engine = create_engine(url)
+    if engine.dialect.name == "sqlite":
+        Base.metadata.create_all(engine)
+    statements: List[str] = []
+    event.listen(
+        engine, "before_cursor_execute", lambda conn, cur, stmt, *args: statements.append(stmt)
+    )
+
+    suffix = uuid.uuid4().hex[:8]
+    with Session(engine) as setup:
+        a = User(email=f"a-{suffix}@bench", handle=f"a_{suffix}", display_name="A")
+        b = User(email=f"b-{suffix}@bench", handle=f"b_{suffix}", display_name="B")
+        setup.add_all([a, b])
+        setup.flush()
+        m = Match(creator_id=a.id, opponent_id=b.id, game_type=GameType.NINE_BALL, race_to=100)
+        setup.add(m)
+        setup.commit()
+        user_ids, match_id = (a.id, b.id), m.id
+
+    try:
+        with Session(engine) as db:
+            svc = MatchesDbService(db)
+            print(f"add games  iterations={iterations}  dialect={engine.dialect.name}")
+            print(
+                f"{'games':>6} {'loop ms':>9} {'stmts':>6} {'bulk ms':>9} {'stmts':>6} {'speedup':>8}"
+            )
+            for size in SIZES:
+                winners = [user_ids[i % 2] for i in range(size)]
+
+                def loop() -> None:
+                    for w in winners:
+                        svc.add_game(
+                            match_id=match_id,
+                            winner_user_id=w,
+                            loser_user_id=user_ids[0] + user_ids[1] - w,
+                            game_type=GameType.NINE_BALL,
+                            acting_user_id=user_ids[0],
+                        )
+
+                def bulk() -> None:
+                    svc.add_games(
+                        user_id=user_ids[0],
+                        match_id=match_id,
+                        games=[
+                            Game(
+                                winner_user_id=w,
+                                loser_user_id=user_ids[0] + user_ids[1] - w,
+                                game_type=GameType.NINE_BALL,
+                            )
+                            for w in winners
+                        ],
+                    )
+
+                loop_ms, loop_stmts = measure(db, statements, loop, iterations)
+                bulk_ms, bulk_stmts = measure(db, statements, bulk, iterations)
+                print(
+                    f"{size:>6} {loop_ms:>9.2f} {loop_stmts:>6.0f} "
+                    f"{bulk_ms:>9.2f} {bulk_stmts:>6.0f} {loop_ms / bulk_ms:>7.1f}x"
+                )
+    finally:
+        with Session(engine) as cleanup:
+            cleanup.query(Match).filter(Match.id == match_id).delete()
+            cleanup.query(User).filter(User.id.in_(user_ids)).delete()
+            cleanup.commit()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=settings.database_url)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    main(args.url, args.iterations)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark GET /api/v1/auth/me with the sync and async DB paths.
+
+Drives the ASGI app in-process with concurrent httpx requests against the
+configured Postgres database, once with the threadpool-bound sync dependency
+and once with the asyncpg-backed one, and reports requests/sec for each.
+
+Usage:
+    poetry run python scripts/bench_auth_me.py --requests 5000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Any, Callable
+
+import httpx
+
+from corner_pocket_backend.core.db import async_engine, session_scope
+from corner_pocket_backend.core.security import (
+    create_access_token,
+    current_user,
+    get_current_user,
+    get_current_user_async,
+)
+from corner_pocket_backend.main import corner_pocket_backend
+from corner_pocket_backend.services.users import UsersDbService
+
+
+async def run_mode(
+    dependency: Callable[..., Any], token: str, requests: int, concurrency: int
+) -> float:
+    """Fire `requests` GETs with `concurrency` in flight and return requests/sec."""
+    corner_pocket_backend.dependency_overrides[current_user] = dependency
+    transport = httpx.ASGITransport(app=corner_pocket_backend)
+    headers = {"Authorization": f"Bearer {token}"}
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            for _ in remaining:
+                r = await client.get("/api/v1/auth/me", headers=headers)
+                r.raise_for_status()
+
+        # Warm up pools before timing.
+        await client.get("/api/v1/auth/me", headers=headers)
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    corner_pocket_backend.dependency_overrides.clear()
+    return requests / elapsed
+
+
+async def main(requests: int, concurrency: int) -> None:
+    suffix = uuid.uuid4().hex[:8]
+    with session_scope() as db:
+        user = UsersDbService(db).create(
+            email=f"bench-{suffix}@example.com",
+            handle=f"bench_{suffix}",
+            display_name="Bench",
+            password_hash="",
+        )
+        user_id = user.id
+    token = create_access_token({"sub": str(user_id)})
+
+    try:
+        sync_rps = await run_mode(get_current_user, token, requests, concurrency)
+        async_rps = await run_mode(get_current_user_async, token, requests, concurrency)
+    finally:
+        with session_scope() as db:
+            UsersDbService(db).delete_user(user_id)
+        await async_engine.dispose()
+
+    print(f"/auth/me  requests={requests} concurrency={concurrency}")
+    print(f"  sync  (threadpool): {sync_rps:8.1f} req/s")
+    print(f"  async (asyncpg)   : {async_rps:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark syncing an offline-scored match: sequential calls vs the batch endpoint.
+
+Records a 15-rack match through the API both ways and reports time and SQL
+statements per match:
+
+- sequential: POST /matches, one POST /matches/{id}/games per rack and a
+  submit (17 requests, 17 commits);
+- batch: one POST /matches/batch with the games and ``submit: true``.
+
+Requests go through the ASGI app in-process (auth, validation, session
+setup and commit included, no network). Matches created by the run are
+deleted afterwards.
+
+Usage:
+    poetry run python scripts/bench_match_batch.py --iterations 50
+    poetry run python scripts/bench_match_batch.py --url sqlite:///bench.db
+"""
+
+import argparse
+import time
+import uuid
+from typing import Callable, Iterator, List
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import get_db
+from corner_pocket_backend.core.security import create_access_token
+from corner_pocket_backend.main import corner_pocket_backend
+from corner_pocket_backend.models import Approval, Base, Game, Match, User
+
+RACKS = 15
+
+
+def measure(statements: List[str], fn: Callable[[], None], iterations: int) -> tuple[float, float]:
+    """Return (ms per match, statements per match)."""
+    statements.clear()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - started
+    return elapsed / iterations * 1000, len(statements) / iterations
+
+
+def main(url: str, iterations: int) -> None:
+    engine = create_engine(url)
+    if engine.dialect.name == "sqlite":
+        Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    statements: List[str] = []
+    event.listen(
+        engine, "before_cursor_execute", lambda conn, cur, stmt, *args: statements.append(stmt)
+    )
+
+    def bench_db() -> Iterator[Session]:
+        with SessionLocal() as db:
+            yield db
+
+    suffix = uuid.uuid4().hex[:8]
+    with SessionLocal() as setup:
+        a = User(email=f"a-{suffix}@bench", handle=f"a_{suffix}", display_name="A")
+        b = User(email=f"b-{suffix}@bench", handle=f"b_{suffix}", display_name="B")
+        setup.add_all([a, b])
+        setup.commit()
+        creator_id, opponent_id = a.id, b.id
+
+    # Alternate winners so the race (to 15) is not won and the submit is explicit.
+    winners = [creator_id if i % 2 == 0 else opponent_id for i in range(RACKS)]
+    match = {"opponent_id": opponent_id, "game_type": "NINE_BALL", "race_to": RACKS}
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(creator_id)})}"}
+    corner_pocket_backend.dependency_overrides[get_db] = bench_db
+    client = TestClient(corner_pocket_backend)
+
+    def sequential() -> None:
+        created = client.post("/api/v1/matches", json=match, headers=headers)
+        created.raise_for_status()
+        match_id = created.json()["id"]
+        for winner in winners:
+            client.post(
+                f"/api/v1/matches/{match_id}/games",
+                json={"winner_user_id": winner},
+                headers=headers,
+            ).raise_for_status()
+        client.post(f"/api/v1/matches/{match_id}/submit", headers=headers).raise_for_status()
+
+    def batch() -> None:
+        games = [{"winner_user_id": winner} for winner in winners]
+        response = client.post(
+            "/api/v1/matches/batch",
+            json={"matches": [{**match, "games": games, "submit": True}]},
+            headers=headers,
+        )
+        response.raise_for_status()
+        assert response.json()["results"][0]["status_code"] == 200
+
+    try:
+        sequential()  # warm up
+        seq_ms, seq_stmts = measure(statements, sequential, iterations)
+        batch_ms, batch_stmts = measure(statements, batch, iterations)
+    finally:
+        corner_pocket_backend.dependency_overrides.clear()
+        with SessionLocal() as cleanup:
+            match_ids = cleanup.query(Match.id).filter(Match.creator_id == creator_id)
+            cleanup.query(Approval).filter(Approval.match_id.in_(match_ids)).delete()
+            cleanup.query(Game).filter(Game.match_id.in_(match_ids)).delete()
+            cleanup.query(Match).filter(Match.creator_id == creator_id).delete()
+            cleanup.query(User).filter(User.id.in_([creator_id, opponent_id])).delete()
+            cleanup.commit()
+        engine.dispose()
+
+    print(f"{RACKS}-rack match  iterations={iterations}  dialect={engine.dialect.name}")
+    print(f"{'path':>10} {'requests':>9} {'ms/match':>9} {'stmts':>6}")
+    print(f"{'sequential':>10} {RACKS + 2:>9} {seq_ms:>9.2f} {seq_stmts:>6.0f}")
+    print(f"{'batch':>10} {1:>9} {batch_ms:>9.2f} {batch_stmts:>6.0f}")
+    print(f"speedup: {seq_ms / batch_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=settings.database_url)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    main(args.url, args.iterations)
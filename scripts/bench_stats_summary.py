@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark stats over a large history: summaries, consistency check, re-rating.
+
+Loads a synthetic history (default 10M games between 1,000 players, about
+90% of matches approved), builds `user_stats` with `StatsDbService.rebuild`,
+then times for a sample of players:
+
+- live: `StatsService.summary`, one aggregate query over games and matches;
+- materialized: `StatsDbService.summary`, a primary-key lookup.
+
+It also times a full `StatsService.check` of the materialized rows against
+the live aggregate, which should report no drift, and a full ratings
+recompute (`RatingsDbService.recompute`). Loading 10M games takes a
+while; point --url at a scratch database. The synthetic rows are deleted
+afterwards unless --keep is given.
+
+Usage:
+    poetry run python scripts/bench_stats_summary.py --games 10000000
+    poetry run python scripts/bench_stats_summary.py --url sqlite:///bench.db --games 1000000
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.orm import Session
+
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.metrics import LatencyRecorder
+from corner_pocket_backend.models import (
+    Base,
+    Game,
+    GameType,
+    Match,
+    MatchStatus,
+    Rating,
+    User,
+    UserStats,
+)
+from corner_pocket_backend.services.ratings import RatingsDbService
+from corner_pocket_backend.services.stats import StatsDbService, StatsService
+
+CHUNK = 50_000
+STATUSES = [MatchStatus.APPROVED] * 9 + [MatchStatus.SUBMITTED]
+
+
+def load(db: Session, games: int, players: int, rng: random.Random) -> List[int]:
+    """Insert `players` users and matches totalling `games` games; return the user ids."""
+    suffix = uuid.uuid4().hex[:8]
+    user_ids = list(
+        db.scalars(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            [
+                {"email": f"p{i}-{suffix}@bench", "handle": f"p{i}_{suffix}", "display_name": "P"}
+                for i in range(players)
+            ],
+        )
+    )
+    started = datetime.utcnow() - timedelta(days=365)
+    written = 0
+    while written < games:
+        matches: List[Dict[str, Any]] = []
+        racks: List[List[int]] = []
+        while written < games and sum(map(len, racks)) < CHUNK:
+            creator, opponent = rng.sample(user_ids, 2)
+            race_to = rng.randint(5, 9)
+            score = {creator: 0, opponent: 0}
+            winners: List[int] = []
+            while max(score.values()) < race_to and written + len(winners) < games:
+                w = creator if rng.random() < 0.5 else opponent
+                score[w] += 1
+                winners.append(w)
+            written += len(winners)
+            matches.append(
+                {
+                    "creator_id": creator,
+                    "opponent_id": opponent,
+                    "game_type": rng.choice(list(GameType)),
+                    "race_to": race_to,
+                    "status": rng.choice(STATUSES),
+                    "creator_score": score[creator],
+                    "opponent_score": score[opponent],
+                }
+            )
+            racks.append(winners)
+        match_ids = db.scalars(
+            insert(Match).returning(Match.id, sort_by_parameter_order=True), matches
+        ).all()
+        rows = []
+        for match_id, m, winners in zip(match_ids, matches, racks):
+            pair = m["creator_id"] + m["opponent_id"]
+            played_at = started + timedelta(minutes=rng.randrange(525_600))
+            rows.extend(
+                {
+                    "match_id": match_id,
+                    "game_type": m["game_type"],
+                    "winner_user_id": w,
+                    "loser_user_id": pair - w,
+                    "created_at": played_at + timedelta(minutes=10 * i),
+                }
+                for i, w in enumerate(winners)
+            )
+        db.execute(insert(Game), rows)
+        db.commit()
+        print(f"  loaded {written:,} games", end="\r", flush=True)
+    print()
+    return user_ids
+
+
+def timed(fn: Callable[[], Any]) -> float:
+    """Return the milliseconds `fn` took."""
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def main(url: str, games: int, players: int, sample: int, keep: bool) -> None:
+    engine = create_engine(url)
+    if engine.dialect.name == "sqlite":
+        Base.metadata.create_all(engine)
+    rng = random.Random(42)
+
+    with Session(engine) as db:
+        print(f"stats summary  games={games:,}  players={players:,}  dialect={engine.dialect.name}")
+        user_ids: List[int] = []
+        load_ms = timed(lambda: user_ids.extend(load(db, games, players, rng)))
+        print(f"load        {load_ms / 1000:>10.1f} s")
+
+        def rebuild() -> None:
+            StatsDbService(db).rebuild()
+            db.commit()
+
+        print(f"rebuild     {timed(rebuild) / 1000:>10.1f} s")
+
+        def rerate() -> None:
+            RatingsDbService(db).recompute()
+            db.commit()
+
+        print(f"re-rate     {timed(rerate) / 1000:>10.1f} s")
+
+        live, materialized = LatencyRecorder(), LatencyRecorder()
+        for user_id in rng.sample(user_ids, min(sample, len(user_ids))):
+            live.observe(timed(lambda: StatsService(db).summary(user_id)) / 1000)
+            materialized.observe(timed(lambda: StatsDbService(db).summary(user_id)) / 1000)
+        for name, recorder in (("live", live), ("materialized", materialized)):
+            snap = recorder.snapshot()
+            print(f"{name:<12} p50 {snap['p50_ms']:>9.2f} ms   p95 {snap['p95_ms']:>9.2f} ms")
+        print(
+            f"speedup      {live.snapshot()['p50_ms'] / materialized.snapshot()['p50_ms']:>9.1f}x (p50)"
+        )
+
+        drift: List[Any] = []
+        check_ms = timed(lambda: drift.extend(StatsService(db).check()))
+        print(f"check       {check_ms / 1000:>10.1f} s   drift rows: {len(drift)}")
+
+        if not keep:
+            synthetic = select(Match.id).where(Match.creator_id.in_(user_ids))
+            db.execute(delete(UserStats).where(UserStats.user_id.in_(user_ids)))
+            db.execute(delete(Rating).where(Rating.user_id.in_(user_ids)))
+            db.execute(delete(Game).where(Game.match_id.in_(synthetic)))
+            db.execute(delete(Match).where(Match.creator_id.in_(user_ids)))
+            db.execute(delete(User).where(User.id.in_(user_ids)))
+            db.commit()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=settings.database_url)
+    parser.add_argument("--games", type=int, default=10_000_000)
+    parser.add_argument("--players", type=int, default=1_000)
+    parser.add_argument("--sample", type=int, default=50, help="players timed")
+    parser.add_argument("--keep", action="store_true", help="leave the synthetic rows in place")
+    args = parser.parse_args()
+    main(args.url, args.games, args.players, args.sample, args.keep)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Micro-benchmark verify_token with and without the decoded-claims cache.
+
+Verifies the same access token repeatedly, as a mobile client reusing one
+token would, and reports the per-call cost of a full decode versus a cache hit.
+Needs no database.
+
+Usage:
+    poetry run python scripts/bench_verify_token.py --iterations 20000
+"""
+
+import argparse
+import timeit
+
+from corner_pocket_backend.core.security import create_access_token, token_cache, verify_token
+
+
+def main(iterations: int) -> None:
+    token = create_access_token({"sub": "1"})
+    token_cache.clear()
+
+    uncached = timeit.timeit(
+        lambda: verify_token(token, token_type="access", use_cache=False), number=iterations
+    )
+    verify_token(token, token_type="access")  # warm the cache
+    cached = timeit.timeit(lambda: verify_token(token, token_type="access"), number=iterations)
+
+    print(f"verify_token  iterations={iterations}")
+    print(f"  full decode: {uncached / iterations * 1e6:8.2f} us/call")
+    print(f"  cache hit  : {cached / iterations * 1e6:8.2f} us/call")
+    print(f"  speedup    : {uncached / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.iterations)
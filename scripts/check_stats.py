@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Check the materialized user_stats rows against the live aggregate.
+
+Recomputes every player's counters from games and approved matches in one
+query (`StatsService.check`) and lists the rows that differ. With --repair,
+rebuilds user_stats from scratch when drift is found.
+
+Usage:
+    poetry run python scripts/check_stats.py [--user-id 1 --user-id 2] [--repair]
+"""
+
+import argparse
+import sys
+
+from corner_pocket_backend.core.db import SessionLocal
+from corner_pocket_backend.services.stats import StatsDbService, StatsService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", type=int, action="append", dest="user_ids")
+    parser.add_argument("--repair", action="store_true", help="rebuild user_stats on drift")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        drift = StatsService(db).check(user_ids=args.user_ids)
+        for d in drift:
+            changed = {
+                c: (v, d.materialized[c]) for c, v in d.live.items() if v != d.materialized[c]
+            }
+            print(f"   ✗ user {d.user_id} {d.game_type.value}: (live, stored) {changed}")
+        if not drift:
+            print("✅ user_stats matches the live aggregate")
+            return
+        print(f"\n❌ {len(drift)} user_stats rows drifted")
+        if args.repair:
+            written = StatsDbService(db).rebuild()
+            db.commit()
+            print(f"🔧 Rebuilt user_stats ({written} rows)")
+        else:
+            sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
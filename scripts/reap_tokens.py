@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Delete expired and revoked refresh tokens.
+
+The API process runs the same job periodically (TOKEN_REAPER_INTERVAL_SECONDS);
+use this for a one-off cleanup or from cron when the in-process reaper is off.
+
+Usage:
+    poetry run python scripts/reap_tokens.py [--batch-size 1000] [--max-batches N]
+"""
+
+import argparse
+from datetime import timedelta
+
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import SessionLocal
+from corner_pocket_backend.services.security import SecurityDbService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=settings.TOKEN_REAPER_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument(
+        "--revoked-retention-hours",
+        type=float,
+        default=settings.TOKEN_REAPER_REVOKED_RETENTION_HOURS,
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = SecurityDbService(db).purge_expired_refresh_tokens(
+            batch_size=args.batch_size,
+            revoked_retention=timedelta(hours=args.revoked_retention_hours),
+            max_batches=args.max_batches,
+        )
+    finally:
+        db.close()
+
+    print(
+        f"🧹 Removed {result['deleted']:.0f} refresh tokens "
+        f"in {result['batches']:.0f} batches ({result['elapsed_ms']:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
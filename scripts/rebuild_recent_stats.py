@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Rebuild the daily stats buckets and every player's streaks and recent racks.
+
+Run after the daily stats migration, or to repair user_daily_stats or
+user_form. Replaces both tables in one transaction.
+
+Usage:
+    poetry run python scripts/rebuild_recent_stats.py
+"""
+
+import argparse
+import time
+
+from corner_pocket_backend.core.db import SessionLocal
+from corner_pocket_backend.services.recent import RecentStatsDbService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        written = RecentStatsDbService(db).rebuild()
+        db.commit()
+    finally:
+        db.close()
+
+    print(
+        f"📅 Wrote {written} daily buckets and replayed form in {time.perf_counter() - started:.1f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
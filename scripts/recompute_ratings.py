@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Re-rate every player from the full approved match history.
+
+Run after changing RATING_K_FACTOR or RATING_INITIAL (or pass the new values
+here to try them), after the ratings migration, or to undo the drift that
+voided matches leave in incremental ratings. Replaces the ratings table in
+one transaction.
+
+Usage:
+    poetry run python scripts/recompute_ratings.py [--k-factor 16] [--initial 1500]
+"""
+
+import argparse
+import time
+
+from corner_pocket_backend.core.config import settings
+from corner_pocket_backend.core.db import SessionLocal
+from corner_pocket_backend.services.ratings import RatingsDbService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--k-factor", type=float, default=settings.RATING_K_FACTOR)
+    parser.add_argument("--initial", type=float, default=settings.RATING_INITIAL)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        written = RatingsDbService(db).recompute(k_factor=args.k_factor, initial=args.initial)
+        db.commit()
+    finally:
+        db.close()
+
+    print(
+        f"📈 Rated {written} player/game-type pairs "
+        f"(K={args.k_factor:g}, initial={args.initial:g}) in {time.perf_counter() - started:.1f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
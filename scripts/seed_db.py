@@ -15,6 +15,13 @@ from corner_pocket_backend.models import (
     MatchStatus,
     ApprovalStatus,
 )
+from corner_pocket_backend.services import (
+    HeadToHeadDbService,
+    MatchesDbService,
+    RatingsDbService,
+    RecentStatsDbService,
+    StatsDbService,
+)
 
 
 def seed_database():
@@ -223,6 +230,14 @@ def seed_database():
             f"   ✓ Match 3: {vincent.display_name} vs {minnesota_fats.display_name} (APPROVED, 10-ball race to 3)"
         )
 
+        # Games were inserted directly, so derive the running scores from them.
+        MatchesDbService(db).recount_scores()
+        StatsDbService(db).rebuild()
+        HeadToHeadDbService(db).rebuild()
+        RecentStatsDbService(db).rebuild()
+        RatingsDbService(db).recompute()
+        db.commit()
+
         print("\n✅ Database seeded successfully!")
         print("\n📊 Summary:")
         print(f"   • {db.query(User).count()} users")
@@ -4,9 +4,14 @@ from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
+from corner_pocket_backend import main
 from corner_pocket_backend.main import corner_pocket_backend
-from corner_pocket_backend.models import Base  # Import models to register with Base
+from corner_pocket_backend.models import Base, User  # Import models to register with Base
 from corner_pocket_backend.core.db import get_db
+from corner_pocket_backend.core.security import create_access_token
+from corner_pocket_backend.services.leaderboard import leaderboards
+from corner_pocket_backend.services.stats_cache import stats_cache
+from corner_pocket_backend.services.users import user_cache
 
 
 @pytest.fixture
@@ -29,7 +34,13 @@ def db_session():
         cursor.close()
 
     Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
+    # Ids restart at 1 for every test database; drop users cached by earlier tests.
+    user_cache.clear()
+    stats_cache.clear()
+    for board in leaderboards.values():
+        board.clear()
+    # Same session options as `core.db.SessionLocal`.
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
     session = SessionLocal()
     try:
         yield session
@@ -38,8 +49,13 @@ def db_session():
 
 
 @pytest.fixture
-def client(db_session: Session):
-    """Provide a test client with a database session override."""
+def client(db_session: Session, monkeypatch):
+    """Provide a test client with a database session override.
+
+    Leaderboard warm-up is skipped (it reads the configured database, not
+    `db_session`); boards load from the test session on first use.
+    """
+    monkeypatch.setattr(main, "warm_leaderboards", lambda: None)
 
     def override_get_db():
         try:
@@ -53,3 +69,13 @@ def client(db_session: Session):
         yield test_client
 
     corner_pocket_backend.dependency_overrides.clear()
+
+
+@pytest.fixture
+def auth_headers():
+    """Build a user's bearer-token headers: ``auth_headers(user)``."""
+
+    def auth_headers(user: User) -> dict[str, str]:
+        return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+    return auth_headers
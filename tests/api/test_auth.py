@@ -4,7 +4,11 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from corner_pocket_backend.services.users import UsersDbService
-from corner_pocket_backend.core.security import create_access_token, create_refresh_token
+from corner_pocket_backend.core.security import (
+    create_access_token,
+    create_refresh_token,
+    hash_token,
+)
 from corner_pocket_backend.core.password import get_password_hash
 from corner_pocket_backend.services.security import SecurityDbService
 
@@ -157,6 +161,29 @@ class TestLogin:
         assert isinstance(data["refresh_token"], str)
         assert len(data["refresh_token"]) > 0
 
+    def test_login_stores_refresh_token_digest(self, client: TestClient, db_session: Session):
+        """Test that only the digest of the issued refresh token is persisted."""
+        user_service = UsersDbService(db_session)
+        user_service.create(
+            email="test@example.com",
+            handle="testuser",
+            display_name="Test User",
+            password_hash=get_password_hash("password123"),
+        )
+        db_session.commit()
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": "test@example.com", "password": "password123"},
+        )
+        refresh_token = response.json()["refresh_token"]
+
+        security_db_service = SecurityDbService(db_session)
+        stored = security_db_service.get_refresh_token(hash_token(refresh_token))
+        assert stored is not None
+        assert len(stored.token_hash) == 64
+        assert security_db_service.get_refresh_token(refresh_token) is None
+
     def test_login_invalid_email(self, client: TestClient):
         """Test login fails with non-existent email."""
         response = client.post(
@@ -369,7 +396,9 @@ class TestRefresh:
         # Generate a valid token
         refresh_token = create_refresh_token({"sub": str(user.id)})
         security_db_service = SecurityDbService(db_session)
-        security_db_service.store_refresh_token(user_id=user.id, token_hash=refresh_token)
+        security_db_service.store_refresh_token(
+            user_id=user.id, token_hash=hash_token(refresh_token)
+        )
 
         # Request with token
         response = client.post(
@@ -379,4 +408,39 @@ class TestRefresh:
         assert response.status_code == 200
         data = response.json()
         assert "access_token" in data
-        assert "refresh_token" in data
\ No newline at end of file
+        assert "refresh_token" in data
+
+    def test_refresh_rotates_token(self, client: TestClient, db_session: Session):
+        """Test that a refresh token is single-use and reuse revokes the session."""
+        user_service = UsersDbService(db_session)
+        user = user_service.create(
+            email="test@example.com",
+            handle="testuser",
+            display_name="Test User",
+            password_hash=get_password_hash("password123"),
+        )
+        db_session.commit()
+        refresh_token = create_refresh_token({"sub": str(user.id)})
+        SecurityDbService(db_session).store_refresh_token(
+            user_id=user.id, token_hash=hash_token(refresh_token)
+        )
+        db_session.commit()
+
+        first = client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+        assert first.status_code == 200
+        rotated = first.json()["refresh_token"]
+        assert rotated != refresh_token
+
+        reused = client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+        assert reused.status_code == 401
+        assert "reuse" in reused.json()["detail"].lower()
+
+        # The reuse revoked the rotated token as well
+        revoked = client.post("/api/v1/auth/refresh", json={"refresh_token": rotated})
+        assert revoked.status_code == 401
+
+    def test_refresh_invalid_token(self, client: TestClient):
+        """Test refresh fails for a token that is not a signed refresh JWT."""
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": "garbage"})
+
+        assert response.status_code == 401
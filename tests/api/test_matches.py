@@ -0,0 +1,424 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from corner_pocket_backend.models import Game, GameType, Match
+
+
+class TestListMatches:
+    """Tests for GET /api/v1/matches endpoint."""
+
+    def test_list_matches_paginates_with_cursor(
+        self,
+        client: TestClient,
+        players,
+        auth_headers,
+        insert_matches,
+    ):
+        """Test that pages follow next_cursor until it is null."""
+        creator, opponent = players
+        matches = insert_matches(creator, opponent, 5)
+
+        first = client.get("/api/v1/matches?limit=3", headers=auth_headers(opponent))
+        assert first.status_code == 200
+        data = first.json()
+        assert [m["id"] for m in data["items"]] == [m.id for m in matches[::-1][:3]]
+        assert data["next_cursor"] is not None
+
+        second = client.get(
+            "/api/v1/matches",
+            params={"limit": 3, "cursor": data["next_cursor"]},
+            headers=auth_headers(opponent),
+        )
+        assert second.status_code == 200
+        assert [m["id"] for m in second.json()["items"]] == [m.id for m in matches[::-1][3:]]
+        assert second.json()["next_cursor"] is None
+
+    def test_list_matches_invalid_cursor(self, client: TestClient, players, auth_headers):
+        """Test that a malformed cursor is rejected."""
+        creator, _ = players
+
+        response = client.get(
+            "/api/v1/matches", params={"cursor": "garbage"}, headers=auth_headers(creator)
+        )
+
+        assert response.status_code == 400
+
+    def test_list_matches_limit_bounds(self, client: TestClient, players, auth_headers):
+        """Test that the page size is bounded."""
+        creator, _ = players
+
+        response = client.get("/api/v1/matches?limit=1000", headers=auth_headers(creator))
+
+        assert response.status_code == 422
+
+    def test_list_matches_requires_auth(self, client: TestClient):
+        """Test that listing matches requires a bearer token."""
+        response = client.get("/api/v1/matches")
+
+        assert response.status_code == 401
+
+
+class TestGetMatch:
+    """Tests for GET /api/v1/matches/{match_id} endpoint."""
+
+    def test_get_match_includes_games(
+        self,
+        client: TestClient,
+        db_session: Session,
+        players,
+        auth_headers,
+        insert_matches,
+    ):
+        """Test that the detail embeds the games, oldest first."""
+        creator, opponent = players
+        (match,) = insert_matches(creator, opponent, 1)
+        for winner, loser in [(creator, opponent), (opponent, creator)]:
+            db_session.add(
+                Game(
+                    match_id=match.id,
+                    game_type=GameType.NINE_BALL,
+                    winner_user_id=winner.id,
+                    loser_user_id=loser.id,
+                )
+            )
+        db_session.commit()
+
+        response = client.get(f"/api/v1/matches/{match.id}", headers=auth_headers(creator))
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == match.id
+        assert data["status"] == "PENDING"
+        assert data["game_type"] == "NINE_BALL"
+        assert [g["winner_user_id"] for g in data["games"]] == [creator.id, opponent.id]
+        assert data["approval"] is None
+
+    def test_get_match_hidden_from_non_participants(
+        self,
+        client: TestClient,
+        auth_headers,
+        insert_matches,
+        users,
+    ):
+        """Test that outsiders get a 404 rather than the match."""
+        creator, opponent, outsider, _ = users
+        (match,) = insert_matches(creator, opponent, 1)
+
+        response = client.get(f"/api/v1/matches/{match.id}", headers=auth_headers(outsider))
+
+        assert response.status_code == 404
+
+
+class TestMatchLifecycle:
+    """Tests for creating, scoring, submitting and deciding matches."""
+
+    def test_race_to_submits_and_opponent_approves(
+        self,
+        client: TestClient,
+        players,
+        auth_headers,
+    ):
+        """Test the full flow from creation to approval."""
+        creator, opponent = players
+        created = client.post(
+            "/api/v1/matches",
+            json={"opponent_id": opponent.id, "game_type": "EIGHT_BALL", "race_to": 2},
+            headers=auth_headers(creator),
+        )
+        assert created.status_code == 200
+        match = created.json()
+        assert match["status"] == "PENDING"
+        assert (match["creator_score"], match["opponent_score"]) == (0, 0)
+
+        for expected in ("PENDING", "SUBMITTED"):
+            added = client.post(
+                f"/api/v1/matches/{match['id']}/games",
+                json={"winner_user_id": creator.id},
+                headers=auth_headers(creator),
+            )
+            assert added.status_code == 200
+            assert added.json()["match"]["status"] == expected
+            assert added.json()["game"]["loser_user_id"] == opponent.id
+
+        late = client.post(
+            f"/api/v1/matches/{match['id']}/games",
+            json={"winner_user_id": opponent.id},
+            headers=auth_headers(opponent),
+        )
+        assert late.status_code == 409
+
+        approved = client.post(
+            f"/api/v1/matches/{match['id']}/approve",
+            json={"note": "good game"},
+            headers=auth_headers(opponent),
+        )
+        assert approved.status_code == 200
+        assert approved.json()["status"] == "APPROVED"
+        assert approved.json()["creator_score"] == 2
+
+        detail = client.get(f"/api/v1/matches/{match['id']}", headers=auth_headers(creator))
+        assert detail.json()["approval"]["status"] == "APPROVED"
+        assert detail.json()["approval"]["note"] == "good game"
+
+    def test_transition_errors(
+        self,
+        client: TestClient,
+        players,
+        auth_headers,
+        insert_matches,
+    ):
+        """Test 404/403/409 mapping for rejected transitions."""
+        creator, opponent = players
+        (match,) = insert_matches(creator, opponent, 1)
+
+        assert (
+            client.post("/api/v1/matches/9999/submit", headers=auth_headers(creator)).status_code
+            == 404
+        )
+        url = f"/api/v1/matches/{match.id}"
+        assert client.post(f"{url}/submit", headers=auth_headers(opponent)).status_code == 403
+        assert client.post(f"{url}/decline", headers=auth_headers(opponent)).status_code == 409
+        assert client.post(f"{url}/submit", headers=auth_headers(creator)).status_code == 200
+        assert client.post(f"{url}/approve", headers=auth_headers(creator)).status_code == 403
+        assert client.post(f"{url}/decline", headers=auth_headers(opponent)).status_code == 200
+        assert client.post(f"{url}/cancel", headers=auth_headers(creator)).status_code == 409
+
+    def test_create_match_validation(self, client: TestClient, players, auth_headers):
+        """Test that self-matches and unknown opponents are rejected."""
+        creator, _ = players
+
+        for opponent_id in (creator.id, 9999):
+            response = client.post(
+                "/api/v1/matches",
+                json={"opponent_id": opponent_id, "game_type": "NINE_BALL"},
+                headers=auth_headers(creator),
+            )
+            assert response.status_code == 400
+
+
+class TestMatchETags:
+    """Tests for ETag / If-Match optimistic concurrency on match routes."""
+
+    def test_stale_if_match_is_rejected(
+        self,
+        client: TestClient,
+        players,
+        auth_headers,
+        insert_matches,
+    ):
+        """Test that a write against an old ETag fails with 412."""
+        creator, opponent = players
+        (match,) = insert_matches(creator, opponent, 1)
+        url = f"/api/v1/matches/{match.id}"
+
+        etag = client.get(url, headers=auth_headers(creator)).headers["ETag"]
+        assert etag == '"1"'
+
+        game = {"winner_user_id": creator.id}
+        first = client.post(
+            f"{url}/games", json=game, headers={**auth_headers(creator), "If-Match": etag}
+        )
+        assert first.status_code == 200
+        assert first.headers["ETag"] == '"2"'
+        assert first.json()["match"]["version"] == 2
+
+        # The opponent still holds the ETag read before the creator's write.
+        stale = client.post(
+            f"{url}/games", json=game, headers={**auth_headers(opponent), "If-Match": etag}
+        )
+        assert stale.status_code == 412
+        stale = client.post(f"{url}/submit", headers={**auth_headers(creator), "If-Match": etag})
+        assert stale.status_code == 412
+
+        detail = client.get(url, headers=auth_headers(creator))
+        assert len(detail.json()["games"]) == 1
+        assert detail.headers["ETag"] == '"2"'
+
+        fresh = client.post(
+            f"{url}/submit", headers={**auth_headers(creator), "If-Match": detail.headers["ETag"]}
+        )
+        assert fresh.status_code == 200
+        assert fresh.headers["ETag"] == '"3"'
+
+    def test_if_match_is_optional(
+        self,
+        client: TestClient,
+        players,
+        auth_headers,
+        insert_matches,
+    ):
+        """Test that absent or * If-Match writes unconditionally and junk is rejected."""
+        creator, opponent = players
+        (match,) = insert_matches(creator, opponent, 1)
+        url = f"/api/v1/matches/{match.id}/games"
+        game = {"winner_user_id": creator.id}
+
+        assert client.post(url, json=game, headers=auth_headers(creator)).status_code == 200
+        star = {**auth_headers(creator), "If-Match": "*"}
+        assert client.post(url, json=game, headers=star).status_code == 200
+        junk = {**auth_headers(creator), "If-Match": "v3"}
+        assert client.post(url, json=game, headers=junk).status_code == 400
+
+    def test_weak_if_match_never_matches(
+        self,
+        client: TestClient,
+        players,
+        auth_headers,
+        insert_matches,
+    ):
+        """Test that a weak ETag fails the If-Match precondition even at the current version."""
+        creator, opponent = players
+        (match,) = insert_matches(creator, opponent, 1)
+        url = f"/api/v1/matches/{match.id}"
+        etag = client.get(url, headers=auth_headers(creator)).headers["ETag"]
+
+        weak = {**auth_headers(creator), "If-Match": f"W/{etag}"}
+        response = client.post(f"{url}/games", json={"winner_user_id": creator.id}, headers=weak)
+        assert response.status_code == 412
+        assert client.get(url, headers=auth_headers(creator)).headers["ETag"] == etag
+
+
+class TestIdempotencyKeys:
+    """Tests for Idempotency-Key replay on match and game writes."""
+
+    def test_retried_game_is_recorded_once(
+        self,
+        client: TestClient,
+        db_session: Session,
+        players,
+        auth_headers,
+        insert_matches,
+    ):
+        """Test that a retry returns the stored response without adding a game."""
+        creator, opponent = players
+        (match,) = insert_matches(creator, opponent, 1)
+        url = f"/api/v1/matches/{match.id}/games"
+        headers = {**auth_headers(creator), "Idempotency-Key": "rack-1"}
+
+        first = client.post(url, json={"winner_user_id": creator.id}, headers=headers)
+        retry = client.post(url, json={"winner_user_id": creator.id}, headers=headers)
+
+        assert first.status_code == retry.status_code == 200
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        assert db_session.query(Game).filter(Game.match_id == match.id).count() == 1
+
+        # A new key is a new game.
+        headers["Idempotency-Key"] = "rack-2"
+        assert (
+            client.post(url, json={"winner_user_id": creator.id}, headers=headers).json()["match"][
+                "creator_score"
+            ]
+            == 2
+        )
+
+    def test_retried_match_creation_creates_one_match(
+        self,
+        client: TestClient,
+        db_session: Session,
+        players,
+        auth_headers,
+    ):
+        """Test that POST /matches with a repeated key returns the first match."""
+        creator, opponent = players
+        headers = {**auth_headers(creator), "Idempotency-Key": "new-match"}
+        body = {"opponent_id": opponent.id, "game_type": "EIGHT_BALL"}
+
+        first = client.post("/api/v1/matches", json=body, headers=headers)
+        retry = client.post("/api/v1/matches", json=body, headers=headers)
+
+        assert retry.json()["id"] == first.json()["id"]
+        assert db_session.query(Match).count() == 1
+
+    def test_key_reuse_and_failed_writes(
+        self,
+        client: TestClient,
+        players,
+        auth_headers,
+        insert_matches,
+    ):
+        """Test 422 for a key reused with another body and that errors are not stored."""
+        creator, opponent = players
+        (match,) = insert_matches(creator, opponent, 1)
+        url = f"/api/v1/matches/{match.id}/games"
+        headers = {**auth_headers(creator), "Idempotency-Key": "k"}
+
+        assert client.post(url, json={"winner_user_id": 9999}, headers=headers).status_code == 400
+        assert (
+            client.post(url, json={"winner_user_id": creator.id}, headers=headers).status_code
+            == 200
+        )
+        reused = client.post(url, json={"winner_user_id": opponent.id}, headers=headers)
+        assert reused.status_code == 422
+
+        too_long = {**auth_headers(creator), "Idempotency-Key": "k" * 256}
+        assert (
+            client.post(url, json={"winner_user_id": creator.id}, headers=too_long).status_code
+            == 400
+        )
+
+
+class TestMatchBatch:
+    """Tests for POST /api/v1/matches/batch."""
+
+    def test_records_matches_with_games_and_reports_each(
+        self,
+        client: TestClient,
+        db_session: Session,
+        players,
+        auth_headers,
+    ):
+        """Test that valid matches are recorded and an invalid one is reported alone."""
+        creator, opponent = players
+        race = [creator.id, opponent.id, creator.id, creator.id]
+        response = client.post(
+            "/api/v1/matches/batch",
+            json={
+                "matches": [
+                    {
+                        "opponent_id": opponent.id,
+                        "game_type": "NINE_BALL",
+                        "race_to": 3,
+                        "games": [{"winner_user_id": w} for w in race],
+                    },
+                    {
+                        "opponent_id": opponent.id,
+                        "game_type": "EIGHT_BALL",
+                        "games": [{"winner_user_id": 9999}],
+                    },
+                    {
+                        "opponent_id": opponent.id,
+                        "game_type": "TEN_BALL",
+                        "games": [{"winner_user_id": opponent.id}],
+                        "submit": True,
+                    },
+                ]
+            },
+            headers=auth_headers(creator),
+        )
+        assert response.status_code == 200
+        won, invalid, short = response.json()["results"]
+
+        assert won["status_code"] == 200
+        assert won["match"]["status"] == "SUBMITTED"
+        assert (won["match"]["creator_score"], won["match"]["opponent_score"]) == (3, 1)
+        assert [g["winner_user_id"] for g in won["games"]] == race
+
+        assert (invalid["index"], invalid["status_code"], invalid["match"]) == (1, 400, None)
+        assert invalid["error"] == "winner and loser must be match participants"
+
+        assert short["match"]["status"] == "SUBMITTED"
+        assert short["match"]["opponent_score"] == 1
+
+        db_session.expire_all()
+        assert db_session.query(Match).count() == 2
+        assert db_session.query(Game).count() == 5
+
+    def test_rejects_empty_batch(self, client: TestClient, players, auth_headers):
+        """Test request validation of the batch size."""
+        creator, _ = players
+        response = client.post(
+            "/api/v1/matches/batch", json={"matches": []}, headers=auth_headers(creator)
+        )
+        assert response.status_code == 422
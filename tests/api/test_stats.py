@@ -0,0 +1,244 @@
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def approved_match(client: TestClient, players, auth_headers):
+    """Record a race to 1 won by the creator and approved by the opponent: ``approved_match()``."""
+    creator, opponent = players
+
+    def approved_match() -> dict:
+        match = client.post(
+            "/api/v1/matches",
+            json={"opponent_id": opponent.id, "game_type": "TEN_BALL", "race_to": 1},
+            headers=auth_headers(creator),
+        ).json()
+        client.post(
+            f"/api/v1/matches/{match['id']}/games",
+            json={"winner_user_id": creator.id},
+            headers=auth_headers(creator),
+        )
+        approved = client.post(
+            f"/api/v1/matches/{match['id']}/approve", json={}, headers=auth_headers(opponent)
+        )
+        assert approved.status_code == 200
+        return approved.json()
+
+    return approved_match
+
+
+class TestStatsSummary:
+    """Tests for GET /api/v1/stats/summary."""
+
+    def test_summary_follows_approval_and_void(
+        self, client: TestClient, players, auth_headers, approved_match
+    ):
+        """Test that approving counts a match and voiding takes it back out."""
+        creator, opponent = players
+        empty = client.get("/api/v1/stats/summary", headers=auth_headers(creator))
+        assert empty.status_code == 200
+        assert empty.json()["matches_played"] == 0
+        assert empty.json()["by_game_type"] == []
+
+        match = approved_match()
+        mine = client.get("/api/v1/stats/summary", headers=auth_headers(creator)).json()
+        assert (mine["matches_won"], mine["racks_won"]) == (1, 1)
+        assert [s["game_type"] for s in mine["by_game_type"]] == ["TEN_BALL"]
+        theirs = client.get(
+            "/api/v1/stats/summary", params={"user_id": opponent.id}, headers=auth_headers(creator)
+        ).json()
+        assert (theirs["user_id"], theirs["matches_lost"], theirs["racks_lost"]) == (
+            opponent.id,
+            1,
+            1,
+        )
+
+        forbidden = client.post(
+            f"/api/v1/matches/{match['id']}/void", headers=auth_headers(creator)
+        )
+        assert forbidden.status_code == 403
+        voided = client.post(f"/api/v1/matches/{match['id']}/void", headers=auth_headers(opponent))
+        assert voided.status_code == 200
+        assert voided.json()["status"] == "VOIDED"
+        after = client.get("/api/v1/stats/summary", headers=auth_headers(creator)).json()
+        assert (after["matches_played"], after["racks_won"]) == (0, 0)
+        assert after["by_game_type"] == []
+
+    def test_summary_requires_auth(self, client: TestClient):
+        """Test that the summary is not served anonymously."""
+        assert client.get("/api/v1/stats/summary").status_code == 401
+
+
+class TestRatings:
+    """Tests for GET /api/v1/stats/ratings."""
+
+    def test_ratings_follow_approvals(
+        self, client: TestClient, players, auth_headers, approved_match
+    ):
+        """Test that an approved match rates both players."""
+        creator, opponent = players
+        assert client.get("/api/v1/stats/ratings", headers=auth_headers(creator)).json() == {
+            "user_id": creator.id,
+            "ratings": [],
+        }
+
+        approved_match()
+        mine = client.get("/api/v1/stats/ratings", headers=auth_headers(creator))
+        assert mine.status_code == 200
+        assert mine.json()["ratings"] == [
+            {"game_type": "TEN_BALL", "rating": 1508.0, "matches_rated": 1}
+        ]
+        theirs = client.get(
+            "/api/v1/stats/ratings", params={"user_id": opponent.id}, headers=auth_headers(creator)
+        ).json()
+        assert [r["rating"] for r in theirs["ratings"]] == [1492.0]
+
+
+class TestLeaderboard:
+    """Tests for GET /api/v1/stats/leaderboard."""
+
+    def test_leaderboard_ranks_rated_players(
+        self, client: TestClient, players, auth_headers, approved_match
+    ):
+        """Test that approved matches put both players on the board, best first."""
+        creator, opponent = players
+        approved_match()
+
+        board = client.get(
+            "/api/v1/stats/leaderboard",
+            params={"game_type": "TEN_BALL"},
+            headers=auth_headers(opponent),
+        )
+        assert board.status_code == 200
+        body = board.json()
+        assert [(e["rank"], e["handle"], e["rating"]) for e in body["entries"]] == [
+            (1, "a", 1508.0),
+            (2, "b", 1492.0),
+        ]
+        assert (body["me"]["rank"], body["me"]["user_id"]) == (2, opponent.id)
+
+        empty = client.get(
+            "/api/v1/stats/leaderboard",
+            params={"game_type": "EIGHT_BALL"},
+            headers=auth_headers(opponent),
+        ).json()
+        assert (empty["entries"], empty["me"]) == ([], None)
+
+    def test_leaderboard_rejects_bad_limit(self, client: TestClient, players, auth_headers):
+        """Test that an out-of-range page size is a 400."""
+        creator, _ = players
+        response = client.get(
+            "/api/v1/stats/leaderboard",
+            params={"game_type": "TEN_BALL", "limit": 500},
+            headers=auth_headers(creator),
+        )
+        assert response.status_code == 400
+
+
+class TestHeadToHead:
+    """Tests for GET /api/v1/stats/head-to-head and /stats/rivals."""
+
+    def test_head_to_head_and_rivals_follow_approvals(
+        self, client: TestClient, players, auth_headers, approved_match
+    ):
+        """Test that an approved match shows up from both players' side."""
+        creator, opponent = players
+        approved_match()
+
+        mine = client.get(
+            "/api/v1/stats/head-to-head",
+            params={"opponent_id": opponent.id},
+            headers=auth_headers(creator),
+        )
+        assert mine.status_code == 200
+        assert (mine.json()["matches_won"], mine.json()["racks_lost"]) == (1, 0)
+        theirs = client.get(
+            "/api/v1/stats/head-to-head",
+            params={"user_id": opponent.id, "opponent_id": creator.id},
+            headers=auth_headers(creator),
+        ).json()
+        assert (theirs["matches_lost"], theirs["by_game_type"][0]["game_type"]) == (1, "TEN_BALL")
+
+        rivals = client.get("/api/v1/stats/rivals", headers=auth_headers(opponent))
+        assert rivals.status_code == 200
+        assert [(r["handle"], r["matches_lost"]) for r in rivals.json()["rivals"]] == [("a", 1)]
+
+    def test_head_to_head_with_yourself_is_rejected(
+        self, client: TestClient, players, auth_headers
+    ):
+        """Test that asking for a record against yourself is a 400."""
+        creator, _ = players
+        response = client.get(
+            "/api/v1/stats/head-to-head",
+            params={"opponent_id": creator.id},
+            headers=auth_headers(creator),
+        )
+        assert response.status_code == 400
+
+
+class TestRecent:
+    """Tests for GET /api/v1/stats/window and /stats/form."""
+
+    def test_window_and_form_follow_approvals(
+        self, client: TestClient, players, auth_headers, approved_match
+    ):
+        """Test that an approved match counts in today's window and the players' form."""
+        creator, opponent = players
+        approved_match()
+
+        window = client.get(
+            "/api/v1/stats/window", params={"days": 7}, headers=auth_headers(creator)
+        )
+        assert window.status_code == 200
+        assert (window.json()["days"], window.json()["matches_won"]) == (7, 1)
+        form = client.get(
+            "/api/v1/stats/form", params={"user_id": opponent.id}, headers=auth_headers(creator)
+        )
+        assert form.status_code == 200
+        assert form.json()["by_game_type"] == [
+            {
+                "game_type": "TEN_BALL",
+                "current_streak": -1,
+                "best_streak": 0,
+                "recent_racks": "L",
+                "recent_racks_won": 0,
+            }
+        ]
+
+    def test_window_rejects_bad_days(self, client: TestClient, players, auth_headers):
+        """Test that a window longer than a year is a 400."""
+        creator, _ = players
+        response = client.get(
+            "/api/v1/stats/window", params={"days": 1000}, headers=auth_headers(creator)
+        )
+        assert response.status_code == 400
+
+
+class TestStatsCache:
+    """Tests for the stats response cache behind the /stats endpoints."""
+
+    def test_repeat_reads_hit_the_cache_until_a_match_is_approved(
+        self,
+        client: TestClient,
+        players,
+        auth_headers,
+        approved_match,
+    ):
+        """Test that a repeat read is a hit and an approval makes the next read fresh."""
+        creator, opponent = players
+
+        def hits() -> float:
+            return client.get("/metrics").json()["stats_cache"]["hits"]
+
+        client.get("/api/v1/stats/form", headers=auth_headers(creator))
+        before = hits()
+        assert client.get("/api/v1/stats/form", headers=auth_headers(creator)).json() == {
+            "user_id": creator.id,
+            "by_game_type": [],
+        }
+        assert hits() == before + 1
+
+        approved_match()
+        form = client.get("/api/v1/stats/form", headers=auth_headers(creator)).json()
+        assert [f["current_streak"] for f in form["by_game_type"]] == [1]
+        assert hits() == before + 1
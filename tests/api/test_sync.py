@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+
+
+class TestSync:
+    """Tests for GET /api/v1/sync."""
+
+    def test_delta_sync(self, client: TestClient, players, auth_headers):
+        """Test that each sync returns only what changed since the last one."""
+        creator, opponent = players
+        match = client.post(
+            "/api/v1/matches",
+            json={"opponent_id": opponent.id, "game_type": "NINE_BALL"},
+            headers=auth_headers(creator),
+        ).json()
+
+        first = client.get("/api/v1/sync", headers=auth_headers(opponent))
+        assert first.status_code == 200
+        body = first.json()
+        assert [m["id"] for m in body["matches"]] == [match["id"]]
+        assert body["games"] == body["deleted"] == []
+
+        client.post(
+            f"/api/v1/matches/{match['id']}/games",
+            json={"winner_user_id": opponent.id},
+            headers=auth_headers(opponent),
+        )
+        delta = client.get(
+            "/api/v1/sync",
+            params={"since": body["next_since"]},
+            headers=auth_headers(opponent),
+        ).json()
+        assert [m["opponent_score"] for m in delta["matches"]] == [1]
+        assert [g["winner_user_id"] for g in delta["games"]] == [opponent.id]
+
+        caught_up = client.get(
+            "/api/v1/sync",
+            params={"since": delta["next_since"]},
+            headers=auth_headers(opponent),
+        ).json()
+        assert caught_up["matches"] == caught_up["games"] == []
+
+    def test_failed_batch_item_leaves_no_changes(self, client: TestClient, players, auth_headers):
+        """Test that a batch item that fails writes nothing to the change feed."""
+        creator, opponent = players
+        results = client.post(
+            "/api/v1/matches/batch",
+            json={
+                "matches": [
+                    {
+                        "opponent_id": opponent.id,
+                        "game_type": "NINE_BALL",
+                        "games": [{"winner_user_id": 9999}],
+                    },
+                    {"opponent_id": opponent.id, "game_type": "EIGHT_BALL"},
+                ]
+            },
+            headers=auth_headers(creator),
+        ).json()["results"]
+        assert [r["status_code"] for r in results] == [400, 200]
+
+        body = client.get("/api/v1/sync", headers=auth_headers(opponent)).json()
+        assert [m["id"] for m in body["matches"]] == [results[1]["match"]["id"]]
+        assert body["deleted"] == []
+
+    def test_validation(self, client: TestClient, players, auth_headers):
+        """Test that negative cursors and oversized pages are rejected."""
+        creator, _ = players
+        for params in ({"since": -1}, {"limit": 0}, {"limit": 100_000}):
+            response = client.get("/api/v1/sync", params=params, headers=auth_headers(creator))
+            assert response.status_code == 422
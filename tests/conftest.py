@@ -0,0 +1,44 @@
+"""Fixtures shared by the service and API tests.
+
+Each depends on the `db_session` of the test's own directory.
+"""
+
+import pytest
+
+from corner_pocket_backend.models import GameType, Match, MatchStatus, User
+
+
+@pytest.fixture
+def users(db_session) -> tuple[User, User, User, User]:
+    """Four committed players, handles "a" to "d"."""
+    players = [User(email=f"{h}@test.com", handle=h, display_name=h.upper()) for h in "abcd"]
+    db_session.add_all(players)
+    db_session.commit()
+    return players[0], players[1], players[2], players[3]
+
+
+@pytest.fixture
+def players(users) -> tuple[User, User]:
+    """Two users who play each other: "a" creates, "b" is the opponent."""
+    return users[0], users[1]
+
+
+@pytest.fixture
+def insert_matches(db_session):
+    """Insert matches directly: ``insert_matches(creator, opponent, count, **columns)``.
+
+    Matches are PENDING nine-ball races to 5 unless `columns` says
+    otherwise; no games, approvals or feed entries are written.
+    """
+
+    def insert_matches(creator: User, opponent: User, count: int, **columns) -> list[Match]:
+        defaults = {"status": MatchStatus.PENDING, "game_type": GameType.NINE_BALL, "race_to": 5}
+        matches = [
+            Match(creator_id=creator.id, opponent_id=opponent.id, **(defaults | columns))
+            for _ in range(count)
+        ]
+        db_session.add_all(matches)
+        db_session.commit()
+        return matches
+
+    return insert_matches
@@ -0,0 +1,43 @@
+import threading
+
+from corner_pocket_backend.core.background import PeriodicTask
+
+
+class TestPeriodicTask:
+    def test_runs_until_stopped(self):
+        ran = threading.Event()
+        calls = []
+
+        def job():
+            calls.append(1)
+            if len(calls) >= 3:
+                ran.set()
+
+        task = PeriodicTask("test-task", 0.01, job)
+        task.start()
+        assert ran.wait(timeout=5)
+        task.stop(timeout=5)
+        runs = task.runs
+
+        assert runs >= 3
+        assert task.stats()["runs"] == runs
+        assert task.failures == 0
+
+    def test_failures_are_counted_and_do_not_stop_the_schedule(self):
+        def job():
+            raise RuntimeError("boom")
+
+        task = PeriodicTask("failing-task", 60, job)
+        task.run_once()
+        task.run_once()
+
+        assert task.runs == 2
+        assert task.failures == 2
+
+    def test_first_run_waits_one_interval(self):
+        calls = []
+        task = PeriodicTask("slow-task", 60, lambda: calls.append(1))
+        task.start()
+        task.stop(timeout=5)
+
+        assert calls == []
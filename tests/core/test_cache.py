@@ -0,0 +1,46 @@
+import time
+
+from corner_pocket_backend.core.cache import NullCache, TTLCache, build_cache
+
+
+def test_get_set_and_counters():
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_entries_expire():
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=60)
+    cache.set("short", 1, ttl=0.01)
+    cache.set("long", 2)
+    time.sleep(0.02)
+
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert len(cache) == 1
+
+
+def test_least_recently_used_is_evicted():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_build_cache_disabled_by_zero_ttl():
+    cache = build_cache(max_size=10, ttl=0)
+    assert isinstance(cache, NullCache)
+    cache.set("a", 1)
+    assert cache.get("a") is None
@@ -0,0 +1,55 @@
+from corner_pocket_backend.core.leaderboard import SortedIndex
+
+
+def test_ranks_by_score_then_id():
+    index = SortedIndex(max_size=10)
+    index.load([(1, 1500.0), (2, 1600.0), (3, 1500.0), (4, 1400.0)], complete=True)
+
+    assert index.top(3) == [(1, 2, 1600.0), (2, 1, 1500.0), (3, 3, 1500.0)]
+    assert index.top(2, offset=2) == [(3, 3, 1500.0), (4, 4, 1400.0)]
+    assert index.rank(3) == (3, 1500.0)
+    assert index.rank(99) is None
+
+
+def test_updates_move_and_add_ids():
+    index = SortedIndex(max_size=10)
+    index.load([(1, 1500.0), (2, 1600.0)], complete=True)
+
+    index.update(1, 1700.0)
+    index.update(5, 1550.0)
+
+    assert [id_ for _, id_, _ in index.top(10)] == [1, 2, 5]
+    assert index.rank(5) == (3, 1550.0)
+    assert index.fingerprint() == (3, 4850.0)
+
+
+def test_truncated_index_tracks_only_ids_above_its_floor():
+    index = SortedIndex(max_size=4)
+    index.load([(i, 2000.0 - i) for i in range(1, 5)], complete=False)
+    assert index.floor == (-1996.0, 4)
+
+    index.update(9, 1000.0)  # below the floor: not held
+    index.update(2, 1500.0)  # falls below the floor: dropped
+    index.update(7, 1997.0)  # rises above it: held
+
+    assert [id_ for _, id_, _ in index.top(10)] == [1, 3, 7, 4]
+    assert index.rank(9) is None and index.rank(2) is None
+    assert not index.stale
+
+    for id_ in (1, 3, 7):
+        index.update(id_, 0.0)
+    assert index.stale
+
+
+def test_growing_past_max_size_sets_a_floor():
+    index = SortedIndex(max_size=2)
+    index.load([(1, 1500.0)], complete=True)
+    assert index.floor is None
+
+    index.update(2, 1600.0)
+    index.update(3, 1700.0)
+
+    assert len(index) == 2
+    assert index.floor == (-1600.0, 2)
+    assert index.rank(1) is None
+    assert index.stats()["truncated"] == 1.0
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+from concurrent.futures import Future, wait
+
+import pytest
+from fastapi.testclient import TestClient
+
+from corner_pocket_backend.api.v1 import auth
+from corner_pocket_backend.core.password import (
+    HashingPoolSaturated,
+    PasswordHashingPool,
+    verify_password,
+)
+from corner_pocket_backend.main import corner_pocket_backend
+
+
+def occupy(pool: PasswordHashingPool) -> tuple[threading.Event, Future]:
+    """Park one job on the pool until the returned event is set."""
+    release = threading.Event()
+    return release, pool._submit(lambda _: release.wait(5), "")
+
+
+def test_hash_and_verify_round_trip():
+    pool = PasswordHashingPool(max_workers=2, max_queue=2)
+    hashed = asyncio.run(pool.hash("s3cret"))
+
+    assert verify_password("s3cret", hashed)
+    assert asyncio.run(pool.verify("s3cret", hashed)) is True
+    assert asyncio.run(pool.verify("wrong", hashed)) is False
+
+    stats = pool.stats()
+    assert stats["latency_count"] == 3
+    assert stats["queue_depth"] == 0
+    assert stats["rejected"] == 0
+
+
+def test_rejects_when_workers_and_queue_are_full():
+    pool = PasswordHashingPool(max_workers=1, max_queue=1)
+    (first, first_job), (second, second_job) = occupy(pool), occupy(pool)
+    try:
+        with pytest.raises(HashingPoolSaturated):
+            asyncio.run(pool.hash("s3cret"))
+        stats = pool.stats()
+        assert stats["rejected"] == 1
+        assert stats["queue_depth"] + stats["active"] == 2
+    finally:
+        first.set()
+        second.set()
+    wait([first_job, second_job])
+
+    # Slots are released once the parked jobs finish.
+    assert asyncio.run(pool.hash("s3cret"))
+
+
+def test_cancelled_queued_call_gives_its_slot_back():
+    pool = PasswordHashingPool(max_workers=1, max_queue=1)
+    release, job = occupy(pool)
+
+    async def cancel_queued_hash() -> None:
+        task = asyncio.create_task(pool.hash("s3cret"))
+        await asyncio.sleep(0)
+        assert pool.stats()["queue_depth"] == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    try:
+        asyncio.run(cancel_queued_hash())
+    finally:
+        release.set()
+    wait([job])
+
+    stats = pool.stats()
+    assert (stats["queue_depth"], stats["active"]) == (0, 0)
+    # Both slots are free again: one to run, one to queue.
+    first, first_job = occupy(pool)
+    second, second_job = occupy(pool)
+    first.set()
+    second.set()
+    wait([first_job, second_job])
+
+
+def test_saturated_login_returns_503_with_retry_after(monkeypatch):
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+    monkeypatch.setattr(auth, "password_pool", pool)
+    release, _ = occupy(pool)
+    try:
+        response = TestClient(corner_pocket_backend).post(
+            "/api/v1/auth/register",
+            json={
+                "email": "burst@example.com",
+                "handle": "burst",
+                "display_name": "Burst",
+                "password": "password123",
+            },
+        )
+    finally:
+        release.set()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_metrics_exposes_hashing_pool():
+    response = TestClient(corner_pocket_backend).get("/metrics")
+
+    assert response.status_code == 200
+    assert "queue_depth" in response.json()["password_hashing"]
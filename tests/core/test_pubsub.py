@@ -0,0 +1,84 @@
+import os
+import socket
+import tempfile
+import time
+
+import pytest
+
+from corner_pocket_backend.core.pubsub import LocalBroker
+
+
+@pytest.fixture
+def socket_dir():
+    # Short path: Unix socket paths are limited to about 100 bytes.
+    with tempfile.TemporaryDirectory(prefix="cp-") as path:
+        yield path
+
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_publish_delivers_to_local_subscribers():
+    broker = LocalBroker()
+    got: list = []
+    broker.subscribe("a", got.append)
+    broker.subscribe("b", lambda m: got.append(("b", m)))
+
+    broker.publish("a", {"n": 1})
+
+    assert got == [{"n": 1}]
+    assert broker.stats()["published"] == 1
+    assert broker.stats()["sent"] == 0
+
+
+def test_failing_handler_does_not_stop_delivery():
+    broker = LocalBroker()
+    got: list = []
+    broker.subscribe("a", lambda m: 1 / 0)
+    broker.subscribe("a", got.append)
+
+    broker.publish("a", {"n": 1})
+
+    assert got == [{"n": 1}]
+    assert broker.failures == 1
+
+
+def test_peers_receive_messages_through_the_socket_dir(socket_dir, monkeypatch):
+    first, second = LocalBroker(socket_dir), LocalBroker(socket_dir)
+    got: list = []
+    second.subscribe("a", got.append)
+    first.start()
+    # Both brokers live in this process; give the second its own socket name.
+    monkeypatch.setattr(os, "getpid", lambda: 1)
+    second.start()
+    try:
+        first.publish("a", {"user_ids": [1, 2]})
+
+        assert wait_for(lambda: got == [{"user_ids": [1, 2]}])
+        assert (first.sent, second.received) == (1, 1)
+    finally:
+        first.stop()
+        second.stop()
+    assert os.listdir(socket_dir) == []
+
+
+def test_sockets_left_by_dead_workers_are_removed(socket_dir):
+    dead = os.path.join(socket_dir, "999999.sock")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(dead)
+    sock.close()
+    broker = LocalBroker(socket_dir)
+    broker.start()
+    try:
+        broker.publish("a", {})
+    finally:
+        broker.stop()
+
+    assert not os.path.exists(dead)
+    assert broker.failures == 0
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError
+
+from corner_pocket_backend.core import security
+from corner_pocket_backend.core.security import (
+    create_access_token,
+    create_refresh_token,
+    hash_token,
+    token_cache,
+    verify_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+@pytest.fixture
+def decode_calls(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    real_decode = jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return real_decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_repeat_token_skips_decode(decode_calls):
+    token = create_access_token({"sub": "1"})
+
+    first = verify_token(token, token_type="access")
+    second = verify_token(token, token_type="access")
+
+    assert first == second
+    assert first["sub"] == "1"
+    assert len(decode_calls) == 1
+
+
+def test_cache_can_be_bypassed(decode_calls):
+    token = create_access_token({"sub": "1"})
+    verify_token(token)
+    verify_token(token, use_cache=False)
+
+    assert len(decode_calls) == 2
+
+
+def test_cached_claims_still_honor_exp(decode_calls):
+    claims = {**security._base_claims("access"), "sub": "1", "exp": int(time.time()) + 1}
+    token = jwt.encode(claims, security.settings.JWT_SECRET, algorithm=security.ALGO)
+    verify_token(token)
+    assert token_cache.get(hash_token(token)) is not None
+
+    time.sleep(2.1)  # jose compares exp at whole-second resolution
+    with pytest.raises(ExpiredSignatureError):
+        verify_token(token)
+    assert len(decode_calls) == 2
+
+
+def test_expired_tokens_are_not_cached():
+    token = create_access_token({"sub": "1"}, expires_minutes=-1)
+
+    with pytest.raises(ExpiredSignatureError):
+        verify_token(token)
+    assert token_cache.get(hash_token(token)) is None
+
+
+def test_token_type_is_checked_on_cache_hit():
+    token = create_refresh_token({"sub": "1"})
+    verify_token(token, token_type="refresh")
+
+    with pytest.raises(HTTPException) as exc:
+        verify_token(token, token_type="access")
+    assert exc.value.status_code == 401
+
+
+def test_mutating_result_does_not_poison_cache():
+    token = create_access_token({"sub": "1"})
+    verify_token(token)["sub"] = "2"
+
+    assert verify_token(token)["sub"] == "1"
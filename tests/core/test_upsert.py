@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from corner_pocket_backend.core.db import upsert
+from corner_pocket_backend.models import Base, GameType, Rating, User
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(id=1, email="a@test.com", handle="a", display_name="A"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def write(db_session, rating: float, **options):
+    row = {"user_id": 1, "game_type": GameType.NINE_BALL, "rating": rating, "matches_rated": 1}
+    return upsert(db_session, Rating, ["user_id", "game_type"], [row], **options)
+
+
+def test_inserts_then_merges_by_key(db_session):
+    write(db_session, 1500.0, increments=["matches_rated"])
+    write(db_session, 1510.0, increments=["matches_rated"])
+
+    stored = db_session.execute(select(Rating.rating, Rating.matches_rated)).one()
+    assert tuple(stored) == (1510.0, 2)  # rating overwritten, matches_rated added
+
+
+def test_set_overrides_the_merge_and_returning_reads_the_result(db_session):
+    write(db_session, 1500.0)
+    result = write(
+        db_session,
+        8.0,
+        set_=lambda excluded: {"rating": Rating.rating + excluded.rating},
+        returning=[Rating.user_id, Rating.rating],
+    )
+
+    assert result.tuples().all() == [(1, 1508.0)]
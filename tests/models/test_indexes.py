@@ -0,0 +1,145 @@
+"""Query-plan tests: the hot query paths must be served by an index.
+
+SQLite's EXPLAIN QUERY PLAN stands in for Postgres EXPLAIN; the indexes are
+declared on the models so `create_all` builds the same ones the migration does.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, or_, select, text
+from sqlalchemy.orm import sessionmaker
+
+from corner_pocket_backend.models import (
+    Approval,
+    Base,
+    Change,
+    Game,
+    GameType,
+    HeadToHead,
+    Match,
+    MatchStatus,
+    Rating,
+)
+from corner_pocket_backend.models.security import RefreshToken
+
+
+@pytest.fixture
+def db_session():
+    """Create an in-memory SQLite database for testing."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def query_plan(db_session, stmt) -> str:
+    """Return SQLite's EXPLAIN QUERY PLAN details for a statement, one step per line."""
+    compiled = stmt.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+def test_matches_by_creator_and_status_use_index(db_session):
+    stmt = (
+        select(Match)
+        .where(Match.creator_id == 1, Match.status == MatchStatus.PENDING)
+        .order_by(Match.id.desc())
+    )
+    plan = query_plan(db_session, stmt)
+
+    assert "USING INDEX ix_matches_creator_id_status_id" in plan
+    assert "TEMP B-TREE" not in plan  # ordered by the index, no sort step
+
+
+def test_matches_by_opponent_and_status_use_index(db_session):
+    stmt = select(Match).where(Match.opponent_id == 1, Match.status == MatchStatus.APPROVED)
+    plan = query_plan(db_session, stmt)
+
+    assert "USING INDEX ix_matches_opponent_id_status_id" in plan
+
+
+@pytest.mark.parametrize(
+    "column, index",
+    [
+        (Match.creator_id, "ix_matches_creator_id_id"),
+        (Match.opponent_id, "ix_matches_opponent_id_id"),
+    ],
+)
+def test_unfiltered_match_pages_are_index_ordered(db_session, column, index):
+    stmt = select(Match).where(column == 1, Match.id < 100).order_by(Match.id.desc()).limit(21)
+    plan = query_plan(db_session, stmt)
+
+    assert f"USING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_games_of_match_use_index(db_session):
+    stmt = select(Game).where(Game.match_id == 1).order_by(Game.id)
+    plan = query_plan(db_session, stmt)
+
+    assert "USING INDEX ix_games_match_id_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize(
+    "column, index",
+    [
+        (Game.winner_user_id, "ix_games_winner_user_id"),
+        (Game.loser_user_id, "ix_games_loser_user_id"),
+        (Approval.approver_user_id, "ix_approvals_approver_user_id"),
+        (RefreshToken.user_id, "ix_refresh_tokens_user_id"),
+        (HeadToHead.max_user_id, "ix_head_to_head_max_user_id"),
+    ],
+)
+def test_foreign_key_lookups_use_index(db_session, column, index):
+    plan = query_plan(db_session, select(column.class_).where(column == 1))
+
+    assert f"USING INDEX {index}" in plan or f"USING COVERING INDEX {index}" in plan
+
+
+def test_leaderboard_load_is_index_ordered(db_session):
+    stmt = (
+        select(Rating.user_id, Rating.rating)
+        .where(Rating.game_type == GameType.NINE_BALL)
+        .order_by(Rating.rating.desc(), Rating.user_id)
+        .limit(101)
+    )
+    plan = query_plan(db_session, stmt)
+
+    assert "ix_ratings_game_type_rating_user_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_change_feed_pages_are_index_ordered(db_session):
+    stmt = (
+        select(Change)
+        .where(Change.opponent_id == 1, Change.position > 100)
+        .order_by(Change.position)
+        .limit(501)
+    )
+    plan = query_plan(db_session, stmt)
+
+    assert "USING INDEX ix_change_log_opponent_id_position" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_refresh_token_reaper_batches_use_indexes(db_session):
+    now = datetime(2026, 1, 1)
+    stmt = (
+        select(RefreshToken.id)
+        .where(
+            or_(
+                RefreshToken.expires_at <= now,
+                RefreshToken.revoked_at <= now - timedelta(days=1),
+            )
+        )
+        .limit(1000)
+    )
+    plan = query_plan(db_session, stmt)
+
+    assert "ix_refresh_tokens_expires_at" in plan
+    assert "ix_refresh_tokens_revoked_at" in plan
+    assert "SCAN refresh_tokens" not in plan
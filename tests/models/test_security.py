@@ -5,6 +5,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from corner_pocket_backend.models import Base
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 
 @pytest.fixture
@@ -35,3 +36,16 @@ def test_refresh_token(db_session):
     assert refresh_token.user_id == user.id
     assert refresh_token.token_hash == "test_token_hash"
     assert refresh_token.revoked_at is None
+
+
+def test_refresh_token_hash_is_unique(db_session):
+    user = User(email="test@example.com", handle="testuser", display_name="Test User")
+    db_session.add(user)
+    db_session.commit()
+
+    expires_at = datetime.now() + timedelta(days=30)
+    db_session.add(RefreshToken(user_id=user.id, token_hash="a" * 64, expires_at=expires_at))
+    db_session.commit()
+    db_session.add(RefreshToken(user_id=user.id, token_hash="a" * 64, expires_at=expires_at))
+    with pytest.raises(IntegrityError):
+        db_session.commit()
@@ -1,8 +1,15 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
 import pytest
-from sqlalchemy import create_engine, event
+import pytest_asyncio
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from corner_pocket_backend.models import Base
+from corner_pocket_backend.models import Base, Game, GameType, User
+from corner_pocket_backend.services.matches import MatchesDbService
 
 
 @pytest.fixture
@@ -26,3 +33,93 @@ def db_session():
         yield session
     finally:
         session.close()
+
+
+@pytest_asyncio.fixture
+async def async_db_session():
+    """Provide a fresh in-memory aiosqlite `AsyncSession` per test."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    Session = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    session = Session()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_users(async_db_session) -> tuple[User, User]:
+    """`users` on `async_db_session`: two committed players, handles "a" and "b"."""
+    players = [User(email=f"{h}@test.com", handle=h, display_name=h.upper()) for h in "ab"]
+    async_db_session.add_all(players)
+    await async_db_session.commit()
+    return players[0], players[1]
+
+
+@pytest.fixture
+def play(db_session):
+    """Record an approved match: ``play(creator, opponent, winners, **options)``.
+
+    Creates the match, plays one rack per entry of `winners` in order and
+    approves it as the opponent. Options: `game_type` (NINE_BALL), `race_to`
+    (2), `rack_type` for racks of another type than the match, and
+    `days_ago` to backdate the racks before approval.
+    """
+    svc = MatchesDbService(db_session)
+
+    def play(
+        creator: User,
+        opponent: User,
+        winners: list[User],
+        game_type: GameType = GameType.NINE_BALL,
+        race_to: int = 2,
+        rack_type: GameType | None = None,
+        days_ago: int | None = None,
+    ):
+        m = svc.add_match(
+            user_id=creator.id, opponent_id=opponent.id, game_type=game_type, race_to=race_to
+        )
+        for w in winners:
+            loser = opponent if w.id == creator.id else creator
+            svc.add_game(m.id, w.id, loser.id, rack_type or game_type, creator.id)
+        if days_ago is not None:
+            db_session.execute(
+                update(Game)
+                .where(Game.match_id == m.id)
+                .values(created_at=datetime.utcnow() - timedelta(days=days_ago))
+            )
+        svc.approve(user_id=opponent.id, match_id=m.id)
+        return m
+
+    return play
+
+
+@pytest.fixture
+def count_queries(db_session):
+    """``with count_queries() as statements``: the SQL `db_session` runs in the block."""
+
+    @contextmanager
+    def count_queries():
+        statements: list[str] = []
+        engine = db_session.get_bind()
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return count_queries
@@ -0,0 +1,89 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from corner_pocket_backend.core.security import create_access_token, get_current_user_async
+from corner_pocket_backend.models import GameType, MatchStatus
+from corner_pocket_backend.services import AsyncMatchesDbService, AsyncUsersDbService
+from corner_pocket_backend.services.security import AsyncSecurityDbService
+
+
+@pytest.mark.asyncio
+async def test_async_users_create_and_lookup(async_db_session, async_users):
+    a, _ = async_users
+    svc = AsyncUsersDbService(db=async_db_session)
+
+    by_id = await svc.get_by_id(a.id)
+    assert by_id is not None
+    assert by_id.email == "a@test.com"
+    assert (await svc.get_by_email("b@test.com")) is not None
+    assert (await svc.get_by_id(999)) is None
+
+    c = await svc.create(email="c@test.com", handle="c", display_name="C", password_hash="x")
+    await async_db_session.commit()
+    assert (await svc.get_by_email("c@test.com")).id == c.id
+
+    with pytest.raises(ValueError):
+        await svc.create(email="a@test.com", handle="dup", display_name="Dup", password_hash="x")
+
+
+@pytest.mark.asyncio
+async def test_async_matches_share_sync_rules(async_db_session, async_users):
+    a, b = async_users
+    svc = AsyncMatchesDbService(db=async_db_session)
+
+    m = await svc.add_match(user_id=a.id, opponent_id=b.id, game_type=GameType.NINE_BALL, race_to=5)
+    await svc.add_game(
+        match_id=m.id,
+        winner_user_id=a.id,
+        loser_user_id=b.id,
+        game_type=GameType.NINE_BALL,
+        acting_user_id=a.id,
+    )
+    await async_db_session.commit()
+
+    detail = await svc.get_match(user_id=b.id, match_id=m.id)
+    assert detail is not None
+    assert detail["status"] == MatchStatus.PENDING.value
+    assert len(detail["games"]) == 1
+
+    with pytest.raises(ValueError):
+        await svc.add_game(
+            match_id=m.id,
+            winner_user_id=a.id,
+            loser_user_id=a.id,
+            game_type=GameType.NINE_BALL,
+            acting_user_id=a.id,
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_security_round_trip(async_db_session, async_users):
+    a, _ = async_users
+    svc = AsyncSecurityDbService(db=async_db_session)
+
+    await svc.store_refresh_token(user_id=a.id, token_hash="digest")
+    assert await svc.verify_refresh_token("digest") is True
+    await svc.revoke_refresh_token("digest")
+    assert await svc.verify_refresh_token("digest") is False
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_async(async_db_session, async_users):
+    a, _ = async_users
+    token = create_access_token({"sub": str(a.id)})
+
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    user = await get_current_user_async(creds=creds, db=async_db_session)
+    assert user.id == a.id
+
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user_async(creds=None, db=async_db_session)
+    assert exc.value.status_code == 401
+
+    stale = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token({"sub": "999"})
+    )
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user_async(creds=stale, db=async_db_session)
+    assert exc.value.detail == "Invalid user"
@@ -38,6 +38,23 @@ class TestGamesDbService:
         assert g.match_id == m.id
         assert g.game_type in (GameType.EIGHT_BALL, GameType.NINE_BALL, GameType.TEN_BALL)
 
+    def test_insert_games(self, db_session):
+        """Test inserting several games at once."""
+        g_srv = GamesDbService(db=db_session)
+        a, b, m = self.seed_users_and_match(db_session)
+
+        games = g_srv.insert_games(
+            match_id=m.id,
+            games=[
+                {"winner_user_id": a.id, "loser_user_id": b.id, "game_type": GameType.EIGHT_BALL},
+                {"winner_user_id": b.id, "loser_user_id": a.id, "game_type": GameType.NINE_BALL},
+            ],
+        )
+
+        assert [g.winner_user_id for g in games] == [a.id, b.id]
+        assert all(g.id is not None and g.match_id == m.id for g in games)
+        assert g_srv.insert_games(match_id=m.id, games=[]) == []
+
     def test_add_game_invalid_match(self, db_session):
         """Test adding a game to an invalid match."""
         g_srv = GamesDbService(db=db_session)
@@ -0,0 +1,116 @@
+import pytest
+from sqlalchemy import select
+
+from corner_pocket_backend.models import GameType, HeadToHead
+from corner_pocket_backend.services.head_to_head import HeadToHeadDbService
+from corner_pocket_backend.services.matches import MatchesDbService
+
+
+def record(page) -> tuple[int, int, int, int, int]:
+    return (
+        page.matches_played,
+        page.matches_won,
+        page.matches_lost,
+        page.racks_won,
+        page.racks_lost,
+    )
+
+
+def stored(db_session) -> list[tuple]:
+    return [
+        (r.min_user_id, r.max_user_id, r.game_type, r.matches_played)
+        + (r.min_user_wins, r.max_user_wins, r.min_user_racks, r.max_user_racks)
+        for r in db_session.scalars(
+            select(HeadToHead).order_by(
+                HeadToHead.min_user_id, HeadToHead.max_user_id, HeadToHead.game_type
+            )
+        )
+    ]
+
+
+class TestHeadToHead:
+    def test_record_is_the_same_from_either_side(self, db_session, users, play):
+        a, b, *_ = users
+        play(a, b, [a, b, a])
+        play(b, a, [b, b])
+        play(b, a, [a], race_to=1, game_type=GameType.TEN_BALL)
+        db_session.commit()
+        h2h = HeadToHeadDbService(db_session)
+
+        mine = h2h.head_to_head(a.id, b.id)
+        theirs = h2h.head_to_head(b.id, a.id)
+
+        assert record(mine) == (3, 2, 1, 3, 3)
+        assert record(theirs) == (3, 1, 2, 3, 3)
+        assert [(r.game_type.value, record(r)) for r in mine.by_game_type] == [
+            ("NINE_BALL", (2, 1, 1, 2, 3)),
+            ("TEN_BALL", (1, 1, 0, 1, 0)),
+        ]
+        assert len(stored(db_session)) == 2
+
+    def test_void_takes_the_match_back_out(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        play(a, b, [a, a])
+        m = play(a, b, [b, b])
+        svc.void(user_id=b.id, match_id=m.id)
+        db_session.commit()
+
+        h2h = HeadToHeadDbService(db_session).head_to_head(a.id, b.id)
+        assert record(h2h) == (1, 1, 0, 2, 0)
+
+    def test_no_record_against_yourself(self, db_session):
+        with pytest.raises(ValueError):
+            HeadToHeadDbService(db_session).head_to_head(1, 1)
+
+
+class TestRivals:
+    def test_rivals_are_ordered_by_matches_played(self, db_session, users, play):
+        a, b, c, _ = users
+        play(a, b, [a, a])
+        play(c, b, [c, b, c])
+        play(b, c, [c, c])
+        play(c, b, [b], race_to=1, game_type=GameType.EIGHT_BALL)
+        db_session.commit()
+        h2h = HeadToHeadDbService(db_session)
+
+        rivals = h2h.rivals(b.id)
+        assert [(r.handle, record(r)) for r in rivals.rivals] == [
+            ("c", (3, 1, 2, 2, 4)),
+            ("a", (1, 0, 1, 0, 2)),
+        ]
+        assert [r.handle for r in h2h.rivals(b.id, limit=1).rivals] == ["c"]
+        eight = h2h.rivals(b.id, game_type=GameType.EIGHT_BALL)
+        assert [(r.handle, r.matches_won) for r in eight.rivals] == [("c", 1)]
+
+    def test_voided_rivalry_drops_out(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = play(a, b, [a, a])
+        svc.void(user_id=b.id, match_id=m.id)
+        db_session.commit()
+
+        assert HeadToHeadDbService(db_session).rivals(a.id).rivals == []
+
+    def test_rejects_bad_limit(self, db_session):
+        for limit in (0, 51):
+            with pytest.raises(ValueError):
+                HeadToHeadDbService(db_session).rivals(1, limit=limit)
+
+
+def test_rebuild_matches_incremental_records(db_session, users, play):
+    svc = MatchesDbService(db_session)
+    a, b, c, _ = users
+    play(a, b, [a, b, a])
+    play(c, a, [c, c])
+    play(b, a, [b], race_to=1, game_type=GameType.TEN_BALL)
+    voided = play(c, b, [b, b])
+    svc.void(user_id=b.id, match_id=voided.id)
+    db_session.commit()
+    incremental = [row for row in stored(db_session) if row[3]]
+
+    written = HeadToHeadDbService(db_session).rebuild()
+    db_session.commit()
+
+    assert written == 3
+    assert stored(db_session) == incremental
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from corner_pocket_backend.models import IdempotencyKey
+from corner_pocket_backend.services.idempotency import (
+    IdempotencyDbService,
+    IdempotencyKeyMismatch,
+    hash_request,
+)
+
+TTL = timedelta(hours=1)
+
+
+class TestIdempotencyDbService:
+    def test_remembered_response_is_returned_for_the_same_request(self, db_session, users):
+        svc = IdempotencyDbService(db=db_session)
+        user, *_ = users
+        request_hash = hash_request("POST", "/api/v1/matches", '{"opponent_id":2}')
+
+        assert svc.lookup(user.id, "k1", request_hash) is None
+        svc.remember(user.id, "k1", request_hash, 200, '{"id":1}', TTL)
+        db_session.commit()
+
+        stored = svc.lookup(user.id, "k1", request_hash)
+        assert (stored.status_code, stored.response_body) == (200, '{"id":1}')
+
+    def test_keys_are_scoped_per_user(self, db_session, users):
+        svc = IdempotencyDbService(db=db_session)
+        alice, bob, *_ = users
+        svc.remember(alice.id, "k1", "h", 200, "{}", TTL)
+
+        assert svc.lookup(bob.id, "k1", "h") is None
+
+    def test_reused_key_with_different_request_is_rejected(self, db_session, users):
+        svc = IdempotencyDbService(db=db_session)
+        user, *_ = users
+        svc.remember(user.id, "k1", hash_request("POST", "/a", "{}"), 200, "{}", TTL)
+
+        with pytest.raises(IdempotencyKeyMismatch):
+            svc.lookup(user.id, "k1", hash_request("POST", "/b", "{}"))
+
+    def test_duplicate_key_violates_unique_index(self, db_session, users):
+        svc = IdempotencyDbService(db=db_session)
+        user, *_ = users
+        svc.remember(user.id, "k1", "h", 200, "{}", TTL)
+        db_session.commit()
+
+        with pytest.raises(IntegrityError):
+            svc.remember(user.id, "k1", "h", 200, "{}", TTL)
+
+    def test_expired_key_can_be_used_again(self, db_session, users):
+        svc = IdempotencyDbService(db=db_session)
+        user, *_ = users
+        svc.remember(user.id, "k1", "old", 200, "{}", -TTL)
+        db_session.commit()
+
+        assert svc.lookup(user.id, "k1", "new") is None
+        svc.remember(user.id, "k1", "new", 200, "{}", TTL)
+        db_session.commit()
+        assert svc.lookup(user.id, "k1", "new") is not None
+
+
+class TestPurgeExpiredIdempotencyKeys:
+    def test_purges_only_expired_keys_in_batches(self, db_session, users):
+        svc = IdempotencyDbService(db=db_session)
+        user, *_ = users
+        for i in range(5):
+            svc.remember(user.id, f"old{i}", "h", 200, "{}", -TTL)
+        svc.remember(user.id, "live", "h", 200, "{}", TTL)
+        db_session.commit()
+
+        partial = svc.purge_expired(batch_size=2, max_batches=1)
+        assert partial == {"deleted": 2, "batches": 1, "elapsed_ms": partial["elapsed_ms"]}
+
+        rest = svc.purge_expired(batch_size=2)
+        assert (rest["deleted"], rest["batches"]) == (3, 2)
+        assert [row.key for row in db_session.query(IdempotencyKey)] == ["live"]
+        assert db_session.query(IdempotencyKey).one().expires_at > datetime.utcnow()
+
+    def test_rejects_non_positive_batch_size(self, db_session):
+        with pytest.raises(ValueError):
+            IdempotencyDbService(db=db_session).purge_expired(batch_size=0)
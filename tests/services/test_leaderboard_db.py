@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import update
+
+from corner_pocket_backend import main
+from corner_pocket_backend.models import GameType, Rating
+from corner_pocket_backend.services.leaderboard import LeaderboardDbService, leaderboards
+from corner_pocket_backend.services.matches import MatchesDbService
+from corner_pocket_backend.services.ratings import RatingsDbService
+
+NINE = GameType.NINE_BALL
+
+
+@pytest.fixture(autouse=True)
+def empty_boards():
+    """Boards are per process; start and end every test without one loaded."""
+    for board in leaderboards.values():
+        board.clear()
+    yield
+    for board in leaderboards.values():
+        board.clear()
+
+
+def ranking(page) -> list[tuple[int, str]]:
+    return [(e.rank, e.handle) for e in page.entries]
+
+
+class TestLeaderboard:
+    def test_loads_on_first_use_and_follows_committed_ratings(self, db_session, users, play):
+        a, b, c, d = users
+        play(a, b, [a, a])
+        db_session.commit()
+        lb = LeaderboardDbService(db_session)
+        loads = leaderboards[NINE].loads
+
+        page = lb.leaderboard(NINE, user_id=b.id)
+        assert ranking(page) == [(1, "a"), (2, "b")]
+        assert (page.me.rank, page.me.rating) == (2, 1484.0)
+
+        play(c, a, [c] * 3, race_to=3)
+        # Not on the board until the ratings commit.
+        assert len(leaderboards[NINE]) == 2
+        db_session.commit()
+        assert ranking(lb.leaderboard(NINE, user_id=d.id)) == [(1, "c"), (2, "a"), (3, "b")]
+        assert lb.leaderboard(NINE, user_id=d.id).me is None
+        assert leaderboards[NINE].loads == loads + 1
+
+    def test_rolled_back_ratings_never_reach_the_board(self, db_session, users, play):
+        a, b, c, _ = users
+        play(a, b, [a, a])
+        db_session.commit()
+        LeaderboardDbService(db_session).load(NINE)
+
+        play(c, a, [c, c])
+        db_session.rollback()
+        db_session.commit()
+
+        assert [id_ for _, id_, _ in leaderboards[NINE].top(10)] == [a.id, b.id]
+
+    def test_rank_below_a_bounded_board_comes_from_the_database(
+        self, db_session, monkeypatch, users, play
+    ):
+        monkeypatch.setattr(leaderboards[NINE], "max_size", 2)
+        a, b, c, d = users
+        play(a, b, [a] * 3, race_to=3)
+        play(c, d, [c], race_to=1)
+        db_session.commit()
+
+        page = LeaderboardDbService(db_session).leaderboard(NINE, user_id=d.id, limit=10)
+
+        assert ranking(page) == [(1, "a"), (2, "c")]
+        assert len(leaderboards[NINE]) == 2
+        assert (page.me.rank, page.me.handle) == (3, "d")
+        assert LeaderboardDbService(db_session).leaderboard(NINE, user_id=b.id).me.rank == 4
+
+    def test_check_reloads_a_board_that_drifted(self, db_session, users, play):
+        a, b, _, _ = users
+        play(a, b, [a, a])
+        db_session.commit()
+        lb = LeaderboardDbService(db_session)
+        lb.load(NINE)
+        assert lb.check() == []
+
+        # Another worker's write: this process's board never saw it.
+        db_session.execute(update(Rating).where(Rating.user_id == b.id).values(rating=1600.0))
+        db_session.commit()
+
+        assert lb.check() == [NINE]
+        assert ranking(lb.leaderboard(NINE, user_id=a.id))[0] == (1, "b")
+
+    def test_recompute_drops_loaded_boards(self, db_session, users, play):
+        a, b, _, _ = users
+        play(a, b, [a, a])
+        db_session.commit()
+        LeaderboardDbService(db_session).load(NINE)
+
+        RatingsDbService(db_session).recompute(k_factor=32)
+        assert leaderboards[NINE].loaded
+        db_session.commit()
+
+        assert not leaderboards[NINE].loaded
+        page = LeaderboardDbService(db_session).leaderboard(NINE, user_id=a.id)
+        assert [e.rating for e in page.entries] == [1532.0, 1468.0]
+
+    def test_void_drops_players_left_without_a_rated_match(self, db_session, users, play):
+        a, b, c, d = users
+        play(c, d, [c, c], game_type=GameType.TEN_BALL)
+        voided = play(a, b, [a, a])
+        play(c, d, [d, d])
+        db_session.commit()
+        lb = LeaderboardDbService(db_session)
+        lb.load(NINE)
+        lb.load(GameType.TEN_BALL)
+
+        MatchesDbService(db_session).void(user_id=b.id, match_id=voided.id)
+        db_session.commit()
+
+        assert not leaderboards[NINE].loaded
+        assert leaderboards[GameType.TEN_BALL].loaded
+        assert ranking(lb.leaderboard(NINE, user_id=a.id)) == [(1, "d"), (2, "c")]
+
+    def test_rejects_bad_paging(self, db_session):
+        lb = LeaderboardDbService(db_session)
+        for kwargs in ({"limit": 0}, {"limit": 101}, {"offset": -1}):
+            with pytest.raises(ValueError):
+                lb.leaderboard(NINE, user_id=1, **kwargs)
+
+
+def test_warm_up_loads_every_board_from_its_own_session(db_session, monkeypatch, users, play):
+    a, b, _, _ = users
+    play(a, b, [a, a])
+    db_session.commit()
+
+    @contextmanager
+    def session_scope():
+        yield db_session
+
+    monkeypatch.setattr(main, "session_scope", session_scope)
+    main.warm_leaderboards()
+
+    assert all(board.loaded for board in leaderboards.values())
+    assert [id_ for _, id_, _ in leaderboards[NINE].top(10)] == [a.id, b.id]
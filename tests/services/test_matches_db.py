@@ -1,13 +1,32 @@
-from corner_pocket_backend.models import User, Match, MatchStatus, Game, GameType
-from corner_pocket_backend.services import MatchesDbService
+import threading
 
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
-def seed_users(session) -> tuple[User, User]:
-    a = User(email="a@test.com", handle="a", display_name="A")
-    b = User(email="b@test.com", handle="b", display_name="B")
-    session.add_all([a, b])
-    session.commit()
-    return a, b
+from corner_pocket_backend.models import (
+    Approval,
+    ApprovalStatus,
+    Base,
+    Change,
+    ChangeEntity,
+    ChangeOp,
+    User,
+    Match,
+    MatchStatus,
+    Game,
+    GameType,
+)
+from corner_pocket_backend.services import MatchesDbService
+from corner_pocket_backend.schemas.matches import GameEdit
+from corner_pocket_backend.services.matches import (
+    MAX_PAGE_SIZE,
+    MatchNotFound,
+    MatchStateConflict,
+    MatchVersionConflict,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 def seed_match_with_games(session, creator: User, opponent: User) -> Match:
@@ -37,10 +56,10 @@ def seed_match_with_games(session, creator: User, opponent: User) -> Match:
     return m
 
 
-def test_list_matches_mine_filters_by_participation(db_session):
+def test_list_matches_mine_filters_by_participation(db_session, users):
     """Test that list_matches filters by participation."""
     m_svc = MatchesDbService(db=db_session)
-    u1, u2 = seed_users(db_session)
+    u1, u2, *_ = users
     m = seed_match_with_games(db_session, u1, u2)
 
     mine = m_svc.list_matches()
@@ -51,10 +70,10 @@ def test_list_matches_mine_filters_by_participation(db_session):
     assert len(all_matches) == 1
 
 
-def test_get_match_includes_games_and_requires_participation(db_session):
+def test_get_match_includes_games_and_requires_participation(db_session, users):
     """Test that get_match includes games and requires participation."""
     m_svc = MatchesDbService(db=db_session)
-    u1, u2 = seed_users(db_session)
+    u1, u2, outsider, _ = users
     m = seed_match_with_games(db_session, u1, u2)
 
     result = m_svc.get_match(user_id=u1.id, match_id=m.id)
@@ -63,8 +82,609 @@ def test_get_match_includes_games_and_requires_participation(db_session):
     assert len(result["games"]) == 2
 
     # Non-participant cannot fetch
-    outsider = User(email="c@test.com", handle="c", display_name="C")
-    db_session.add(outsider)
-    db_session.commit()
     denied = m_svc.get_match(user_id=outsider.id, match_id=m.id)
     assert denied is None
+
+
+class TestListMatchesPage:
+    def test_pages_through_both_sides_newest_first(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, outsider, _ = users
+        created = insert_matches(u1, u2, 3)
+        challenged = insert_matches(u2, u1, 3)
+        insert_matches(u2, outsider, 2)
+        expected = sorted((m.id for m in created + challenged), reverse=True)
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page = m_svc.list_matches_page(user_id=u1.id, limit=4, cursor=cursor)
+            seen.extend(item["id"] for item in page["items"])
+            pages += 1
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert pages == 2
+
+    def test_exact_multiple_of_limit_has_no_empty_trailing_page(
+        self, db_session, users, insert_matches
+    ):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        insert_matches(u1, u2, 4)
+
+        page = m_svc.list_matches_page(user_id=u1.id, limit=4)
+
+        assert len(page["items"]) == 4
+        assert page["next_cursor"] is None
+
+    def test_status_filter_and_all_matches(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        insert_matches(u1, u2, 2)
+        approved = insert_matches(u2, u1, 1, status=MatchStatus.APPROVED)
+
+        page = m_svc.list_matches_page(user_id=u1.id, status=MatchStatus.APPROVED)
+        assert [item["id"] for item in page["items"]] == [approved[0].id]
+
+        everything = m_svc.list_matches_page(limit=10)
+        assert len(everything["items"]) == 3
+
+    def test_rejects_bad_cursor_and_limit(self, db_session):
+        m_svc = MatchesDbService(db=db_session)
+
+        with pytest.raises(ValueError):
+            m_svc.list_matches_page(cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            m_svc.list_matches_page(limit=0)
+        with pytest.raises(ValueError):
+            m_svc.list_matches_page(limit=MAX_PAGE_SIZE + 1)
+
+    def test_cursor_round_trip(self):
+        assert decode_cursor(encode_cursor(12345)) == 12345
+
+
+class TestGetMatchDetail:
+    def test_loads_match_games_and_approval_in_one_query(self, db_session, count_queries, users):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        m = seed_match_with_games(db_session, u1, u2)
+        db_session.add(
+            Approval(match_id=m.id, approver_user_id=u2.id, status=ApprovalStatus.PENDING)
+        )
+        db_session.commit()
+        match_id, u1_id, u2_id = m.id, u1.id, u2.id
+        db_session.expunge_all()
+
+        with count_queries() as statements:
+            detail = m_svc.get_match_detail(user_id=u1_id, match_id=match_id)
+
+        assert len(statements) == 1
+        assert detail is not None
+        assert [g.winner_user_id for g in detail.games] == [u1_id, u2_id]
+        assert detail.approval is not None
+        assert detail.approval.status == ApprovalStatus.PENDING
+
+    def test_non_participant_and_missing_match(self, db_session, users):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        m = seed_match_with_games(db_session, u1, u2)
+
+        assert m_svc.get_match_detail(user_id=u2.id + 100, match_id=m.id) is None
+        assert m_svc.get_match_detail(user_id=u1.id, match_id=m.id + 100) is None
+
+
+class TestAddGames:
+    def test_inserts_all_games_in_one_statement(
+        self, db_session, count_queries, users, insert_matches
+    ):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1, race_to=15)
+        games = [
+            Game(winner_user_id=w.id, loser_user_id=loser.id, game_type=GameType.EIGHT_BALL)
+            for w, loser in [(u1, u2), (u2, u1), (u1, u2)] * 5
+        ]
+
+        with count_queries() as statements:
+            added = m_svc.add_games(user_id=u1.id, match_id=m.id, games=games)
+
+        inserts = [s for s in statements if s.startswith("INSERT")]
+        assert len(inserts) == 1
+        assert len(statements) == 3  # match lookup + insert + score increment
+        assert [g.winner_user_id for g in added] == [g.winner_user_id for g in games]
+        assert all(g.id is not None and g.match_id == m.id for g in added)
+
+    def test_invalid_game_inserts_nothing(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+        games = [
+            Game(winner_user_id=u1.id, loser_user_id=u2.id, game_type=GameType.EIGHT_BALL),
+            Game(winner_user_id=u1.id, loser_user_id=u1.id, game_type=GameType.EIGHT_BALL),
+        ]
+
+        with pytest.raises(ValueError):
+            m_svc.add_games(user_id=u1.id, match_id=m.id, games=games)
+        assert db_session.query(Game).filter(Game.match_id == m.id).count() == 0
+
+    def test_requires_pending_match_and_participant(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (approved,) = insert_matches(u1, u2, 1, status=MatchStatus.APPROVED)
+        (pending,) = insert_matches(u1, u2, 1)
+        game = Game(winner_user_id=u1.id, loser_user_id=u2.id, game_type=GameType.EIGHT_BALL)
+
+        with pytest.raises(ValueError):
+            m_svc.add_games(user_id=u1.id, match_id=approved.id, games=[game])
+        with pytest.raises(PermissionError):
+            m_svc.add_games(user_id=u2.id + 100, match_id=pending.id, games=[game])
+        assert m_svc.add_games(user_id=u1.id, match_id=pending.id, games=[]) == []
+
+
+class TestDeleteGames:
+    def test_deletes_in_one_statement_and_reports_missing(self, db_session, count_queries, users):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        m = seed_match_with_games(db_session, u1, u2)
+        other = seed_match_with_games(db_session, u1, u2)
+        game_ids = [g.id for g in m.games]
+        foreign_id = other.games[0].id
+        match_id, u2_id = m.id, u2.id
+
+        with count_queries() as statements:
+            missing = m_svc.delete_games(
+                match_id=match_id, acting_user_id=u2_id, game_ids=[*game_ids, foreign_id, 9999]
+            )
+
+        assert missing == [foreign_id, 9999]
+        assert len([s for s in statements if s.startswith("DELETE")]) == 1
+        assert len(statements) == 3  # match lookup + delete + score decrement
+        assert db_session.query(Game).filter(Game.match_id == m.id).count() == 0
+        assert db_session.query(Game).filter(Game.match_id == other.id).count() == 2
+
+    def test_requires_participant(self, db_session, users):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        m = seed_match_with_games(db_session, u1, u2)
+
+        with pytest.raises(PermissionError):
+            m_svc.delete_games(match_id=m.id, acting_user_id=u2.id + 100, game_ids=[1])
+        with pytest.raises(ValueError):
+            m_svc.delete_games(match_id=m.id + 100, acting_user_id=u1.id, game_ids=[1])
+
+
+class TestEditGames:
+    def test_edits_in_one_statement_and_reports_missing(self, db_session, count_queries, users):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        m = seed_match_with_games(db_session, u1, u2)
+        first, second = m.games
+
+        with count_queries() as statements:
+            missing = m_svc.edit_games(
+                match_id=m.id,
+                acting_user_id=u1.id,
+                edits=[
+                    GameEdit(game_id=first.id, winner_user_id=u2.id, loser_user_id=u1.id),
+                    GameEdit(game_id=second.id, winner_user_id=u1.id, loser_user_id=u2.id),
+                    GameEdit(game_id=9999, winner_user_id=u1.id, loser_user_id=u2.id),
+                ],
+            )
+
+        assert missing == [9999]
+        assert len([s for s in statements if s.startswith("UPDATE games")]) == 1
+        db_session.expire_all()
+        assert (first.winner_user_id, first.loser_user_id) == (u2.id, u1.id)
+        assert (second.winner_user_id, second.loser_user_id) == (u1.id, u2.id)
+
+    def test_invalid_edit_changes_nothing(self, db_session, users):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        m = seed_match_with_games(db_session, u1, u2)
+        first, second = m.games
+
+        with pytest.raises(ValueError):
+            m_svc.edit_games(
+                match_id=m.id,
+                acting_user_id=u1.id,
+                edits=[
+                    GameEdit(game_id=first.id, winner_user_id=u2.id, loser_user_id=u1.id),
+                    GameEdit(game_id=second.id, winner_user_id=u1.id, loser_user_id=u1.id),
+                ],
+            )
+        with pytest.raises(ValueError):
+            m_svc.edit_games(
+                match_id=m.id,
+                acting_user_id=u1.id,
+                edits=[
+                    GameEdit(game_id=first.id, winner_user_id=u2.id, loser_user_id=u1.id),
+                    GameEdit(game_id=first.id, winner_user_id=u1.id, loser_user_id=u2.id),
+                ],
+            )
+        db_session.expire_all()
+        assert first.winner_user_id == u1.id
+
+
+class TestRunningScore:
+    def scores(self, db_session, match_id):
+        db_session.expire_all()
+        m = db_session.get(Match, match_id)
+        return m.creator_score, m.opponent_score
+
+    def test_game_writes_keep_scores_in_step(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+        match_id = m.id
+        assert self.scores(db_session, match_id) == (0, 0)
+
+        g1 = m_svc.add_game(match_id, u1.id, u2.id, GameType.EIGHT_BALL, acting_user_id=u1.id)
+        assert self.scores(db_session, match_id) == (1, 0)
+
+        added = m_svc.add_games(
+            user_id=u2.id,
+            match_id=match_id,
+            games=[
+                Game(winner_user_id=u2.id, loser_user_id=u1.id, game_type=GameType.EIGHT_BALL),
+                Game(winner_user_id=u2.id, loser_user_id=u1.id, game_type=GameType.EIGHT_BALL),
+                Game(winner_user_id=u1.id, loser_user_id=u2.id, game_type=GameType.EIGHT_BALL),
+            ],
+        )
+        assert self.scores(db_session, match_id) == (2, 2)
+
+        m_svc.edit_game(match_id, u1.id, g1.id, winner_user_id=u2.id, loser_user_id=u1.id)
+        assert self.scores(db_session, match_id) == (1, 3)
+
+        m_svc.delete_game(match_id, u1.id, added[0].id)
+        assert self.scores(db_session, match_id) == (1, 2)
+
+        m_svc.edit_games(
+            match_id,
+            u1.id,
+            [GameEdit(game_id=added[1].id, winner_user_id=u1.id, loser_user_id=u2.id)],
+        )
+        assert self.scores(db_session, match_id) == (2, 1)
+
+        m_svc.delete_games(match_id, u1.id, [g1.id, added[2].id])
+        assert self.scores(db_session, match_id) == (1, 0)
+
+    def test_recount_repairs_drift(self, db_session, users):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        m = seed_match_with_games(db_session, u1, u2)  # games inserted directly
+        match_id = m.id
+        assert self.scores(db_session, match_id) == (0, 0)
+
+        m_svc.recount_scores()
+
+        assert self.scores(db_session, match_id) == (1, 1)
+
+    def test_listing_includes_scores(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+        m_svc.add_game(m.id, u2.id, u1.id, GameType.EIGHT_BALL, acting_user_id=u1.id)
+
+        (item,) = m_svc.list_matches_page(user_id=u1.id)["items"]
+
+        assert (item["creator_score"], item["opponent_score"]) == (0, 1)
+
+
+class TestMatchStateMachine:
+    def test_submit_then_approve(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+
+        submitted = m_svc.submit(user_id=u1.id, match_id=m.id)
+        assert submitted.status == MatchStatus.SUBMITTED
+        assert submitted.approval.status == ApprovalStatus.PENDING
+        assert submitted.approval.approver_user_id == u2.id
+
+        approved = m_svc.approve(user_id=u2.id, match_id=m.id, note="gg")
+        db_session.expire_all()
+        assert approved.status == MatchStatus.APPROVED
+        assert approved.approval.status == ApprovalStatus.APPROVED
+        assert approved.approval.note == "gg"
+        assert approved.approval.decided_at is not None
+
+    def test_decline_and_cancel(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        declined, cancelled = insert_matches(u1, u2, 2)
+
+        m_svc.submit(user_id=u1.id, match_id=declined.id)
+        assert m_svc.decline(user_id=u2.id, match_id=declined.id).status == MatchStatus.DECLINED
+
+        m_svc.submit(user_id=u1.id, match_id=cancelled.id)
+        assert m_svc.cancel(user_id=u1.id, match_id=cancelled.id).status == MatchStatus.CANCELLED
+        assert db_session.query(Approval).filter(Approval.match_id == cancelled.id).count() == 0
+
+    def test_rejected_transitions_explain_why(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+
+        with pytest.raises(MatchNotFound):
+            m_svc.submit(user_id=u1.id, match_id=m.id + 100)
+        with pytest.raises(PermissionError):
+            m_svc.submit(user_id=u2.id, match_id=m.id)  # only the creator submits
+        with pytest.raises(PermissionError):
+            m_svc.cancel(user_id=u2.id + 100, match_id=m.id)
+        with pytest.raises(MatchStateConflict):
+            m_svc.approve(user_id=u2.id, match_id=m.id)  # not submitted yet
+
+        m_svc.submit(user_id=u1.id, match_id=m.id)
+        with pytest.raises(MatchStateConflict):
+            m_svc.submit(user_id=u1.id, match_id=m.id)
+        with pytest.raises(PermissionError):
+            m_svc.approve(user_id=u1.id, match_id=m.id)  # only the opponent approves
+
+    def test_edit_match_goes_through_transitions(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+
+        assert m_svc.edit_match(u1.id, m.id, MatchStatus.SUBMITTED).status == MatchStatus.SUBMITTED
+        with pytest.raises(MatchStateConflict):
+            m_svc.edit_match(u1.id, m.id, MatchStatus.PENDING)
+        with pytest.raises(PermissionError):
+            m_svc.edit_match(u1.id, m.id, MatchStatus.APPROVED)
+
+    def test_reaching_race_to_submits_the_match(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1, race_to=2)
+
+        m_svc.add_game(m.id, u1.id, u2.id, GameType.EIGHT_BALL, acting_user_id=u1.id)
+        assert m.status == MatchStatus.PENDING
+        m_svc.add_game(m.id, u1.id, u2.id, GameType.EIGHT_BALL, acting_user_id=u1.id)
+        assert m.status == MatchStatus.SUBMITTED
+        assert m.approval is not None and m.approval.approver_user_id == u2.id
+
+        with pytest.raises(MatchStateConflict):
+            m_svc.add_game(m.id, u2.id, u1.id, GameType.EIGHT_BALL, acting_user_id=u2.id)
+        with pytest.raises(MatchStateConflict):
+            m_svc.delete_games(m.id, u1.id, [g.id for g in m.games])
+
+    def test_batch_past_race_to_is_rejected(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1, race_to=2)
+        game = Game(winner_user_id=u1.id, loser_user_id=u2.id, game_type=GameType.EIGHT_BALL)
+
+        with pytest.raises(ValueError):
+            m_svc.add_games(user_id=u1.id, match_id=m.id, games=[game] * 3)
+
+        m_svc.add_games(user_id=u1.id, match_id=m.id, games=[game] * 2)
+        assert m.status == MatchStatus.SUBMITTED
+
+    def test_concurrent_approve_and_decline_have_one_winner(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'matches.db'}", connect_args={"timeout": 30})
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as setup:
+            u1 = User(email="a@test.com", handle="a", display_name="A")
+            u2 = User(email="b@test.com", handle="b", display_name="B")
+            setup.add_all([u1, u2])
+            setup.flush()
+            m = Match(
+                creator_id=u1.id,
+                opponent_id=u2.id,
+                status=MatchStatus.PENDING,
+                game_type=GameType.EIGHT_BALL,
+                race_to=5,
+            )
+            setup.add(m)
+            setup.commit()
+            MatchesDbService(setup).submit(user_id=u1.id, match_id=m.id)
+            setup.commit()
+            match_id, opponent_id = m.id, u2.id
+
+        workers = 8
+        barrier = threading.Barrier(workers)
+        outcomes: list[str] = []
+
+        def decide(action: str) -> None:
+            with Session() as db:
+                barrier.wait()
+                try:
+                    getattr(MatchesDbService(db), action)(user_id=opponent_id, match_id=match_id)
+                    db.commit()
+                    outcomes.append(action)
+                except MatchStateConflict:
+                    db.rollback()
+                    outcomes.append("conflict")
+
+        actions = ["approve", "decline"] * (workers // 2)
+        threads = [threading.Thread(target=decide, args=(a,)) for a in actions]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        with Session() as check:
+            final = check.get(Match, match_id)
+            winner = "approve" if final.status == MatchStatus.APPROVED else "decline"
+            approval_status = final.approval.status
+        engine.dispose()
+
+        assert outcomes.count("conflict") == workers - 1
+        assert outcomes.count(winner) == 1
+        assert approval_status.value == final.status.value
+
+
+class TestDeleteMatch:
+    def test_deletes_games_and_tombstones_them(self, db_session, users):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        m = seed_match_with_games(db_session, u1, u2)
+        game_ids = {g.id for g in m.games}
+
+        m_svc.delete_match(user_id=u2.id, match_id=m.id)
+        db_session.commit()
+
+        assert db_session.get(Match, m.id) is None
+        assert db_session.query(Game).count() == 0
+        tombstones = db_session.query(Change).filter(Change.op == ChangeOp.DELETE).all()
+        assert {(t.entity, t.entity_id) for t in tombstones} == {
+            (ChangeEntity.MATCH, m.id),
+            *((ChangeEntity.GAME, game_id) for game_id in game_ids),
+        }
+
+    def test_deletes_submitted_match_with_its_approval(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1, race_to=1)
+        m_svc.add_game(m.id, u1.id, u2.id, GameType.EIGHT_BALL, u1.id)  # submits
+        approval_id = m.approval.id
+        db_session.commit()
+
+        m_svc.delete_match(user_id=u1.id, match_id=m.id)
+        db_session.commit()
+
+        assert db_session.query(Match).count() == db_session.query(Approval).count() == 0
+        assert (
+            db_session.query(Change)
+            .filter(
+                Change.entity == ChangeEntity.APPROVAL,
+                Change.entity_id == approval_id,
+                Change.op == ChangeOp.DELETE,
+            )
+            .count()
+            == 1
+        )
+
+    def test_refuses_approved_match(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+        m_svc.submit(user_id=u1.id, match_id=m.id)
+        m_svc.approve(user_id=u2.id, match_id=m.id)
+        db_session.commit()
+
+        with pytest.raises(MatchStateConflict):
+            m_svc.delete_match(user_id=u1.id, match_id=m.id)
+
+        m_svc.void(user_id=u2.id, match_id=m.id)
+        m_svc.delete_match(user_id=u1.id, match_id=m.id)
+        db_session.commit()
+        assert db_session.query(Match).count() == 0
+
+    def test_requires_participation(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+
+        with pytest.raises(MatchNotFound):
+            m_svc.delete_match(user_id=u1.id, match_id=m.id + 100)
+        with pytest.raises(PermissionError):
+            m_svc.delete_match(user_id=u2.id + 100, match_id=m.id)
+
+
+class TestMatchVersion:
+    def version(self, db_session, match_id):
+        db_session.expire_all()
+        return db_session.get(Match, match_id).version
+
+    def test_every_write_bumps_the_version(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+        assert self.version(db_session, m.id) == 1
+
+        game = m_svc.add_game(m.id, u1.id, u2.id, GameType.EIGHT_BALL, u1.id, expected_version=1)
+        assert self.version(db_session, m.id) == 2
+        m_svc.edit_game(m.id, u1.id, game.id, u1.id, u2.id, expected_version=2)  # same winner
+        assert self.version(db_session, m.id) == 3
+        m_svc.edit_games(
+            m.id, u1.id, [GameEdit(game_id=game.id, winner_user_id=u2.id, loser_user_id=u1.id)]
+        )
+        assert self.version(db_session, m.id) == 4
+        m_svc.delete_game(m.id, u1.id, game.id, expected_version=4)
+        assert self.version(db_session, m.id) == 5
+        assert m_svc.submit(user_id=u1.id, match_id=m.id, expected_version=5).version == 6
+
+    def test_stale_version_is_rejected_and_writes_nothing(self, db_session, users, insert_matches):
+        m_svc = MatchesDbService(db=db_session)
+        u1, u2, *_ = users
+        (m,) = insert_matches(u1, u2, 1)
+        m_svc.add_game(m.id, u1.id, u2.id, GameType.EIGHT_BALL, u1.id)
+
+        with pytest.raises(MatchVersionConflict):
+            m_svc.add_game(m.id, u1.id, u2.id, GameType.EIGHT_BALL, u1.id, expected_version=1)
+        with pytest.raises(MatchVersionConflict):
+            m_svc.submit(user_id=u1.id, match_id=m.id, expected_version=1)
+        assert self.version(db_session, m.id) == 2
+        assert db_session.query(Game).filter(Game.match_id == m.id).count() == 1
+
+        # Role and status are still reported ahead of a version mismatch.
+        with pytest.raises(PermissionError):
+            m_svc.submit(user_id=u2.id, match_id=m.id, expected_version=1)
+        with pytest.raises(MatchStateConflict):
+            m_svc.approve(user_id=u2.id, match_id=m.id, expected_version=2)
+
+    def test_concurrent_writers_at_one_version_have_one_winner(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'matches.db'}", connect_args={"timeout": 30})
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as setup:
+            u1 = User(email="a@test.com", handle="a", display_name="A")
+            u2 = User(email="b@test.com", handle="b", display_name="B")
+            setup.add_all([u1, u2])
+            setup.flush()
+            m = Match(
+                creator_id=u1.id,
+                opponent_id=u2.id,
+                status=MatchStatus.PENDING,
+                game_type=GameType.EIGHT_BALL,
+                race_to=15,
+            )
+            setup.add(m)
+            setup.commit()
+            match_id, creator_id, opponent_id = m.id, u1.id, u2.id
+
+        workers = 8
+        barrier = threading.Barrier(workers)
+        outcomes: list[str] = []
+
+        def record(winner_user_id: int) -> None:
+            with Session() as db:
+                seen = db.get(Match, match_id).version
+                barrier.wait()  # everyone has read the same version
+                loser_user_id = opponent_id if winner_user_id == creator_id else creator_id
+                try:
+                    MatchesDbService(db).add_game(
+                        match_id,
+                        winner_user_id,
+                        loser_user_id,
+                        GameType.EIGHT_BALL,
+                        creator_id,
+                        expected_version=seen,
+                    )
+                    db.commit()
+                    outcomes.append("ok")
+                except MatchVersionConflict:
+                    db.rollback()
+                    outcomes.append("conflict")
+
+        winners = [creator_id, opponent_id] * (workers // 2)
+        threads = [threading.Thread(target=record, args=(w,)) for w in winners]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        with Session() as check:
+            final = check.get(Match, match_id)
+            version, score = final.version, final.creator_score + final.opponent_score
+            games = check.query(Game).filter(Game.match_id == match_id).count()
+        engine.dispose()
+
+        assert outcomes.count("ok") == 1
+        assert outcomes.count("conflict") == workers - 1
+        assert (version, score, games) == (2, 1, 1)
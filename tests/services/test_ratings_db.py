@@ -0,0 +1,128 @@
+import random
+
+import numpy as np
+import pytest
+
+from corner_pocket_backend.models import GameType, User
+from corner_pocket_backend.services.matches import MatchesDbService
+from corner_pocket_backend.services.ratings import RatingsDbService, expected_score, replay
+
+
+def ratings(db_session, user: User) -> dict:
+    return {
+        r.game_type: (round(r.rating, 6), r.matches_rated)
+        for r in RatingsDbService(db_session).ratings(user.id).ratings
+    }
+
+
+class TestRateMatch:
+    def test_approval_moves_both_ratings_by_racks(self, db_session, users, play):
+        a, b, *_ = users
+        play(a, b, [a, b, a])
+        db_session.commit()
+
+        # 2 racks won of 3 at even odds: 16 * (2 - 3 * 0.5).
+        assert ratings(db_session, a) == {GameType.NINE_BALL: (1508.0, 1)}
+        assert ratings(db_session, b) == {GameType.NINE_BALL: (1492.0, 1)}
+
+        play(b, a, [a, a])
+        db_session.commit()
+        gain = 16 * (2 - 2 * expected_score(1508.0, 1492.0))
+        assert ratings(db_session, a) == {GameType.NINE_BALL: (round(1508.0 + gain, 6), 2)}
+
+    def test_void_takes_the_match_back(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        play(a, b, [b], race_to=1, game_type=GameType.TEN_BALL)
+        m = play(a, b, [a, a])
+        db_session.commit()
+
+        svc.void(user_id=b.id, match_id=m.id)
+        db_session.commit()
+
+        # Neither player has a rated nine-ball match left; ten-ball is untouched.
+        assert ratings(db_session, a) == {GameType.TEN_BALL: (1492.0, 1)}
+        assert ratings(db_session, b) == {GameType.TEN_BALL: (1508.0, 1)}
+
+    def test_void_rerates_later_matches_exactly(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, c, _ = users
+        voided = play(a, b, [a, a])
+        play(b, c, [b, c, b], race_to=2)
+        play(c, a, [c, c])
+        db_session.commit()
+
+        svc.void(user_id=b.id, match_id=voided.id)
+        db_session.commit()
+        incremental = {u.id: ratings(db_session, u) for u in (a, b, c)}
+
+        RatingsDbService(db_session).recompute()
+        db_session.commit()
+        assert {u.id: ratings(db_session, u) for u in (a, b, c)} == incremental
+        assert incremental[a.id][GameType.NINE_BALL][1] == 1
+
+
+class TestRecompute:
+    def test_recompute_matches_incremental_ratings(self, db_session, users, play):
+        a, b, c, _ = users
+        play(a, b, [a, b, a])
+        play(b, c, [c], race_to=1)
+        play(c, a, [c, a, c], game_type=GameType.EIGHT_BALL)
+        play(a, c, [a, a])
+        play(b, a, [b, a, b])
+        db_session.commit()
+        incremental = {u.id: ratings(db_session, u) for u in (a, b, c)}
+
+        written = RatingsDbService(db_session).recompute()
+        db_session.commit()
+
+        assert written == 5
+        assert {u.id: ratings(db_session, u) for u in (a, b, c)} == incremental
+
+    def test_recompute_applies_new_rules_and_skips_voided_matches(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        play(a, b, [a, b, a])
+        voided = play(a, b, [a, a])
+        svc.void(user_id=b.id, match_id=voided.id)
+        db_session.commit()
+
+        RatingsDbService(db_session).recompute(k_factor=32, initial=1000)
+        db_session.commit()
+
+        assert ratings(db_session, a) == {GameType.NINE_BALL: (1016.0, 1)}
+        assert ratings(db_session, b) == {GameType.NINE_BALL: (984.0, 1)}
+
+    def test_recompute_without_history_clears_ratings(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = play(a, b, [a, a])
+        svc.void(user_id=b.id, match_id=m.id)
+        db_session.commit()
+
+        assert RatingsDbService(db_session).recompute() == 0
+        assert ratings(db_session, a) == {}
+
+
+def test_replay_matches_sequential_elo():
+    rng = random.Random(7)
+    slots, n = 12, 2_000
+    a, b = zip(*(rng.sample(range(slots), 2) for _ in range(n)))
+    a_racks = [rng.randint(0, 9) for _ in range(n)]
+    b_racks = [rng.randint(0, 9) for _ in range(n)]
+
+    expected = [1500.0] * slots
+    for x, y, wx, wy in zip(a, b, a_racks, b_racks):
+        delta = 16 * (wx - (wx + wy) * expected_score(expected[x], expected[y]))
+        expected[x] += delta
+        expected[y] -= delta
+
+    rating, played = replay(
+        *(np.array(v, dtype=np.int64) for v in (a, b, a_racks, b_racks)),
+        slots=slots,
+        k_factor=16,
+        initial=1500,
+    )
+
+    assert rating.tolist() == pytest.approx(expected, abs=1e-6)
+    assert played.sum() == 2 * n
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from corner_pocket_backend.models import GameType, User, UserDailyStats, UserForm
+from corner_pocket_backend.services.matches import MatchesDbService
+from corner_pocket_backend.services.recent import FORM_RACKS, RecentStatsDbService, advance
+
+
+def record(stats) -> tuple[int, int, int, int, int]:
+    return (
+        stats.matches_played,
+        stats.matches_won,
+        stats.matches_lost,
+        stats.racks_won,
+        stats.racks_lost,
+    )
+
+
+def forms(db_session, user: User) -> dict:
+    return {
+        f.game_type.value: (f.current_streak, f.best_streak, f.recent_racks)
+        for f in RecentStatsDbService(db_session).form(user.id).by_game_type
+    }
+
+
+def stored(db_session) -> tuple[list, list]:
+    daily = db_session.execute(
+        select(UserDailyStats.__table__).order_by(
+            UserDailyStats.user_id, UserDailyStats.day, UserDailyStats.game_type
+        )
+    ).all()
+    form = db_session.execute(
+        select(UserForm.__table__).order_by(UserForm.user_id, UserForm.game_type)
+    ).all()
+    return [tuple(r) for r in daily if r.matches_played], [tuple(r) for r in form]
+
+
+def test_advance_tracks_streaks_and_recent_racks():
+    form = dict.fromkeys(("current_streak", "best_streak", "recent_racks", "recent_rack_count"), 0)
+    advance(form, 2, [True, False, True])
+    advance(form, 1, [True])
+    assert (form["current_streak"], form["best_streak"]) == (2, 2)
+    assert (form["recent_racks"], form["recent_rack_count"]) == (0b1011, 4)
+
+    advance(form, -3, [False] * 3)
+    advance(form, 0, [])
+    assert (form["current_streak"], form["best_streak"]) == (0, 2)
+
+    advance(form, 5, [True] * 30)
+    assert form["recent_racks"] == (1 << FORM_RACKS) - 1
+    assert form["recent_rack_count"] == FORM_RACKS
+
+
+class TestWindow:
+    def test_window_counts_only_recent_days(self, db_session, users, play):
+        a, b, *_ = users
+        play(a, b, [a, b, a])
+        play(b, a, [b, b], days_ago=10)
+        play(a, b, [a], race_to=1, game_type=GameType.TEN_BALL, days_ago=40)
+        db_session.commit()
+        recent = RecentStatsDbService(db_session)
+
+        week = recent.window(a.id, days=7)
+        assert record(week) == (1, 1, 0, 2, 1)
+        assert week.since == datetime.utcnow().date() - timedelta(days=6)
+        assert record(recent.window(a.id, days=30)) == (2, 1, 1, 2, 3)
+        year = recent.window(a.id, days=365)
+        assert [(s.game_type.value, s.matches_played) for s in year.by_game_type] == [
+            ("NINE_BALL", 2),
+            ("TEN_BALL", 1),
+        ]
+        ten = recent.window(b.id, days=365, game_type=GameType.TEN_BALL)
+        assert record(ten) == (1, 0, 1, 0, 1)
+
+    def test_void_takes_the_match_out_of_its_day(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        play(a, b, [a, a])
+        m = play(a, b, [b, b], days_ago=3)
+        svc.void(user_id=b.id, match_id=m.id)
+        db_session.commit()
+
+        assert record(RecentStatsDbService(db_session).window(a.id, days=30)) == (1, 1, 0, 2, 0)
+
+    def test_rejects_bad_days(self, db_session):
+        for days in (0, 367):
+            with pytest.raises(ValueError):
+                RecentStatsDbService(db_session).window(1, days=days)
+
+
+class TestForm:
+    def test_form_follows_approvals_in_order(self, db_session, users, play):
+        a, b, c, _ = users
+        play(a, b, [a, b, a])
+        play(c, a, [a, a])
+        play(a, c, [c, a, c])
+        play(a, b, [a], race_to=1, game_type=GameType.EIGHT_BALL)
+        db_session.commit()
+
+        assert forms(db_session, a) == {
+            "EIGHT_BALL": (1, 1, "W"),
+            "NINE_BALL": (-1, 2, "LWLWWWLW"),
+        }
+        assert forms(db_session, c) == {"NINE_BALL": (1, 1, "WLWLL")}
+        nine = RecentStatsDbService(db_session).form(a.id).by_game_type[1]
+        assert nine.recent_racks_won == 5
+
+    def test_void_replays_the_remaining_history(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        play(a, b, [a, a])
+        m = play(a, b, [b, b])
+        play(b, a, [a, a])
+        svc.void(user_id=b.id, match_id=m.id)
+        db_session.commit()
+
+        assert forms(db_session, a) == {"NINE_BALL": (2, 2, "WWWW")}
+        assert forms(db_session, b) == {"NINE_BALL": (-2, 0, "LLLL")}
+
+    def test_voiding_the_only_match_clears_form(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = play(a, b, [a, a])
+        svc.void(user_id=b.id, match_id=m.id)
+        db_session.commit()
+
+        assert forms(db_session, a) == {}
+
+
+def test_rebuild_matches_incremental_aggregates(db_session, users, play):
+    svc = MatchesDbService(db_session)
+    a, b, c, _ = users
+    play(a, b, [a, b, a])
+    play(c, a, [c, c], days_ago=2)
+    play(b, a, [b], race_to=1, game_type=GameType.TEN_BALL, days_ago=2)
+    voided = play(c, b, [b, b])
+    play(b, c, [c, b, b])
+    svc.void(user_id=b.id, match_id=voided.id)
+    db_session.commit()
+    incremental = stored(db_session)
+
+    written = RecentStatsDbService(db_session).rebuild()
+    db_session.commit()
+
+    assert written == 7
+    assert stored(db_session) == incremental
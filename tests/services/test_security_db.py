@@ -1,7 +1,17 @@
+import threading
 from datetime import datetime, timedelta
 
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from corner_pocket_backend.models import Base
 from corner_pocket_backend.models.users import User
-from corner_pocket_backend.services.security import SecurityDbService
+from corner_pocket_backend.services.security import (
+    RefreshTokenError,
+    RefreshTokenReuseError,
+    SecurityDbService,
+)
 
 
 class TestSecurityDbService:
@@ -117,3 +127,152 @@ class TestSecurityDbService:
         svc.delete_refresh_token(refresh_token_hash)
         deleted = svc.get_refresh_token(refresh_token_hash)
         assert deleted is None
+
+
+class TestRotateRefreshToken:
+    def test_rotate_revokes_old_and_stores_new(self, db_session, users):
+        svc = SecurityDbService(db=db_session)
+        user, *_ = users
+        svc.store_refresh_token(user_id=user.id, token_hash="old")
+        db_session.commit()
+
+        new_token = svc.rotate_refresh_token(
+            token_hash="old", new_token_hash="new", user_id=user.id
+        )
+
+        assert new_token.token_hash == "new"
+        assert new_token.user_id == user.id
+        db_session.expire_all()
+        assert svc.verify_refresh_token("old") is False
+        assert svc.verify_refresh_token("new") is True
+
+    def test_rotate_unknown_token(self, db_session, users):
+        svc = SecurityDbService(db=db_session)
+        user, *_ = users
+
+        with pytest.raises(RefreshTokenError):
+            svc.rotate_refresh_token(token_hash="missing", new_token_hash="new", user_id=user.id)
+        assert svc.get_refresh_token("new") is None
+
+    def test_rotate_expired_token(self, db_session, users):
+        svc = SecurityDbService(db=db_session)
+        user, *_ = users
+        svc.store_refresh_token(
+            user_id=user.id,
+            token_hash="old",
+            expires_at=datetime.utcnow() - timedelta(seconds=1),
+        )
+        db_session.commit()
+
+        with pytest.raises(RefreshTokenError) as exc_info:
+            svc.rotate_refresh_token(token_hash="old", new_token_hash="new", user_id=user.id)
+        assert not isinstance(exc_info.value, RefreshTokenReuseError)
+
+    def test_rotate_other_users_token(self, db_session, users):
+        svc = SecurityDbService(db=db_session)
+        user, *_ = users
+        svc.store_refresh_token(user_id=user.id, token_hash="old")
+        db_session.commit()
+
+        with pytest.raises(RefreshTokenError):
+            svc.rotate_refresh_token(token_hash="old", new_token_hash="new", user_id=user.id + 1)
+        assert svc.verify_refresh_token("old") is True
+
+    def test_reuse_revokes_every_live_token(self, db_session, users):
+        svc = SecurityDbService(db=db_session)
+        user, *_ = users
+        svc.store_refresh_token(user_id=user.id, token_hash="old")
+        svc.store_refresh_token(user_id=user.id, token_hash="other-device")
+        db_session.commit()
+        svc.rotate_refresh_token(token_hash="old", new_token_hash="new", user_id=user.id)
+
+        with pytest.raises(RefreshTokenReuseError):
+            svc.rotate_refresh_token(token_hash="old", new_token_hash="newer", user_id=user.id)
+
+        db_session.expire_all()
+        assert svc.verify_refresh_token("new") is False
+        assert svc.verify_refresh_token("other-device") is False
+        assert svc.get_refresh_token("newer") is None
+
+    def test_parallel_rotations_have_one_winner(self, tmp_path):
+        """Concurrent refreshes of one token: exactly one rotation succeeds."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'tokens.db'}", connect_args={"timeout": 30})
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as setup:
+            user = User(email="a@test.com", handle="a", display_name="A")
+            setup.add(user)
+            setup.flush()
+            user_id = user.id
+            SecurityDbService(setup).store_refresh_token(user_id=user_id, token_hash="old")
+            setup.commit()
+
+        workers = 8
+        barrier = threading.Barrier(workers)
+        outcomes: list[str] = []
+
+        def refresh(i: int) -> None:
+            with Session() as db:
+                barrier.wait()
+                try:
+                    SecurityDbService(db).rotate_refresh_token(
+                        token_hash="old", new_token_hash=f"new-{i}", user_id=user_id
+                    )
+                    outcomes.append("ok")
+                except RefreshTokenError:
+                    outcomes.append("rejected")
+
+        threads = [threading.Thread(target=refresh, args=(i,)) for i in range(workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        engine.dispose()
+
+        assert outcomes.count("ok") == 1
+        assert outcomes.count("rejected") == workers - 1
+
+
+class TestPurgeExpiredRefreshTokens:
+    def test_purges_expired_and_old_revoked_tokens(self, db_session, users):
+        svc = SecurityDbService(db=db_session)
+        user, *_ = users
+        now = datetime.utcnow()
+        svc.store_refresh_token(user_id=user.id, token_hash="live")
+        svc.store_refresh_token(
+            user_id=user.id, token_hash="expired", expires_at=now - timedelta(minutes=1)
+        )
+        recently_revoked = svc.store_refresh_token(user_id=user.id, token_hash="recent")
+        recently_revoked.revoked_at = now - timedelta(minutes=5)
+        long_revoked = svc.store_refresh_token(user_id=user.id, token_hash="old-revoked")
+        long_revoked.revoked_at = now - timedelta(days=2)
+        db_session.commit()
+
+        result = svc.purge_expired_refresh_tokens(revoked_retention=timedelta(days=1))
+
+        assert result["deleted"] == 2
+        assert result["elapsed_ms"] >= 0
+        db_session.expire_all()
+        assert svc.get_refresh_token("live") is not None
+        assert svc.get_refresh_token("recent") is not None
+        assert svc.get_refresh_token("expired") is None
+        assert svc.get_refresh_token("old-revoked") is None
+
+    def test_purges_in_bounded_batches(self, db_session, users):
+        svc = SecurityDbService(db=db_session)
+        user, *_ = users
+        expired = datetime.utcnow() - timedelta(minutes=1)
+        for i in range(7):
+            svc.store_refresh_token(user_id=user.id, token_hash=f"t{i}", expires_at=expired)
+        db_session.commit()
+
+        partial = svc.purge_expired_refresh_tokens(batch_size=3, max_batches=1)
+        assert partial == {"deleted": 3, "batches": 1, "elapsed_ms": partial["elapsed_ms"]}
+
+        rest = svc.purge_expired_refresh_tokens(batch_size=3)
+        assert rest["deleted"] == 4
+        assert rest["batches"] == 2
+
+    def test_rejects_non_positive_batch_size(self, db_session):
+        with pytest.raises(ValueError):
+            SecurityDbService(db=db_session).purge_expired_refresh_tokens(batch_size=0)
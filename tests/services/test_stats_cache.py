@@ -0,0 +1,109 @@
+import pytest
+
+from corner_pocket_backend.core.cache import TTLCache
+from corner_pocket_backend.models import GameType, User
+from corner_pocket_backend.services.matches import MatchesDbService
+from corner_pocket_backend.services.stats import StatsDbService
+from corner_pocket_backend.services.stats_cache import StatsCache, stats_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    stats_cache.clear()
+    yield
+    stats_cache.clear()
+
+
+def loader(value):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return value
+
+    return load, calls
+
+
+def test_results_are_cached_per_user_and_query():
+    cache = StatsCache(TTLCache(max_size=10, ttl=60))
+    load, calls = loader("summary")
+
+    assert cache.get_or_load(1, ("summary",), load) == "summary"
+    assert cache.get_or_load(1, ("summary",), load) == "summary"
+    cache.get_or_load(2, ("summary",), load)
+    cache.get_or_load(1, ("form",), load)
+
+    assert len(calls) == 3
+    assert cache.stats()["hit_ratio"] == 0.25
+
+
+def test_invalidating_a_user_leaves_others_cached():
+    cache = StatsCache(TTLCache(max_size=10, ttl=60))
+    load, calls = loader("x")
+    cache.get_or_load(1, "q", load)
+    cache.get_or_load(2, "q", load)
+
+    cache.invalidate([1])
+    cache.get_or_load(1, "q", load)
+    cache.get_or_load(2, "q", load)
+    assert len(calls) == 3
+
+    cache.invalidate()
+    cache.get_or_load(2, "q", load)
+    assert len(calls) == 4
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_a_load_that_races_an_invalidation_is_not_served():
+    cache = StatsCache(TTLCache(max_size=10, ttl=60))
+
+    def stale():
+        # A write for the same player commits while this read is in flight.
+        cache.invalidate([1])
+        return "stale"
+
+    cache.get_or_load(1, "q", stale)
+
+    assert cache.get_or_load(1, "q", lambda: "fresh") == "fresh"
+
+
+def test_approval_invalidates_both_players_after_commit(db_session):
+    a, b, c = (User(email=f"{h}@test.com", handle=h, display_name=h) for h in "abc")
+    db_session.add_all([a, b, c])
+    db_session.commit()
+    svc = MatchesDbService(db_session)
+
+    def summary(user):
+        return stats_cache.get_or_load(
+            user.id, ("summary",), lambda: StatsDbService(db_session).summary(user.id)
+        )
+
+    assert summary(a).matches_played == 0
+    summary(c)
+    m = svc.add_match(user_id=a.id, opponent_id=b.id, game_type=GameType.NINE_BALL, race_to=1)
+    svc.add_game(m.id, a.id, b.id, GameType.NINE_BALL, a.id)
+    svc.approve(user_id=b.id, match_id=m.id)
+    # Not committed yet: other requests keep the committed numbers.
+    assert summary(a).matches_played == 0
+
+    db_session.commit()
+    assert summary(a).matches_played == 1
+    before = stats_cache.stats()["misses"]
+    summary(c)
+    assert stats_cache.stats()["misses"] == before
+
+
+def test_rolled_back_approval_keeps_the_cache(db_session):
+    a, b = (User(email=f"{h}@test.com", handle=h, display_name=h) for h in "ab")
+    db_session.add_all([a, b])
+    db_session.commit()
+    svc = MatchesDbService(db_session)
+    m = svc.add_match(user_id=a.id, opponent_id=b.id, game_type=GameType.NINE_BALL, race_to=1)
+    svc.add_game(m.id, a.id, b.id, GameType.NINE_BALL, a.id)
+    db_session.commit()
+    invalidations = stats_cache.stats()["invalidations"]
+
+    svc.approve(user_id=b.id, match_id=m.id)
+    db_session.rollback()
+
+    assert stats_cache.stats()["invalidations"] == invalidations
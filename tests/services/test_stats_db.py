@@ -0,0 +1,185 @@
+import pytest
+from sqlalchemy import select, update
+
+from corner_pocket_backend.models import GameType, MatchStatus, UserStats
+from corner_pocket_backend.services.matches import MatchesDbService, MatchStateConflict
+from corner_pocket_backend.services.stats import COUNTERS, StatsDbService, StatsService
+
+
+def counters(db_session) -> dict:
+    rows = db_session.scalars(select(UserStats).execution_options(populate_existing=True)).all()
+    return {(r.user_id, r.game_type): tuple(getattr(r, c) for c in COUNTERS) for r in rows}
+
+
+class TestUserStats:
+    def test_approval_applies_match_and_racks(self, db_session, users, play):
+        a, b, *_ = users
+        play(a, b, [a, b, a])
+        db_session.commit()
+
+        summary = StatsDbService(db_session).summary(a.id)
+
+        assert (summary.matches_played, summary.matches_won, summary.matches_lost) == (1, 1, 0)
+        assert (summary.racks_won, summary.racks_lost) == (2, 1)
+        [nine] = summary.by_game_type
+        assert nine.game_type == GameType.NINE_BALL
+        assert nine.last_played_at is not None
+        assert counters(db_session)[(b.id, GameType.NINE_BALL)] == (1, 0, 1, 1, 2)
+
+    def test_unapproved_matches_do_not_count(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = svc.add_match(user_id=a.id, opponent_id=b.id, game_type=GameType.NINE_BALL, race_to=1)
+        svc.add_game(m.id, a.id, b.id, GameType.NINE_BALL, a.id)
+        db_session.commit()
+
+        assert StatsDbService(db_session).summary(a.id).matches_played == 0
+
+    def test_racks_count_by_their_own_game_type(self, db_session, users, play):
+        a, b, *_ = users
+        play(a, b, [a], race_to=1, game_type=GameType.EIGHT_BALL, rack_type=GameType.TEN_BALL)
+        db_session.commit()
+
+        assert counters(db_session) == {
+            (a.id, GameType.EIGHT_BALL): (1, 1, 0, 0, 0),
+            (a.id, GameType.TEN_BALL): (0, 0, 0, 1, 0),
+            (b.id, GameType.EIGHT_BALL): (1, 0, 1, 0, 0),
+            (b.id, GameType.TEN_BALL): (0, 0, 0, 0, 1),
+        }
+
+    def test_void_reverses_approval(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, c, _ = users
+        play(a, c, [a], race_to=1)
+        m = play(a, b, [b, b])
+        db_session.commit()
+        last_played = StatsDbService(db_session).summary(b.id).by_game_type[0].last_played_at
+
+        with pytest.raises(PermissionError):
+            svc.void(user_id=a.id, match_id=m.id)
+        voided = svc.void(user_id=b.id, match_id=m.id)
+        db_session.commit()
+
+        assert voided.status == MatchStatus.VOIDED
+        assert counters(db_session) == {
+            (a.id, GameType.NINE_BALL): (1, 1, 0, 1, 0),
+            (b.id, GameType.NINE_BALL): (0, 0, 0, 0, 0),
+            (c.id, GameType.NINE_BALL): (1, 0, 1, 0, 1),
+        }
+        # b no longer has a nine-ball record, though the zeroed row keeps
+        # when they last played: voiding the result doesn't undo that.
+        assert StatsDbService(db_session).summary(b.id).by_game_type == []
+        assert db_session.get(UserStats, (b.id, GameType.NINE_BALL)).last_played_at == last_played
+        with pytest.raises(MatchStateConflict):
+            svc.void(user_id=b.id, match_id=m.id)
+
+    def test_edit_match_updates_stats_like_approve_and_void(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = svc.add_match(user_id=a.id, opponent_id=b.id, game_type=GameType.NINE_BALL, race_to=2)
+        for _ in range(2):
+            svc.add_game(m.id, a.id, b.id, GameType.NINE_BALL, a.id)  # the second submits
+
+        svc.edit_match(b.id, m.id, MatchStatus.APPROVED)
+        db_session.commit()
+        assert counters(db_session) == {
+            (a.id, GameType.NINE_BALL): (1, 1, 0, 2, 0),
+            (b.id, GameType.NINE_BALL): (1, 0, 1, 0, 2),
+        }
+        assert StatsService(db_session).check() == []
+
+        svc.edit_match(b.id, m.id, MatchStatus.VOIDED)
+        db_session.commit()
+        assert set(counters(db_session).values()) == {(0, 0, 0, 0, 0)}
+        assert StatsService(db_session).check() == []
+
+    def test_rebuild_matches_incremental_stats(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, c, _ = users
+        play(a, b, [a, b, a])
+        play(b, c, [c], race_to=1, game_type=GameType.TEN_BALL)
+        play(c, a, [c, a, a], rack_type=GameType.EIGHT_BALL)
+        voided = play(a, c, [a, a])
+        svc.void(user_id=c.id, match_id=voided.id)
+        db_session.commit()
+        incremental = counters(db_session)
+
+        written = StatsDbService(db_session).rebuild()
+        db_session.commit()
+
+        assert written == len(incremental)
+        assert counters(db_session) == incremental
+
+    def test_summary_is_one_query(self, db_session, users, play, count_queries):
+        a, b, *_ = users
+        for _ in range(5):
+            play(a, b, [a, b, b], game_type=GameType.EIGHT_BALL)
+            play(b, a, [a, a], game_type=GameType.TEN_BALL)
+        db_session.commit()
+        user_id = a.id
+
+        with count_queries() as statements:
+            summary = StatsDbService(db_session).summary(user_id)
+
+        assert len(statements) == 1
+        assert summary.matches_played == 10
+        assert (summary.matches_won, summary.racks_won, summary.racks_lost) == (5, 15, 10)
+
+
+class TestLiveStats:
+    def test_live_summary_matches_materialized(self, db_session, users, play):
+        svc = MatchesDbService(db_session)
+        a, b, c, _ = users
+        play(a, b, [a, b, a])
+        play(b, a, [b], race_to=1, game_type=GameType.TEN_BALL)
+        play(c, a, [c, a, a], rack_type=GameType.EIGHT_BALL)
+        voided = play(a, c, [a, a])
+        svc.void(user_id=c.id, match_id=voided.id)
+        pending = svc.add_match(
+            user_id=a.id, opponent_id=b.id, game_type=GameType.NINE_BALL, race_to=9
+        )
+        svc.add_game(pending.id, b.id, a.id, GameType.NINE_BALL, a.id)
+        db_session.commit()
+
+        for user in (a, b, c):
+            live = StatsService(db_session).summary(user.id)
+            materialized = StatsDbService(db_session).summary(user.id)
+            assert live.model_dump(exclude={"by_game_type"}) == materialized.model_dump(
+                exclude={"by_game_type"}
+            )
+            # A void leaves last_played_at in user_stats.
+            assert [
+                s.model_dump(exclude={"last_played_at"}) for s in materialized.by_game_type
+            ] == [s.model_dump(exclude={"last_played_at"}) for s in live.by_game_type]
+        assert StatsService(db_session).check() == []
+
+    def test_live_summary_counts_only_the_players_games(self, db_session, users, play):
+        a, b, c, _ = users
+        play(a, b, [a, b, a])
+        play(b, c, [b, c, c])
+        db_session.commit()
+
+        summary = StatsService(db_session).summary(a.id)
+
+        assert (summary.racks_won, summary.racks_lost) == (2, 1)
+        assert (summary.matches_won, summary.matches_lost) == (1, 0)
+
+    def test_check_reports_drift(self, db_session, users, play):
+        a, b, c, _ = users
+        play(a, b, [a, b, a])
+        play(b, c, [c], race_to=1)
+        db_session.execute(update(UserStats).where(UserStats.user_id == a.id).values(racks_lost=5))
+        db_session.execute(update(UserStats).where(UserStats.user_id == c.id).values(racks_won=0))
+        db_session.commit()
+
+        drift = StatsService(db_session).check()
+
+        assert [(d.user_id, d.game_type) for d in drift] == [
+            (a.id, GameType.NINE_BALL),
+            (c.id, GameType.NINE_BALL),
+        ]
+        assert (drift[0].live["racks_lost"], drift[0].materialized["racks_lost"]) == (1, 5)
+        assert [d.user_id for d in StatsService(db_session).check(user_ids=[b.id, c.id])] == [c.id]
+
+        StatsDbService(db_session).rebuild()
+        assert StatsService(db_session).check() == []
@@ -0,0 +1,198 @@
+import pytest
+from sqlalchemy import select
+
+from corner_pocket_backend.models import Change, ChangeEntity, ChangeOp, Game, GameType, User
+from corner_pocket_backend.services.matches import MatchesDbService
+from corner_pocket_backend.services.sync import SyncDbService, mark_unstamped
+
+
+def new_match(svc: MatchesDbService, creator: User, opponent: User, race_to: int = 5):
+    return svc.add_match(
+        user_id=creator.id, opponent_id=opponent.id, game_type=GameType.NINE_BALL, race_to=race_to
+    )
+
+
+class TestChangesSince:
+    def test_first_sync_returns_current_state(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = new_match(svc, a, b, race_to=1)
+        game = svc.add_game(m.id, a.id, b.id, GameType.NINE_BALL, a.id)  # wins the race
+        db_session.commit()
+
+        page = SyncDbService(db_session).changes_since(user_id=b.id)
+
+        assert [(s.id, s.status.value, s.creator_score) for s in page.matches] == [
+            (m.id, "SUBMITTED", 1)
+        ]
+        assert [g.id for g in page.games] == [game.id]
+        assert [(ap.match_id, ap.approver_user_id) for ap in page.approvals] == [(m.id, b.id)]
+        assert page.deleted == []
+        assert not page.has_more
+        assert page.next_since == db_session.query(Change).count()
+
+    def test_incremental_sync_returns_only_new_changes_and_tombstones(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = new_match(svc, a, b)
+        kept = svc.add_game(m.id, a.id, b.id, GameType.NINE_BALL, a.id)
+        dropped = svc.add_game(m.id, b.id, a.id, GameType.NINE_BALL, a.id)
+        empty = new_match(svc, a, b)
+        db_session.commit()
+        cursor = SyncDbService(db_session).changes_since(user_id=a.id).next_since
+
+        svc.delete_game(m.id, a.id, dropped.id)
+        svc.delete_match(a.id, empty.id)
+        db_session.commit()
+        page = SyncDbService(db_session).changes_since(user_id=a.id, since=cursor)
+
+        assert [(s.id, s.opponent_score) for s in page.matches] == [(m.id, 0)]
+        assert page.games == []
+        assert {(t.entity, t.id) for t in page.deleted} == {
+            ("GAME", dropped.id),
+            ("MATCH", empty.id),
+        }
+        assert kept.id not in {t.id for t in page.deleted}
+        again = SyncDbService(db_session).changes_since(user_id=a.id, since=page.next_since)
+        assert (again.matches, again.deleted, again.next_since) == ([], [], page.next_since)
+
+    def test_deleted_match_tombstones_its_games_and_approval(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = new_match(svc, a, b, race_to=2)
+        games = [svc.add_game(m.id, a.id, b.id, GameType.NINE_BALL, a.id) for _ in range(2)]
+        approval_id = m.approval.id
+        db_session.commit()
+        cursor = SyncDbService(db_session).changes_since(user_id=b.id).next_since
+
+        svc.delete_match(a.id, m.id)
+        db_session.commit()
+        page = SyncDbService(db_session).changes_since(user_id=b.id, since=cursor)
+
+        assert page.matches == page.games == page.approvals == []
+        assert {(t.entity, t.id) for t in page.deleted} == {
+            ("MATCH", m.id),
+            ("APPROVAL", approval_id),
+            *(("GAME", g.id) for g in games),
+        }
+
+    def test_feed_is_per_user(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, c, _ = users
+        ab = new_match(svc, a, b)
+        bc = new_match(svc, b, c)
+        db_session.commit()
+
+        sync = SyncDbService(db_session)
+        assert [s.id for s in sync.changes_since(user_id=a.id).matches] == [ab.id]
+        assert [s.id for s in sync.changes_since(user_id=b.id).matches] == [ab.id, bc.id]
+        assert [s.id for s in sync.changes_since(user_id=c.id).matches] == [bc.id]
+
+    def test_pages_by_limit(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        ids = [new_match(svc, a, b).id for _ in range(5)]
+        db_session.commit()
+
+        sync = SyncDbService(db_session)
+        seen: list[int] = []
+        since = 0
+        while True:
+            page = sync.changes_since(user_id=b.id, since=since, limit=2)
+            seen += [s.id for s in page.matches]
+            since = page.next_since
+            if not page.has_more:
+                break
+        assert seen == ids
+
+    def test_work_scales_with_changes_not_history(self, db_session, users, count_queries):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        for _ in range(20):
+            m = new_match(svc, a, b, race_to=50)
+            svc.add_games(
+                a.id,
+                m.id,
+                [
+                    Game(winner_user_id=a.id, loser_user_id=b.id, game_type=GameType.NINE_BALL)
+                    for _ in range(5)
+                ],
+            )
+        db_session.commit()
+        sync = SyncDbService(db_session)
+        cursor = sync.changes_since(user_id=a.id, limit=1000).next_since
+
+        game = svc.add_game(m.id, b.id, a.id, GameType.NINE_BALL, b.id)
+        db_session.commit()
+        user_id, game_id, match_id = a.id, game.id, m.id
+        with count_queries() as statements:
+            page = sync.changes_since(user_id=user_id, since=cursor)
+
+        assert [g.id for g in page.games] == [game_id]
+        assert [s.id for s in page.matches] == [match_id]
+        assert len(statements) == 3  # feed entries, matches, games
+
+    def test_uncommitted_changes_are_not_served(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        m = new_match(svc, a, b)
+        db_session.flush()
+        sync = SyncDbService(db_session)
+
+        assert (
+            sync.changes_since(user_id=a.id).matches,
+            sync.changes_since(user_id=a.id).next_since,
+        ) == ([], 0)
+        db_session.commit()
+        assert [s.id for s in sync.changes_since(user_id=a.id).matches] == [m.id]
+
+    def test_cursor_follows_commit_order_not_insert_order(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        served = new_match(svc, a, b)
+        db_session.commit()
+        sync = SyncDbService(db_session)
+        cursor = sync.changes_since(user_id=a.id).next_since
+
+        # An entry inserted (seq 0) before the served ones but committed after them.
+        late = new_match(svc, a, b)
+        db_session.add(
+            Change(
+                seq=0,
+                entity=ChangeEntity.MATCH,
+                entity_id=late.id,
+                op=ChangeOp.UPSERT,
+                match_id=late.id,
+                creator_id=a.id,
+                opponent_id=b.id,
+            )
+        )
+        mark_unstamped(db_session)
+        db_session.commit()
+
+        page = sync.changes_since(user_id=a.id, since=cursor)
+        assert [s.id for s in page.matches] == [late.id]
+        assert served.id not in [s.id for s in page.matches]
+        positions = db_session.scalars(select(Change.position).order_by(Change.position)).all()
+        assert positions == list(range(1, len(positions) + 1))
+
+    def test_rolled_back_savepoint_takes_no_positions(self, db_session, users):
+        svc = MatchesDbService(db_session)
+        a, b, *_ = users
+        savepoint = db_session.begin_nested()
+        new_match(svc, a, b)
+        db_session.flush()
+        savepoint.rollback()
+        kept = new_match(svc, a, b)
+        db_session.commit()
+
+        page = SyncDbService(db_session).changes_since(user_id=a.id)
+        assert [s.id for s in page.matches] == [kept.id]
+        assert page.next_since == db_session.query(Change).count()
+
+    def test_rejects_bad_arguments(self, db_session):
+        sync = SyncDbService(db_session)
+        with pytest.raises(ValueError):
+            sync.changes_since(user_id=1, since=-1)
+        with pytest.raises(ValueError):
+            sync.changes_since(user_id=1, limit=0)
@@ -1,6 +1,6 @@
 import pytest
 
-from corner_pocket_backend.services.users import UsersDbService
+from corner_pocket_backend.services.users import UsersDbService, invalidate_user, user_cache
 from corner_pocket_backend.models import User
 
 
@@ -55,3 +55,105 @@ class TestUsersDbService:
                 display_name="Other",
                 password_hash="not_ashash_lolz",
             )
+
+
+class TestUserCache:
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        user_cache.clear()
+        yield
+        user_cache.clear()
+
+    def test_cached_lookup_skips_database(self, db_session, count_queries):
+        svc = UsersDbService(db=db_session)
+        user = svc.create(
+            email="c@test.com", handle="c", display_name="C", password_hash="not_ashash_lolz"
+        )
+        db_session.commit()
+        user_id = user.id
+        db_session.expunge_all()
+
+        first = svc.get_by_id_cached(user_id)
+        db_session.expunge_all()
+        with count_queries() as statements:
+            second = svc.get_by_id_cached(user_id)
+
+        assert first is not None and second is not None
+        assert statements == []
+        assert second.email == "c@test.com"
+        assert second in db_session  # attached like a loaded row
+        assert user_cache.stats()["hits"] >= 1
+
+    def test_edit_and_delete_invalidate(self, db_session):
+        svc = UsersDbService(db=db_session)
+        user = svc.create(
+            email="d@test.com", handle="d", display_name="D", password_hash="not_ashash_lolz"
+        )
+        db_session.commit()
+        user_id = user.id
+        svc.get_by_id_cached(user_id)
+
+        svc.edit_user(user_id, display_name="Renamed")
+        db_session.commit()
+        db_session.expunge_all()
+        refreshed = svc.get_by_id_cached(user_id)
+        assert refreshed is not None
+        assert refreshed.display_name == "Renamed"
+
+        svc.delete_user(user_id)
+        db_session.commit()
+        assert svc.get_by_id_cached(user_id) is None
+
+    def test_invalidation_waits_for_commit(self, db_session):
+        svc = UsersDbService(db=db_session)
+        user = svc.create(
+            email="e@test.com", handle="e", display_name="E", password_hash="not_ashash_lolz"
+        )
+        db_session.commit()
+        user_id = user.id
+        svc.get_by_id_cached(user_id)
+        stale = user_cache.get(user_id)
+
+        svc.edit_user(user_id, display_name="Renamed")
+        db_session.rollback()
+        assert user_cache.get(user_id) == stale
+
+        svc.edit_user(user_id, display_name="Renamed")
+        # A concurrent lookup that read the old row before the commit.
+        user_cache.set(user_id, stale)
+        db_session.commit()
+        assert user_cache.get(user_id) is None
+
+    def test_password_hash_is_not_cached(self, db_session, count_queries):
+        svc = UsersDbService(db=db_session)
+        user = svc.create(
+            email="f@test.com", handle="f", display_name="F", password_hash="not_ashash_lolz"
+        )
+        db_session.commit()
+        user_id = user.id
+        svc.get_by_id_cached(user_id)
+        db_session.expunge_all()
+
+        assert "password_hash" not in user_cache.get(user_id)
+        cached = svc.get_by_id_cached(user_id)
+        with count_queries() as statements:
+            assert cached.password_hash == "not_ashash_lolz"
+        assert len(statements) == 1  # loaded on demand
+
+    def test_refill_read_before_an_edit_is_not_stored(self, db_session, monkeypatch):
+        svc = UsersDbService(db=db_session)
+        user = svc.create(
+            email="g@test.com", handle="g", display_name="G", password_hash="not_ashash_lolz"
+        )
+        db_session.commit()
+        user_id = user.id
+        read = svc.get_by_id
+
+        def read_then_edit_commits(user_id):
+            row = read(user_id)
+            invalidate_user(user_id)  # another request's edit commits meanwhile
+            return row
+
+        monkeypatch.setattr(svc, "get_by_id", read_then_edit_commits)
+        assert svc.get_by_id_cached(user_id) is not None
+        assert user_cache.get(user_id) is None